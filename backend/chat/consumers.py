@@ -4,6 +4,7 @@ from django.utils import timezone
 from django.utils.timezone import localtime, make_aware, is_naive
 from channels.db import database_sync_to_async
 from db_model.models import User, Project, Message, DirectMessage, DirectMessageRoom
+from users.inbox import notification_group, unread_count
 
 # ── 공용 직렬화 유틸 ─────────────────────────────────────────
 def serialize_message_obj(obj):
@@ -123,4 +124,38 @@ class ChatConsumer(AsyncWebsocketConsumer):
             room=room, 
             content=content,
             created_date=timezone.now()
-        )
\ No newline at end of file
+        )
+
+
+class NotificationConsumer(AsyncWebsocketConsumer):
+    """
+    로그인 사용자 알림 실시간 수신 (헤더 폴링 대체)
+    - 세션의 user_id로 사용자별 그룹(notify_<user_id>)에 참여
+    - 접속 직후 안 읽은 알림 수, 이후 새 알림이 적재될 때마다 항목 전송
+    """
+    async def connect(self):
+        self.user_id = await self.get_session_user_id()
+        if not self.user_id:
+            await self.close()
+            return
+
+        self.group_name = notification_group(self.user_id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+        await self.send(text_data=json.dumps({
+            "type": "unread_count",
+            "unread_count": await database_sync_to_async(unread_count)(self.user_id),
+        }))
+
+    async def disconnect(self, close_code):
+        if getattr(self, "group_name", None):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def notify_push(self, event):
+        # users.inbox에서 보낸 새 알림 항목 전달
+        await self.send(text_data=json.dumps({"type": "notifications", "items": event["items"]}))
+
+    @database_sync_to_async
+    def get_session_user_id(self):
+        session = self.scope.get("session")
+        return session.get("user_id") if session is not None else None
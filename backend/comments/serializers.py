@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from db_model.models import Comment, File, Task
+from db_model.sparse import SparseFieldsMixin
 
-class CommentSerializer(serializers.ModelSerializer):
+
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SerializerMethodField()
     # 🔹 write 용 FK 필드
     task   = serializers.PrimaryKeyRelatedField(
@@ -15,11 +17,12 @@ class CommentSerializer(serializers.ModelSerializer):
             'task',      # ← write 시 사용
             'user', 'author'
         ]
+        sparse_requires = {'author': ['user']}
 
     def get_author(self, obj):
         return obj.user.name if obj.user else "알 수 없음"
 
-class FileSerializer(serializers.ModelSerializer):
+class FileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SerializerMethodField()
 
     task = serializers.PrimaryKeyRelatedField(
@@ -28,7 +31,22 @@ class FileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = File
-        fields = ['file_id', 'file_name', 'task', 'user', 'created_date', 'author']
+        fields = ['file_id', 'file_name', 'task', 'user', 'created_date', 'author', 'content_hash', 'size', 'variants']
+        read_only_fields = ['variants']
+        sparse_requires = {'author': ['user']}
 
     def get_author(self, obj):
         return obj.user.name if obj.user else "알 수 없음"
+
+    def validate_content_hash(self, value):
+        if not value:
+            return None
+        value = value.strip().lower()
+        if len(value) != 64 or any(c not in '0123456789abcdef' for c in value):
+            raise serializers.ValidationError("SHA-256 hex(64자)여야 합니다.")
+        return value
+
+    def validate(self, attrs):
+        if attrs.get('content_hash') and attrs.get('size') is None:
+            raise serializers.ValidationError({"size": "content_hash를 보낼 때는 size가 필요합니다."})
+        return attrs
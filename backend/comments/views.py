@@ -5,6 +5,7 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
 from db_model.models import Comment
+from db_model.sparse import sparse_queryset
 from .serializers import CommentSerializer
 from log.views import create_log
 
@@ -21,7 +22,9 @@ def comment_list_or_create(request):
             if task_id:
                 queryset = queryset.filter(task_id=task_id)
             
-            serializer = CommentSerializer(queryset, many=True)
+            # ?fields= / ?omit= 지원
+            queryset = sparse_queryset(queryset, CommentSerializer, request.query_params)
+            serializer = CommentSerializer(queryset, many=True, context={'request': request})
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         elif request.method == 'POST':
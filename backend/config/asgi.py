@@ -24,3 +24,7 @@ application = ProtocolTypeRouter({
     ),
 })
 
+# 업무 마감 임박(D-3) 알림 스케줄러 (서버 프로세스에서만 실행, DEADLINE_REMINDERS=0이면 비활성화)
+from users.reminders import start_deadline_reminders  # noqa: E402
+start_deadline_reminders()
+
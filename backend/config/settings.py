@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     'gptapi',
     'schedule',
     'tasks',
+    'users',
     'db_model',
     'comments',
     'file',
@@ -118,6 +119,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # CORS 및 보안 설정 (React 연동)
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOWED_ORIGINS = ['http://localhost:3000']
+CORS_EXPOSE_HEADERS = ['ETag']  # 분할 업로드 조각 응답의 ETag를 브라우저에서 읽기 위함
 CSRF_TRUSTED_ORIGINS = ['http://localhost:3000']
 
 # 세션 및 쿠키 설정
@@ -128,6 +130,25 @@ SESSION_COOKIE_HTTPONLY = True
 SESSION_SAVE_EVERY_REQUEST = True
 SESSION_COOKIE_AGE = 86400  # 1일 유지
 
+# 캐시: REDIS_URL이 있으면 모든 워커(runserver/daphne/관리 명령)가 공유하는 Redis 사용
+# 버전 키 기반 무효화(대시보드 등)는 공유 캐시에서만 다른 프로세스에 전달되므로,
+# 프로세스별 LocMem 캐시에서는 대시보드·업무량 히트맵 응답 캐시를 끔 (users/cache.py, tasks/views.py)
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+DASHBOARD_CACHE = bool(REDIS_URL)
+
 # Channels 레이어 (로컬 개발용 인메모리)
 CHANNEL_LAYERS = {
     "default": {
@@ -142,4 +163,15 @@ REST_FRAMEWORK = {
 }
 
 # OpenAI API Key
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
\ No newline at end of file
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# AWS S3 (첨부 파일 / 프로필 이미지)
+AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
+AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
+AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME", "ap-northeast-2")
+AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME", "infloop-aiservice")
+AWS_S3_CUSTOM_DOMAIN = os.getenv("AWS_S3_CUSTOM_DOMAIN", f"{AWS_STORAGE_BUCKET_NAME}.s3.{AWS_S3_REGION_NAME}.amazonaws.com")
+
+# 첨부 파일 저장소: s3 | local (로컬은 오프라인 개발/테스트용, file/storage.py)
+FILE_STORAGE_BACKEND = os.getenv("FILE_STORAGE_BACKEND", "s3")
+FILE_STORAGE_ROOT = os.getenv("FILE_STORAGE_ROOT", os.path.join(MEDIA_ROOT, 'files'))
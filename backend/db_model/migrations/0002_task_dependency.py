@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-19 20:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDependency',
+            fields=[
+                ('dependency_id', models.AutoField(primary_key=True, serialize=False)),
+                ('lag_days', models.IntegerField(default=0)),
+                ('predecessor', models.ForeignKey(db_column='predecessor_id', on_delete=django.db.models.deletion.CASCADE, related_name='successor_links', to='db_model.task')),
+                ('successor', models.ForeignKey(db_column='successor_id', on_delete=django.db.models.deletion.CASCADE, related_name='predecessor_links', to='db_model.task')),
+            ],
+            options={
+                'db_table': 'TaskDependency',
+                'unique_together': {('predecessor', 'successor')},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-19 20:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0002_task_dependency'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDailySnapshot',
+            fields=[
+                ('snapshot_id', models.AutoField(primary_key=True, serialize=False)),
+                ('snapshot_date', models.DateField()),
+                ('total_count', models.IntegerField(default=0)),
+                ('requested_count', models.IntegerField(default=0)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('feedback_count', models.IntegerField(default=0)),
+                ('done_count', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(db_column='project_id', on_delete=django.db.models.deletion.CASCADE, related_name='daily_snapshots', to='db_model.project')),
+            ],
+            options={
+                'db_table': 'ProjectDailySnapshot',
+                'unique_together': {('project', 'snapshot_date')},
+            },
+        ),
+    ]
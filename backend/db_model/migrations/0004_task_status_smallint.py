@@ -0,0 +1,50 @@
+# Generated by Django 5.1.6 on 2026-10-19 20:53
+
+from django.db import migrations, models
+
+# 기존 문자열 상태값 → 정수 코드 (숫자 문자열은 그대로, 라벨/영문 표기는 매핑, 나머지는 요청)
+LEGACY_STATUS = {
+    '요청': '0', 'To Do': '0', 'todo': '0',
+    '진행': '1', '진행중': '1', 'In Progress': '1',
+    '피드백': '2', '이슈/피드백': '2', 'Feedback': '2',
+    '완료': '3', 'Done': '3',
+    '보류': '4', 'Hold': '4',
+}
+VALID_CODES = {'0', '1', '2', '3', '4'}
+
+
+def normalize_status(apps, schema_editor):
+    Task = apps.get_model('db_model', 'Task')
+    Task.objects.filter(status__isnull=True).update(status='0')
+    for value in Task.objects.exclude(status__in=VALID_CODES).values_list('status', flat=True).distinct():
+        code = value.strip()
+        code = code if code in VALID_CODES else LEGACY_STATUS.get(code, '0')
+        Task.objects.filter(status=value).update(status=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0003_project_daily_snapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_status, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, '요청'), (1, '진행'), (2, '피드백'), (3, '완료'), (4, '보류')], default=0),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status'], name='idx_task_project_status'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'end_date'], name='idx_task_status_end'),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', [0, 1, 2, 3, 4])), name='ck_task_status'),
+        ),
+    ]
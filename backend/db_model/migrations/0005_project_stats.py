@@ -0,0 +1,58 @@
+# Generated by Django 5.1.6 on 2026-10-19 20:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Q
+
+# 0 요청, 1 진행, 2 피드백, 3 완료, 4 보류
+STATUS_FIELDS = {
+    0: 'requested_count', 1: 'in_progress_count', 2: 'feedback_count',
+    3: 'done_count', 4: 'on_hold_count',
+}
+
+
+def backfill_project_stats(apps, schema_editor):
+    Task = apps.get_model('db_model', 'Task')
+    ProjectStats = apps.get_model('db_model', 'ProjectStats')
+    aggregates = {f: Count('task_id', filter=Q(status=s)) for s, f in STATUS_FIELDS.items()}
+    rows = (
+        Task.objects
+        .filter(project_id__isnull=False)
+        .values('project_id')
+        .annotate(
+            total_count=Count('task_id'),
+            next_deadline=Min('end_date', filter=~Q(status=3)),
+            last_deadline=Max('end_date'),
+            **aggregates,
+        )
+    )
+    ProjectStats.objects.bulk_create([ProjectStats(**row) for row in rows], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0004_task_status_smallint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('project', models.OneToOneField(db_column='project_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='db_model.project')),
+                ('total_count', models.IntegerField(default=0)),
+                ('requested_count', models.IntegerField(default=0)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('feedback_count', models.IntegerField(default=0)),
+                ('done_count', models.IntegerField(default=0)),
+                ('on_hold_count', models.IntegerField(default=0)),
+                ('next_deadline', models.DateTimeField(blank=True, null=True)),
+                ('last_deadline', models.DateTimeField(blank=True, null=True)),
+                ('last_activity', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'ProjectStats',
+            },
+        ),
+        migrations.RunPython(backfill_project_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:04
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0005_project_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('notification_id', models.AutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('urgent_task', '긴급 업무'), ('comment', '댓글'), ('dm', 'DM'), ('group_message', '그룹 메시지'), ('mention', '멘션')], max_length=20)),
+                ('source_id', models.IntegerField(blank=True, null=True)),
+                ('content', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('actor', models.ForeignKey(blank=True, db_column='actor_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='db_model.user')),
+                ('project', models.ForeignKey(blank=True, db_column='project_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.project')),
+                ('room', models.ForeignKey(blank=True, db_column='room_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.directmessageroom')),
+                ('task', models.ForeignKey(blank=True, db_column='task_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.task')),
+                ('user', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='db_model.user')),
+            ],
+            options={
+                'db_table': 'Notification',
+                'indexes': [models.Index(fields=['user', 'created_at'], name='idx_notification_user_created'), models.Index(fields=['user', 'read_at'], name='idx_notification_user_read')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:09
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0006_notification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Mention',
+            fields=[
+                ('mention_id', models.AutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('author', models.ForeignKey(blank=True, db_column='author_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='db_model.user')),
+                ('comment', models.ForeignKey(blank=True, db_column='comment_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.comment')),
+                ('mentioned_user', models.ForeignKey(db_column='mentioned_user_id', on_delete=django.db.models.deletion.CASCADE, related_name='mentions', to='db_model.user')),
+                ('message', models.ForeignKey(blank=True, db_column='message_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.message')),
+                ('project', models.ForeignKey(blank=True, db_column='project_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.project')),
+                ('task', models.ForeignKey(blank=True, db_column='task_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.task')),
+            ],
+            options={
+                'db_table': 'Mention',
+                'indexes': [models.Index(fields=['mentioned_user', 'created_at'], name='idx_mention_user_created')],
+            },
+        ),
+    ]
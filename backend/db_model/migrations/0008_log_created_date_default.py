@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:14
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0007_mention'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='log',
+            name='created_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:19
+
+import django.db.models.deletion
+import re
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# 업무 삭제 로그: "[task_id=123] 업무명 삭제됨"
+TASK_SNAPSHOT = re.compile(r'^\[task_id=(\d+)\]\s*(.+?)\s*(업무가\s*삭제됨|삭제됨|업무\s*생성)?$')
+# 프로젝트 복제 로그: "[project_id=1] → [project_id=2] ..."
+CLONED_PROJECT = re.compile(r'→ \[project_id=(\d+)\]')
+
+
+def backfill_log_project(apps, schema_editor):
+    Log = apps.get_model('db_model', 'Log')
+    Task = apps.get_model('db_model', 'Task')
+    TaskManager = apps.get_model('db_model', 'TaskManager')
+    Project = apps.get_model('db_model', 'Project')
+
+    # 1) 업무가 남아 있는 로그: 업무의 프로젝트 / 현재 업무명
+    task = Task.objects.filter(pk=OuterRef('task_id'))
+    manager = TaskManager.objects.filter(task_id=OuterRef('task_id'))
+    Log.objects.filter(task_id__isnull=False).update(
+        project_id=Coalesce(Subquery(task.values('project_id')[:1]), Subquery(manager.values('project_id')[:1])),
+        task_name=Subquery(task.values('task_name')[:1]),
+    )
+
+    # 2) 업무 없는 로그: content 스냅샷에서 업무명 / 프로젝트 추출
+    rows = Log.objects.filter(task_id__isnull=True).only('log_id', 'content')
+    changed = []
+    for log in rows.iterator(chunk_size=2000):
+        content = log.content or ''
+        snapshot = TASK_SNAPSHOT.match(content)
+        cloned = CLONED_PROJECT.search(content)
+        if snapshot:
+            task_id = int(snapshot.group(1))
+            log.task_name = snapshot.group(2).strip()
+            log.project_id = (
+                Task.objects.filter(pk=task_id).values_list('project_id', flat=True).first()
+                or TaskManager.objects.filter(task_id=task_id).values_list('project_id', flat=True).first()
+            )
+        elif cloned and Project.objects.filter(pk=int(cloned.group(1))).exists():
+            log.project_id = int(cloned.group(1))
+        else:
+            continue
+        changed.append(log)
+    Log.objects.bulk_update(changed, ['project_id', 'task_name'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0008_log_created_date_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='project',
+            field=models.ForeignKey(db_column='project_id', null=True, on_delete=django.db.models.deletion.SET_NULL, to='db_model.project'),
+        ),
+        migrations.AddField(
+            model_name='log',
+            name='task_name',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['project', 'created_date'], name='idx_log_project_created'),
+        ),
+        migrations.RunPython(backfill_log_project, migrations.RunPython.noop),
+    ]
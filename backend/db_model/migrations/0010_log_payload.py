@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0009_log_project'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='payload',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
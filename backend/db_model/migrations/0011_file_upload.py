@@ -0,0 +1,46 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:37
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0010_log_payload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileUpload',
+            fields=[
+                ('upload_id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('key', models.CharField(max_length=500)),
+                ('file_name', models.CharField(max_length=255)),
+                ('content_type', models.CharField(blank=True, default='', max_length=255)),
+                ('size', models.BigIntegerField(blank=True, null=True)),
+                ('part_size', models.IntegerField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('task', models.ForeignKey(blank=True, db_column='task_id', null=True, on_delete=django.db.models.deletion.CASCADE, to='db_model.task')),
+                ('user', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, to='db_model.user')),
+            ],
+            options={
+                'db_table': 'FileUpload',
+            },
+        ),
+        migrations.CreateModel(
+            name='FileUploadPart',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('part_number', models.IntegerField()),
+                ('etag', models.CharField(max_length=255)),
+                ('size', models.BigIntegerField(blank=True, null=True)),
+                ('upload', models.ForeignKey(db_column='upload_id', on_delete=django.db.models.deletion.CASCADE, related_name='parts', to='db_model.fileupload')),
+            ],
+            options={
+                'db_table': 'FileUploadPart',
+                'unique_together': {('upload', 'part_number')},
+            },
+        ),
+    ]
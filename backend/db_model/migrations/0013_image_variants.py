@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0012_file_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='file',
+            name='variants',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
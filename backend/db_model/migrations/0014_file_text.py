@@ -0,0 +1,40 @@
+# Generated by Django 5.1.6 on 2026-10-19 22:04
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def create_fulltext_index(apps, schema_editor):
+    # MySQL: 한국어 부분 검색을 위해 ngram 파서 FULLTEXT 인덱스 (다른 DB는 LIKE 검색)
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            "CREATE FULLTEXT INDEX ft_file_text_content ON FileText (content) WITH PARSER ngram"
+        )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute("DROP INDEX ft_file_text_content ON FileText")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0013_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileText',
+            fields=[
+                ('file', models.OneToOneField(db_column='file_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='text', serialize=False, to='db_model.file')),
+                ('content', models.TextField()),
+                ('extracted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'FileText',
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.6 on 2026-10-19 23:10
+
+from django.db import migrations, models
+
+
+def backfill_urgent_dedup_key(apps, schema_editor):
+    # 기존 마감 임박 알림: 마감일(content)을 dedup_key로 복사, 이미 중복 적재된 행은 가장 먼저 적재된 1건만 남김
+    Notification = apps.get_model('db_model', 'Notification')
+    seen = set()
+    duplicate_ids = []
+    rows = (
+        Notification.objects
+        .filter(kind='urgent_task')
+        .order_by('notification_id')
+        .values_list('notification_id', 'user_id', 'task_id', 'content')
+    )
+    for notification_id, user_id, task_id, content in rows.iterator(chunk_size=2000):
+        key = (user_id, task_id, content)
+        if key in seen:
+            duplicate_ids.append(notification_id)
+        else:
+            seen.add(key)
+    for i in range(0, len(duplicate_ids), 1000):
+        Notification.objects.filter(notification_id__in=duplicate_ids[i:i + 1000]).delete()
+    Notification.objects.filter(kind='urgent_task').update(dedup_key=models.F('content'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_model', '0014_file_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='dedup_key',
+            field=models.CharField(blank=True, max_length=40, null=True),
+        ),
+        migrations.RunPython(backfill_urgent_dedup_key, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('user', 'kind', 'task', 'dedup_key'), name='uq_notification_dedup'),
+        ),
+    ]
@@ -25,6 +25,7 @@ class User(models.Model):
     password = models.CharField(max_length=20)
     skill = models.CharField(max_length=255, blank=True, null=True)
     profile_image = models.CharField(max_length=500, blank=True, null=True)
+    profile_image_variants = models.JSONField(null=True, blank=True)  # {"thumb.webp": URL, ...} (file/derivatives.py)
 
     # 기존 DB 구조 유지를 위한 과목 컬럼 (최대 6개)
     subject1 = models.ForeignKey(Subject, on_delete=models.SET_NULL, null=True, blank=True, db_column='subject1', related_name='users_subject1')
@@ -95,12 +96,21 @@ class FavoriteProject(models.Model):
 # 3. 프로젝트 핵심 기능 (Task, Schedule, File, Post)
 # ==============================================================================
 
+class TaskStatus(models.IntegerChoices):
+    """업무 상태 코드"""
+    REQUESTED = 0, "요청"
+    IN_PROGRESS = 1, "진행"
+    FEEDBACK = 2, "피드백"
+    DONE = 3, "완료"
+    ON_HOLD = 4, "보류"
+
+
 class Task(models.Model):
     """프로젝트 업무(Task) 및 칸반 보드 아이템"""
     task_id = models.AutoField(primary_key=True)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, db_column="project_id", null=True, blank=True)
     task_name = models.CharField(max_length=500, null=True, blank=True)
-    status = models.CharField(max_length=50, null=True, blank=True)  # To Do, In Progress, Done 등
+    status = models.PositiveSmallIntegerField(choices=TaskStatus.choices, default=TaskStatus.REQUESTED)
     start_date = models.DateTimeField(default=timezone.now)
     end_date = models.DateTimeField(default=timezone.now)
     created_date = models.DateTimeField(default=timezone.now)
@@ -112,6 +122,13 @@ class Task(models.Model):
 
     class Meta:
         db_table = "Task"
+        constraints = [
+            models.CheckConstraint(condition=models.Q(status__in=TaskStatus.values), name='ck_task_status'),
+        ]
+        indexes = [
+            models.Index(fields=['project', 'status'], name='idx_task_project_status'),
+            models.Index(fields=['status', 'end_date'], name='idx_task_status_end'),
+        ]
 
 
 class TaskManager(models.Model):
@@ -126,6 +143,61 @@ class TaskManager(models.Model):
         unique_together = (('user', 'project', 'task'),)
 
 
+class TaskDependency(models.Model):
+    """업무 간 선후행 관계 (Finish-to-Start: 선행 업무 종료 + lag 이후 후행 업무 시작)"""
+    dependency_id = models.AutoField(primary_key=True)
+    predecessor = models.ForeignKey(Task, on_delete=models.CASCADE, db_column="predecessor_id", related_name="successor_links")
+    successor = models.ForeignKey(Task, on_delete=models.CASCADE, db_column="successor_id", related_name="predecessor_links")
+    lag_days = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "TaskDependency"
+        unique_together = (("predecessor", "successor"),)
+
+
+class ProjectDailySnapshot(models.Model):
+    """프로젝트별 일자 업무 상태 집계 (번다운/속도 차트용)"""
+    snapshot_id = models.AutoField(primary_key=True)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, db_column="project_id", related_name="daily_snapshots")
+    snapshot_date = models.DateField()
+    total_count = models.IntegerField(default=0)
+    requested_count = models.IntegerField(default=0)    # 0: 요청
+    in_progress_count = models.IntegerField(default=0)  # 1: 진행
+    feedback_count = models.IntegerField(default=0)     # 2: 피드백
+    done_count = models.IntegerField(default=0)         # 3: 완료
+
+    class Meta:
+        db_table = "ProjectDailySnapshot"
+        unique_together = (("project", "snapshot_date"),)
+
+
+class ProjectStats(models.Model):
+    """프로젝트별 현재 업무 집계 (대시보드 카드·진행률용, 업무 변경 시 갱신)"""
+    project = models.OneToOneField(Project, on_delete=models.CASCADE, primary_key=True, db_column="project_id", related_name="stats")
+    total_count = models.IntegerField(default=0)
+    requested_count = models.IntegerField(default=0)    # 0: 요청
+    in_progress_count = models.IntegerField(default=0)  # 1: 진행
+    feedback_count = models.IntegerField(default=0)     # 2: 피드백
+    done_count = models.IntegerField(default=0)         # 3: 완료
+    on_hold_count = models.IntegerField(default=0)      # 4: 보류
+    next_deadline = models.DateTimeField(null=True, blank=True)  # 미완료 업무 중 가장 이른 종료일
+    last_deadline = models.DateTimeField(null=True, blank=True)  # 전체 업무 중 가장 늦은 종료일
+    last_activity = models.DateTimeField(null=True, blank=True)  # 마지막 업무 변경 시각
+
+    class Meta:
+        db_table = "ProjectStats"
+
+    @property
+    def active_count(self):
+        """진행 중(요청·진행·피드백) 업무 수"""
+        return self.requested_count + self.in_progress_count + self.feedback_count
+
+    @property
+    def progress(self):
+        """완료율(%)"""
+        return round(self.done_count * 100 / self.total_count) if self.total_count else 0
+
+
 class Schedule(models.Model):
     """개인 및 프로젝트 일정 (간트 차트용)"""
     schedule_id = models.AutoField(primary_key=True)
@@ -175,9 +247,55 @@ class File(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, db_column='project_id', null=True, blank=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, db_column="user_id")
     created_date = models.DateTimeField(db_column='created_date', auto_now_add=True)
+    # 내용 주소 저장 (file/dedup.py): 같은 내용의 파일은 file_path가 같은 blob을 공유
+    content_hash = models.CharField(max_length=64, null=True, blank=True)  # SHA-256 hex
+    size = models.BigIntegerField(null=True, blank=True)
+    variants = models.JSONField(null=True, blank=True)  # 이미지 파생본 {"thumb.webp": 키, ...}
 
     class Meta:
         db_table = 'File'
+        indexes = [
+            models.Index(fields=['content_hash'], name='idx_file_content_hash'),
+        ]
+
+
+class FileText(models.Model):
+    """첨부 파일에서 추출한 본문 (첨부 검색용, MySQL에서는 FULLTEXT ngram 인덱스)"""
+    file = models.OneToOneField(File, on_delete=models.CASCADE, primary_key=True, db_column='file_id', related_name='text')
+    content = models.TextField()
+    extracted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'FileText'
+
+
+class FileUpload(models.Model):
+    """진행 중인 분할(multipart) 업로드 (완료 시 File 생성 후 삭제)"""
+    upload_id = models.CharField(max_length=255, primary_key=True)  # S3 UploadId 또는 로컬 업로드 ID
+    key = models.CharField(max_length=500)
+    file_name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255, blank=True, default='')
+    size = models.BigIntegerField(null=True, blank=True)
+    content_hash = models.CharField(max_length=64, null=True, blank=True)
+    part_size = models.IntegerField()
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, db_column='task_id', null=True, blank=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_column="user_id")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'FileUpload'
+
+
+class FileUploadPart(models.Model):
+    """분할 업로드에서 업로드가 끝난 조각 (재개 시 남은 조각만 전송)"""
+    upload = models.ForeignKey(FileUpload, on_delete=models.CASCADE, db_column='upload_id', related_name='parts')
+    part_number = models.IntegerField()
+    etag = models.CharField(max_length=255)
+    size = models.BigIntegerField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'FileUploadPart'
+        unique_together = (("upload", "part_number"),)
 
 
 # ==============================================================================
@@ -231,6 +349,60 @@ class Comment(models.Model):
         db_table = 'Comment'
 
 
+class NotificationKind(models.TextChoices):
+    """알림 종류 (프론트엔드 알림 type 값과 동일)"""
+    URGENT_TASK = 'urgent_task', '긴급 업무'
+    COMMENT = 'comment', '댓글'
+    DM = 'dm', 'DM'
+    GROUP_MESSAGE = 'group_message', '그룹 메시지'
+    MENTION = 'mention', '멘션'
+
+
+class Notification(models.Model):
+    """사용자 알림함 (댓글·DM·채팅·멘션·마감 임박 발생 시 수신자별로 저장)"""
+    notification_id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_column="user_id", related_name="notifications")
+    kind = models.CharField(max_length=20, choices=NotificationKind.choices)
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column="actor_id", related_name="+")
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True, blank=True, db_column="project_id")
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, null=True, blank=True, db_column="task_id")
+    room = models.ForeignKey(DirectMessageRoom, on_delete=models.CASCADE, null=True, blank=True, db_column="room_id")
+    source_id = models.IntegerField(null=True, blank=True)  # 원본 댓글/메시지 ID (업무 알림은 task_id)
+    content = models.TextField(blank=True, default='')
+    # 한 번만 적재해야 하는 알림의 중복 방지 키 (마감 임박: 마감일) — TEXT인 content는 MySQL 유니크 인덱스에 쓸 수 없음
+    dedup_key = models.CharField(max_length=40, null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "Notification"
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'kind', 'task', 'dedup_key'], name='uq_notification_dedup'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='idx_notification_user_created'),
+            models.Index(fields=['user', 'read_at'], name='idx_notification_user_read'),
+        ]
+
+
+class Mention(models.Model):
+    """메시지·댓글의 @멘션 (작성 시점에 추출하여 저장)"""
+    mention_id = models.AutoField(primary_key=True)
+    mentioned_user = models.ForeignKey(User, on_delete=models.CASCADE, db_column="mentioned_user_id", related_name="mentions")
+    author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column="author_id", related_name="+")
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True, blank=True, db_column="project_id")
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, null=True, blank=True, db_column="task_id")
+    message = models.ForeignKey(Message, on_delete=models.CASCADE, null=True, blank=True, db_column="message_id")
+    comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True, db_column="comment_id")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "Mention"
+        indexes = [
+            models.Index(fields=['mentioned_user', 'created_at'], name='idx_mention_user_created'),
+        ]
+
+
 # ==============================================================================
 # 5. 로깅 및 AI 기능 (Log, Minutes)
 # ==============================================================================
@@ -238,15 +410,23 @@ class Comment(models.Model):
 class Log(models.Model):
     """시스템 활동 로그 (업무 생성, 수정, 회의록 생성 등)"""
     log_id = models.AutoField(primary_key=True)
-    created_date = models.DateTimeField(auto_now_add=True)
+    created_date = models.DateTimeField(default=timezone.now)  # 버퍼 저장 시에도 발생 시각 유지
     action = models.CharField(max_length=50)
     content = models.TextField()
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, db_column='user_id')
     task = models.ForeignKey(Task, on_delete=models.SET_NULL, null=True, db_column='task_id')
     comment = models.ForeignKey(Comment, on_delete=models.SET_NULL, null=True, db_column='comment_id')
+    # 업무가 삭제되어도 프로젝트 피드에 남도록 기록 시점의 프로젝트/업무명 보관
+    project = models.ForeignKey(Project, on_delete=models.SET_NULL, null=True, db_column='project_id')
+    task_name = models.CharField(max_length=500, null=True, blank=True)
+    # 자동 로그 묶음 요약 행의 상세 (log/compaction.py), 일반 로그는 NULL
+    payload = models.JSONField(null=True, blank=True)
 
     class Meta:
         db_table = 'Log'
+        indexes = [
+            models.Index(fields=['project', 'created_date'], name='idx_log_project_created'),
+        ]
 
 
 class Minutes(models.Model):
@@ -0,0 +1,70 @@
+"""
+응답 필드 선택(sparse fieldsets) 공용 유틸 - 업무/댓글/파일 API에서 사용
+- ?fields=a,b : 지정한 필드만 응답
+- ?omit=c,d   : 지정한 필드 제외
+"""
+from django.core.exceptions import FieldDoesNotExist
+
+
+def parse_sparse_params(query_params):
+    """?fields=a,b / ?omit=c,d → (set 또는 None, set)"""
+    def split(name):
+        return {f.strip() for f in query_params.get(name, '').split(',') if f.strip()}
+    fields = split('fields')
+    return (fields or None), split('omit')
+
+
+class SparseFieldsMixin:
+    """
+    응답 필드 선택 (sparse fieldsets)
+    - 생성자 인자 fields / omit, 없으면 GET 요청의 ?fields= / ?omit= 사용
+    - Meta.sparse_requires: SerializerMethodField 등이 필요로 하는 모델 필드
+      (sparse_queryset에서 only()/defer() 계산에 사용)
+    """
+    def __init__(self, *args, fields=None, omit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        if fields is None and omit is None and request is not None and request.method == 'GET':
+            fields, omit = parse_sparse_params(request.query_params)
+
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or (omit and name in omit):
+                self.fields.pop(name)
+
+
+def sparse_queryset(queryset, serializer_class, query_params):
+    """
+    ?fields= / ?omit= 에 맞춰 SQL 컬럼도 축소 (only / defer)
+    응답에 남는 필드가 쓰는 모델 필드와 PK는 항상 조회
+    """
+    fields, omit = parse_sparse_params(query_params)
+    if fields is None and not omit:
+        return queryset
+
+    model = queryset.model
+    declared = serializer_class().fields.keys()
+    requires = getattr(serializer_class.Meta, 'sparse_requires', {})
+    # select_related 대상 FK는 지연 로딩할 수 없으므로 항상 포함
+    always = {model._meta.pk.name}
+    if isinstance(queryset.query.select_related, dict):
+        always.update(queryset.query.select_related)
+
+    def model_fields(names):
+        result = set()
+        for name in names:
+            for source in requires.get(name, [name]):
+                try:
+                    field = model._meta.get_field(source)
+                except FieldDoesNotExist:
+                    continue
+                if field.concrete and not field.many_to_many:
+                    result.add(field.name)
+        return result
+
+    if fields is not None:
+        kept = [n for n in declared if n in fields and n not in omit]
+        return queryset.only(*always, *model_fields(kept))
+
+    kept = [n for n in declared if n not in omit]
+    return queryset.defer(*(model_fields(omit) - model_fields(kept) - always))
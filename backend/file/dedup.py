@@ -0,0 +1,97 @@
+"""
+내용 주소(content-addressed) 저장 / 중복 업로드 생략
+- 클라이언트가 SHA-256·크기를 함께 보내면 새 임시 키(uploads/<uuid>)로 업로드받고,
+  서버가 저장된 내용의 해시·크기를 확인한 뒤에만 cas/sha256/<앞 2자>/<다음 2자>/<해시> 키로 옮김
+  (확인되지 않으면 임시 키를 그대로 쓰고 content_hash는 기록하지 않음 → CAS 키에는 검증된 내용만 존재)
+- 같은 내용의 blob이 이미 있으면 업로드 없이 File 행만 추가 (여러 업무에 같은 자료를 올려도 저장은 1번)
+  - 해시만 알아서 다른 프로젝트의 파일을 가져가지 않도록, 요청 사용자가 접근할 수 있는 파일의 blob만 재사용
+- 다운로드 파일명은 File.file_name으로 지정하므로 blob 공유와 무관
+"""
+import os
+import re
+import uuid
+
+from django.core import signing
+from django.db.models import Q
+
+from db_model.models import File
+from .storage import get_storage
+
+HASH_RE = re.compile(r'^[0-9a-f]{64}$')
+EXT_RE = re.compile(r'^\.[A-Za-z0-9]{1,10}$')
+UPLOAD_TOKEN_SALT = "file.dedup.upload"
+UPLOAD_TOKEN_MAX_AGE = 24 * 60 * 60
+
+
+def normalize_hash(value):
+    """SHA-256 hex 정규화 (형식이 아니면 ValueError)"""
+    value = (value or '').strip().lower()
+    if not HASH_RE.match(value):
+        raise ValueError("sha256 must be 64 hex characters")
+    return value
+
+
+def cas_key(content_hash):
+    return f"cas/sha256/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+
+def staging_key(file_name):
+    """검증 전 업로드용 고유 키 (확장자만 유지)"""
+    ext = os.path.splitext(file_name or '')[1]
+    return f"uploads/{uuid.uuid4().hex}{ext if EXT_RE.match(ext) else ''}"
+
+
+def upload_token(key, content_hash, size):
+    """업로드 URL 발급 시 save-meta로 돌려받을 (임시 키, 해시, 크기) 서명"""
+    return signing.dumps({"k": key, "h": content_hash, "s": size}, salt=UPLOAD_TOKEN_SALT)
+
+
+def load_upload_token(token):
+    """→ (key, content_hash, size), 만료/위조 시 signing.BadSignature"""
+    data = signing.loads(token, salt=UPLOAD_TOKEN_SALT, max_age=UPLOAD_TOKEN_MAX_AGE)
+    return data["k"], data["h"], data["s"]
+
+
+def accessible_blob(content_hash, size, user_id):
+    """
+    사용자가 이미 접근할 수 있는 같은 내용의 blob 키 (없으면 None)
+    - 직접 올린 파일 또는 멤버인 프로젝트 업무의 파일만 대상
+    """
+    if not user_id or size is None:
+        return None
+    return (
+        File.objects
+        .filter(content_hash=content_hash, size=size, file_path__isnull=False)
+        .filter(Q(user_id=user_id) | Q(task__project__projectmember__user_id=user_id))
+        .values_list('file_path', flat=True)
+        .first()
+    )
+
+
+def verify_blob(key, content_hash, size):
+    """저장된 blob의 실제 크기·SHA-256이 선언값과 같은지"""
+    storage = get_storage()
+    return size is not None and storage.size(key) == size and storage.sha256(key) == content_hash
+
+
+def adopt_blob(key, content_hash, size):
+    """
+    업로드된 임시 blob 검증 후 최종 키
+
+    - 내용이 같으면: 같은 내용의 blob이 이미 있으면 임시 blob을 지우고 그 키, 없으면 CAS 키로 이동
+    - 다르면 None (호출 측은 임시 키를 그대로 쓰고 content_hash를 기록하지 않음)
+    """
+    if not verify_blob(key, content_hash, size):
+        return None
+    storage = get_storage()
+    existing = (
+        File.objects
+        .filter(content_hash=content_hash, size=size, file_path__isnull=False)
+        .exclude(file_path=key)
+        .values_list('file_path', flat=True)
+        .first()
+    )
+    if existing:
+        storage.delete(key)
+        return existing
+    return storage.move(key, cas_key(content_hash))
@@ -0,0 +1,93 @@
+"""
+이미지 파생본(리사이즈/썸네일) 생성 파이프라인
+- 프로필 이미지 / 이미지 첨부 저장 후 요청과 분리하여 생성
+  - 원본 읽기·파생본 저장(I/O)은 스레드 풀, 리사이즈·인코딩(CPU)은 프로세스 풀 (file/imaging.py)
+- 파생본 키: <원본 키(확장자 제외)>__<크기>.<webp|jpg> → 원본과 같은 위치에 저장
+- 파생본 키/URL은 규칙으로 정해지므로 요청 응답에서 바로 돌려주고, 생성이 끝나면 DB에 기록
+- Pillow가 설치되지 않았으면 비활성화 (원본만 사용)
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+from django.db import close_old_connections
+
+from .imaging import SIZES, FORMATS, render_variants
+from .storage import get_storage
+
+try:
+    import PIL  # noqa: F401
+    ENABLED = True
+except ImportError:
+    ENABLED = False
+
+logger = logging.getLogger(__name__)
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+MAX_SOURCE_BYTES = 20 * 1024 * 1024
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+VARIANTS = [f"{name}.{ext}" for name in SIZES for ext in FORMATS]
+
+_io_pool = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image-io")
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool():
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # 서버 프로세스의 백그라운드 스레드 상태를 물려받지 않도록 spawn
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _process_pool
+
+
+def is_image(file_name):
+    return os.path.splitext(file_name or "")[1].lower() in IMAGE_EXTENSIONS
+
+
+def variant_key(key, variant):
+    """원본 키 + 파생본 이름("thumb.webp") → 저장 키"""
+    return f"{os.path.splitext(key)[0]}__{variant}"
+
+
+def variant_keys(key):
+    return {variant: variant_key(key, variant) for variant in VARIANTS}
+
+
+def _generate(key, data, on_done):
+    try:
+        storage = get_storage()
+        if data is None:
+            data = storage.read(key)
+        if len(data) > MAX_SOURCE_BYTES:
+            return
+        rendered = _get_process_pool().submit(render_variants, data).result()
+        keys = {}
+        for variant, (blob, content_type) in rendered.items():
+            keys[variant] = storage.save(variant_key(key, variant), BytesIO(blob), content_type)
+        if on_done:
+            on_done(keys)
+    except Exception:
+        logger.exception(f"이미지 파생본 생성 실패 (key={key})")
+    finally:
+        close_old_connections()
+
+
+def generate_derivatives(key, data=None, on_done=None):
+    """
+    파생본 생성 예약 (즉시 반환)
+
+    Args:
+        data: 원본 바이트 (없으면 저장소에서 읽음)
+        on_done: 완료 시 호출 on_done({파생본 이름: 키}) (작업 스레드에서 실행)
+    """
+    if not ENABLED:
+        return None
+    return _io_pool.submit(_generate, key, data, on_done)
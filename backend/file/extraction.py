@@ -0,0 +1,90 @@
+"""
+첨부 파일 텍스트 추출 (프로세스 풀 작업자에서 실행)
+- Django를 불러오지 않는 순수 함수만 둠 (spawn된 작업자가 이 모듈만 import)
+- TXT/MD/CSV: 텍스트 디코딩 (UTF-8 → CP949)
+- DOCX/PPTX: ZIP 안의 XML 본문에서 텍스트 노드만 추출 (추가 의존성 없음)
+- PDF: pypdf가 설치된 경우에만
+"""
+import os
+import re
+import zipfile
+from io import BytesIO
+from xml.etree import ElementTree
+
+MAX_TEXT_CHARS = 1_000_000
+
+TEXT_EXTENSIONS = {".txt", ".md", ".csv"}
+SUPPORTED_EXTENSIONS = TEXT_EXTENSIONS | {".docx", ".pptx", ".pdf"}
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+
+def _decode(data):
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="ignore")
+
+
+def _docx_text(data):
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        root = ElementTree.fromstring(zf.read("word/document.xml"))
+    paragraphs = []
+    for p in root.iter(f"{W_NS}p"):
+        text = "".join(t.text or "" for t in p.iter(f"{W_NS}t"))
+        if text:
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+def _slide_number(name):
+    match = re.search(r"(\d+)\.xml$", name)
+    return int(match.group(1)) if match else 0
+
+
+def _pptx_text(data):
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        slides = sorted(
+            (n for n in zf.namelist() if re.match(r"ppt/slides/slide\d+\.xml$", n)),
+            key=_slide_number,
+        )
+        texts = []
+        for name in slides:
+            root = ElementTree.fromstring(zf.read(name))
+            for p in root.iter(f"{A_NS}p"):
+                text = "".join(t.text or "" for t in p.iter(f"{A_NS}t"))
+                if text:
+                    texts.append(text)
+    return "\n".join(texts)
+
+
+def _pdf_text(data):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    reader = PdfReader(BytesIO(data))
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def extract_text(file_name, data):
+    """
+    파일명(확장자)과 내용 → 추출된 텍스트 (지원하지 않는 형식이면 None)
+    """
+    ext = os.path.splitext(file_name or "")[1].lower()
+    if ext in TEXT_EXTENSIONS:
+        text = _decode(data)
+    elif ext == ".docx":
+        text = _docx_text(data)
+    elif ext == ".pptx":
+        text = _pptx_text(data)
+    elif ext == ".pdf":
+        text = _pdf_text(data)
+    else:
+        return None
+    if text is None:
+        return None
+    return re.sub(r"[ \t]+", " ", text).strip()[:MAX_TEXT_CHARS]
@@ -0,0 +1,41 @@
+"""
+이미지 변환 (프로세스 풀 작업자에서 실행)
+- Django를 불러오지 않는 순수 함수만 둠 (spawn된 작업자가 이 모듈만 import)
+- 긴 변 기준 고정 크기로 축소한 WebP / JPEG 생성
+"""
+from io import BytesIO
+
+# 이름: 긴 변 최대 픽셀
+SIZES = {"thumb": 64, "small": 256, "medium": 1024}
+FORMATS = {"webp": ("WEBP", "image/webp"), "jpg": ("JPEG", "image/jpeg")}
+QUALITY = 82
+
+
+def render_variants(data):
+    """
+    원본 이미지 바이트 → {"<이름>.<확장자>": (바이트, content_type)}
+    원본보다 큰 크기는 만들지 않음 (대신 원본 크기로 변환)
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)  # 휴대폰 사진 회전 정보 반영
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        variants = {}
+        for name, edge in SIZES.items():
+            resized = image.copy()
+            resized.thumbnail((edge, edge), Image.LANCZOS)
+            for ext, (fmt, content_type) in FORMATS.items():
+                frame = resized
+                if fmt == "JPEG" and has_alpha:
+                    # JPEG는 투명도를 지원하지 않으므로 흰 배경에 합성
+                    frame = Image.new("RGB", resized.size, (255, 255, 255))
+                    frame.paste(resized, mask=resized.getchannel("A"))
+                options = {"quality": QUALITY}
+                options.update({"method": 4} if fmt == "WEBP" else {"optimize": True, "progressive": True})
+                out = BytesIO()
+                frame.save(out, fmt, **options)
+                variants[f"{name}.{ext}"] = (out.getvalue(), content_type)
+        return variants
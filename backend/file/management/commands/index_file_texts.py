@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from db_model.models import File
+from file.text_index import index_file, is_indexable
+
+
+class Command(BaseCommand):
+    help = "본문이 색인되지 않은 첨부(PDF/DOCX/PPTX/TXT)의 텍스트를 추출하여 검색 색인에 저장 (기존 첨부 백필용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, action='append', dest='projects',
+                            help="특정 프로젝트 첨부만 색인 (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        files = File.objects.filter(text__isnull=True)
+        if options['projects']:
+            files = files.filter(task__taskmanager__project_id__in=options['projects']).distinct()
+
+        indexed = 0
+        for file_obj in files.iterator():
+            if not is_indexable(file_obj.file_name):
+                continue
+            index_file(file_obj, wait=True)
+            indexed += 1
+        self.stdout.write(self.style.SUCCESS(f"첨부 {indexed}건 본문 색인 완료"))
@@ -0,0 +1,106 @@
+"""
+대용량 첨부 분할(multipart) 업로드
+- 시작 → 조각 업로드 URL 발급 → (클라이언트가 조각 병렬 업로드 후 완료 보고) → 완료 / 취소
+- 완료된 조각은 FileUploadPart에 기록 → 네트워크가 끊겨도 남은 조각만 다시 업로드
+- 완료 시 저장소에서 조각을 합치고 save_file_meta와 같은 방식으로 File 행 생성
+- sha256을 준 업로드는 임시 키로 받고, 합친 뒤 내용을 확인한 경우에만 CAS 키로 옮김 (file/dedup.py)
+"""
+import math
+
+from db_model.models import FileUpload, FileUploadPart
+from .dedup import adopt_blob, staging_key
+from .storage import get_storage
+
+MIN_PART_SIZE = 5 * 1024 * 1024     # S3 최소 조각 크기 (마지막 조각 제외)
+PART_SIZE = 8 * 1024 * 1024
+MAX_PARTS = 10000
+
+
+class MultipartError(Exception):
+    pass
+
+
+def choose_part_size(size):
+    """조각 수가 MAX_PARTS를 넘지 않는 조각 크기"""
+    if not size:
+        return PART_SIZE
+    return max(PART_SIZE, MIN_PART_SIZE, math.ceil(size / MAX_PARTS))
+
+
+def part_count(upload):
+    return math.ceil(upload.size / upload.part_size) if upload.size else None
+
+
+def initiate_upload(user_id, file_name, content_type, task_id=None, size=None, content_hash=None):
+    key = staging_key(file_name) if content_hash else file_name
+    part_size = choose_part_size(size)
+    upload_id = get_storage().create_multipart(key, content_type)
+    return FileUpload.objects.create(
+        upload_id=upload_id,
+        key=key,
+        file_name=file_name,
+        content_type=content_type or '',
+        size=size,
+        content_hash=content_hash,
+        part_size=part_size,
+        task_id=task_id,
+        user_id=user_id,
+    )
+
+
+def part_urls(upload, part_numbers):
+    """조각 번호별 업로드 URL {part_number: url}"""
+    total = part_count(upload)
+    storage = get_storage()
+    urls = {}
+    for n in part_numbers:
+        if n < 1 or n > MAX_PARTS or (total and n > total):
+            raise MultipartError(f"잘못된 조각 번호: {n}")
+        urls[n] = storage.part_upload_url(upload.key, upload.upload_id, n)
+    return urls
+
+
+def record_part(upload, part_number, etag, size=None):
+    """클라이언트가 업로드를 마친 조각 기록 (같은 조각 재업로드 시 덮어씀)"""
+    FileUploadPart.objects.update_or_create(
+        upload=upload, part_number=part_number,
+        defaults={'etag': etag, 'size': size},
+    )
+
+
+def completed_parts(upload):
+    return list(upload.parts.order_by('part_number').values_list('part_number', 'etag', 'size'))
+
+
+def complete_upload(upload):
+    """
+    조각 합치기 (File 행 생성은 호출 측)
+    - 완료 보고가 빠진 조각이 있으면 저장소의 조각 목록으로 보정
+    - content_hash가 있으면 합친 내용을 검증하여 CAS 키로 이동
+
+    Returns:
+        (key, content_hash): 최종 키, 검증된 해시 (검증 실패·해시 없음이면 None)
+    """
+    storage = get_storage()
+    parts = completed_parts(upload)
+    total = part_count(upload)
+    if not parts or (total and len(parts) < total):
+        parts = storage.list_parts(upload.key, upload.upload_id)
+    if not parts:
+        raise MultipartError("업로드된 조각이 없습니다.")
+    if total and [p[0] for p in parts] != list(range(1, total + 1)):
+        raise MultipartError("누락된 조각이 있습니다.")
+
+    storage.complete_multipart(upload.key, upload.upload_id, [(n, etag) for n, etag, _ in parts])
+    upload.delete()
+
+    if upload.content_hash:
+        key = adopt_blob(upload.key, upload.content_hash, upload.size)
+        if key:
+            return key, upload.content_hash
+    return upload.key, None
+
+
+def abort_upload(upload):
+    get_storage().abort_multipart(upload.key, upload.upload_id)
+    upload.delete()
@@ -0,0 +1,95 @@
+"""
+S3 공용 클라이언트 / Presigned URL 캐시
+- boto3 클라이언트는 스레드 안전하므로 프로세스당 1개만 생성하여 재사용
+  (요청마다 생성하면 자격 증명 조회·엔드포인트 로딩이 반복되고 커넥션 풀도 재사용되지 않음)
+- 다운로드용 Presigned GET URL은 (key, disposition)별 LRU 캐시에 보관, 만료 PRESIGN_REFRESH_MARGIN초 전까지 재사용
+"""
+import os
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+PRESIGN_EXPIRES = 3600
+PRESIGN_REFRESH_MARGIN = 300       # 남은 유효 시간이 이보다 짧으면 새로 서명
+PRESIGN_CACHE_SIZE = int(os.getenv("PRESIGN_CACHE_SIZE", "4096"))
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """프로세스 공용 S3 클라이언트"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    "s3",
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    config=Config(
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                    ),
+                )
+    return _client
+
+
+def attachment_disposition(file_name):
+    """한글 파일명 다운로드 처리 (RFC5987)"""
+    quoted_name = urllib.parse.quote(file_name or "", safe="")
+    return f"attachment; filename*=UTF-8''{quoted_name}"
+
+
+class PresignedUrlCache:
+    """(key, disposition) → (url, 만료 시각) LRU 캐시"""
+
+    def __init__(self, maxsize=PRESIGN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, cache_key):
+        with self.lock:
+            entry = self.entries.get(cache_key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at - time.time() < PRESIGN_REFRESH_MARGIN:
+                del self.entries[cache_key]
+                return None
+            self.entries.move_to_end(cache_key)
+            return url
+
+    def set(self, cache_key, url, expires_at):
+        with self.lock:
+            self.entries[cache_key] = (url, expires_at)
+            self.entries.move_to_end(cache_key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+
+_presign_cache = PresignedUrlCache()
+
+
+def presigned_get_url(key, disposition=None, expires_in=PRESIGN_EXPIRES):
+    """다운로드용 Presigned GET URL (캐시 우선)"""
+    cache_key = (key, disposition)
+    url = _presign_cache.get(cache_key)
+    if url:
+        return url
+
+    params = {"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": key}
+    if disposition:
+        params["ResponseContentDisposition"] = disposition
+    expires_at = time.time() + expires_in
+    url = get_s3_client().generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
+    _presign_cache.set(cache_key, url, expires_at)
+    return url
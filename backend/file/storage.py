@@ -0,0 +1,308 @@
+"""
+첨부 파일 저장소 추상화
+- FILE_STORAGE_BACKEND=s3 (기본): 기존 S3 Presigned POST / GET 흐름
+- FILE_STORAGE_BACKEND=local: FILE_STORAGE_ROOT 디렉터리에 저장 (오프라인 개발 / 테스트 / 벤치마크용)
+  - 업로드: S3 Presigned POST와 같은 {url, fields} 형식 → 프런트엔드 업로드 코드 그대로 사용
+  - 다운로드: 서명된 URL → file.views.local_download (FileResponse, Range, ETag)
+- 분할 업로드(create/part URL/list/complete/abort): S3 multipart API, 로컬은 조각 파일을 이어 붙임
+- 두 백엔드 모두 상대 URL을 돌려줄 수 있으므로 뷰에서 request.build_absolute_uri로 감쌈
+"""
+import base64
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
+from django.urls import reverse
+
+from .s3 import get_s3_client, presigned_get_url, attachment_disposition, PRESIGN_EXPIRES
+
+UPLOAD_SALT = "file.storage.upload"
+DOWNLOAD_SALT = "file.storage.download"
+PART_SALT = "file.storage.part"
+MULTIPART_DIR = ".multipart"
+COPY_BUFFER = 1024 * 1024
+
+
+class StorageError(Exception):
+    pass
+
+
+class S3Storage:
+    name = "s3"
+
+    def upload_target(self, key, content_type, sha256=None):
+        """
+        브라우저 직접 업로드용 {url, fields}
+        sha256을 주면 S3가 업로드 내용의 체크섬을 검증 (다르면 업로드 거부)
+        """
+        fields = {"Content-Type": content_type}
+        if sha256:
+            fields["x-amz-checksum-algorithm"] = "SHA256"
+            fields["x-amz-checksum-sha256"] = base64.b64encode(bytes.fromhex(sha256)).decode()
+        return get_s3_client().generate_presigned_post(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=key,
+            Fields=fields,
+            Conditions=[{name: value} for name, value in fields.items()],
+            ExpiresIn=PRESIGN_EXPIRES,
+        )
+
+    def download_url(self, key, file_name=None):
+        return presigned_get_url(key, attachment_disposition(file_name) if file_name else None)
+
+    def public_url(self, key):
+        return f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{key}"
+
+    def save(self, key, fileobj, content_type=None):
+        extra = {"ContentType": content_type} if content_type else None
+        get_s3_client().upload_fileobj(fileobj, settings.AWS_STORAGE_BUCKET_NAME, key, ExtraArgs=extra)
+        return key
+
+    def read(self, key):
+        return get_s3_client().get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)["Body"].read()
+
+    def exists(self, key):
+        return self.size(key) is not None
+
+    def size(self, key):
+        """객체 크기 (없으면 None)"""
+        try:
+            return get_s3_client().head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)["ContentLength"]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def sha256(self, key):
+        """
+        내용 SHA-256 hex
+        단일 업로드는 S3가 검증·저장한 체크섬을 사용, 분할 업로드("...-N" 조각 체크섬) 등은 내용을 읽어 계산
+        """
+        client = get_s3_client()
+        head = client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, ChecksumMode="ENABLED")
+        checksum = head.get("ChecksumSHA256")
+        if checksum and "-" not in checksum:
+            return base64.b64decode(checksum).hex()
+        digest = hashlib.sha256()
+        body = client.get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)["Body"]
+        for chunk in body.iter_chunks(COPY_BUFFER):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def move(self, src, dst):
+        client = get_s3_client()
+        bucket = settings.AWS_STORAGE_BUCKET_NAME
+        client.copy({"Bucket": bucket, "Key": src}, bucket, dst)  # 5GB 초과는 분할 복사
+        client.delete_object(Bucket=bucket, Key=src)
+        return dst
+
+    def delete(self, key):
+        get_s3_client().delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+
+    # ── 분할 업로드 ─────────────────────────────────────
+    def create_multipart(self, key, content_type):
+        params = {"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": key}
+        if content_type:
+            params["ContentType"] = content_type
+        return get_s3_client().create_multipart_upload(**params)["UploadId"]
+
+    def part_upload_url(self, key, upload_id, part_number):
+        """조각 PUT용 Presigned URL (응답 헤더 ETag를 클라이언트가 보고 → 버킷 CORS ExposeHeaders에 ETag 필요)"""
+        return get_s3_client().generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": key,
+                "UploadId": upload_id, "PartNumber": part_number,
+            },
+            ExpiresIn=PRESIGN_EXPIRES,
+        )
+
+    def list_parts(self, key, upload_id):
+        """→ [(part_number, etag, size)]"""
+        paginator = get_s3_client().get_paginator("list_parts")
+        parts = []
+        for page in paginator.paginate(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, UploadId=upload_id):
+            parts.extend((p["PartNumber"], p["ETag"], p["Size"]) for p in page.get("Parts", []))
+        return parts
+
+    def complete_multipart(self, key, upload_id, parts):
+        get_s3_client().complete_multipart_upload(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, UploadId=upload_id,
+            MultipartUpload={"Parts": [{"PartNumber": n, "ETag": etag} for n, etag in parts]},
+        )
+
+    def abort_multipart(self, key, upload_id):
+        get_s3_client().abort_multipart_upload(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, UploadId=upload_id)
+
+
+class LocalStorage:
+    name = "local"
+
+    def __init__(self, root=None):
+        self.root = os.path.abspath(root or settings.FILE_STORAGE_ROOT)
+
+    def path(self, key):
+        """key → 실제 경로 (저장소 루트 밖을 가리키면 StorageError)"""
+        path = os.path.abspath(os.path.join(self.root, key))
+        if (not key or os.path.commonpath([self.root, path]) != self.root or path == self.root
+                or os.path.relpath(path, self.root).split(os.sep)[0] == MULTIPART_DIR):
+            raise StorageError(f"잘못된 파일 키: {key}")
+        return path
+
+    def upload_target(self, key, content_type, sha256=None):
+        # sha256을 주면 업로드 시 내용 해시 검증 (내용 주소 키에 다른 내용이 들어가지 않도록)
+        token = signing.dumps({"k": key, "t": content_type, "h": sha256}, salt=UPLOAD_SALT)
+        return {
+            "url": reverse("local_upload"),
+            "fields": {"key": key, "Content-Type": content_type, "token": token},
+        }
+
+    def download_url(self, key, file_name=None):
+        token = signing.dumps({"k": key, "n": file_name}, salt=DOWNLOAD_SALT)
+        return reverse("local_download", args=[token])
+
+    def public_url(self, key):
+        # 만료 없는 서명 (프로필 이미지처럼 DB에 URL을 저장하는 경우)
+        token = signing.dumps({"k": key, "p": 1}, salt=DOWNLOAD_SALT)
+        return reverse("local_download", args=[token])
+
+    def save(self, key, fileobj, content_type=None):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.part"
+        with open(tmp, "wb") as out:
+            shutil.copyfileobj(fileobj, out, length=COPY_BUFFER)
+        os.replace(tmp, path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록 원자적 교체
+        return key
+
+    def read(self, key):
+        with open(self.path(key), "rb") as f:
+            return f.read()
+
+    def exists(self, key):
+        return os.path.isfile(self.path(key))
+
+    def size(self, key):
+        path = self.path(key)
+        return os.path.getsize(path) if os.path.isfile(path) else None
+
+    def sha256(self, key):
+        with open(self.path(key), "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def move(self, src, dst):
+        path = self.path(dst)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(self.path(src), path)
+        return dst
+
+    def delete(self, key):
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    # ── 분할 업로드 (조각 파일: <root>/.multipart/<upload_id>/<part_number>) ──
+    def _part_dir(self, upload_id):
+        if not upload_id.isalnum():
+            raise StorageError(f"잘못된 업로드 ID: {upload_id}")
+        return os.path.join(self.root, MULTIPART_DIR, upload_id)
+
+    def create_multipart(self, key, content_type):
+        self.path(key)  # 키 검증
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._part_dir(upload_id))
+        return upload_id
+
+    def part_upload_url(self, key, upload_id, part_number):
+        token = signing.dumps({"u": upload_id, "n": part_number}, salt=PART_SALT)
+        return reverse("local_upload_part", args=[token])
+
+    def save_part(self, upload_id, part_number, stream):
+        """조각 저장 → S3와 같은 형식의 ETag ("md5")"""
+        part_dir = self._part_dir(upload_id)
+        if not os.path.isdir(part_dir):
+            raise StorageError("업로드가 없거나 이미 종료되었습니다.")
+        digest = hashlib.md5()
+        tmp = os.path.join(part_dir, f"{part_number}.part")
+        with open(tmp, "wb") as out:
+            while True:
+                chunk = stream.read(COPY_BUFFER)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+        os.replace(tmp, os.path.join(part_dir, str(part_number)))
+        return f'"{digest.hexdigest()}"'
+
+    def list_parts(self, key, upload_id):
+        part_dir = self._part_dir(upload_id)
+        parts = []
+        for name in os.listdir(part_dir) if os.path.isdir(part_dir) else []:
+            if name.isdigit():
+                path = os.path.join(part_dir, name)
+                with open(path, "rb") as f:
+                    etag = f'"{hashlib.file_digest(f, "md5").hexdigest()}"'
+                parts.append((int(name), etag, os.path.getsize(path)))
+        return sorted(parts)
+
+    def complete_multipart(self, key, upload_id, parts):
+        part_dir = self._part_dir(upload_id)
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{upload_id}.part"
+        with open(tmp, "wb") as out:
+            for part_number, _ in parts:
+                with open(os.path.join(part_dir, str(part_number)), "rb") as part:
+                    shutil.copyfileobj(part, out, length=COPY_BUFFER)
+        os.replace(tmp, path)
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+    def abort_multipart(self, key, upload_id):
+        shutil.rmtree(self._part_dir(upload_id), ignore_errors=True)
+
+    # ── 로컬 전용: 토큰 검증 ─────────────────────────────
+    @staticmethod
+    def load_upload_token(token):
+        """→ (key, content_type, sha256), 만료/위조 시 signing.BadSignature"""
+        data = signing.loads(token, salt=UPLOAD_SALT, max_age=PRESIGN_EXPIRES)
+        return data["k"], data.get("t"), data.get("h")
+
+    @staticmethod
+    def load_part_token(token):
+        """→ (upload_id, part_number), 만료/위조 시 signing.BadSignature"""
+        data = signing.loads(token, salt=PART_SALT, max_age=PRESIGN_EXPIRES)
+        return data["u"], int(data["n"])
+
+    @staticmethod
+    def load_download_token(token):
+        """→ (key, file_name), 만료/위조 시 signing.BadSignature"""
+        data = signing.loads(token, salt=DOWNLOAD_SALT)
+        if not data.get("p"):
+            data = signing.loads(token, salt=DOWNLOAD_SALT, max_age=PRESIGN_EXPIRES)
+        return data["k"], data.get("n")
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """설정된 저장소 백엔드 (프로세스당 1개)"""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                backend = getattr(settings, "FILE_STORAGE_BACKEND", "s3")
+                if backend == "local":
+                    _storage = LocalStorage()
+                elif backend == "s3":
+                    _storage = S3Storage()
+                else:
+                    raise StorageError(f"알 수 없는 FILE_STORAGE_BACKEND: {backend}")
+    return _storage
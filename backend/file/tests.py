@@ -0,0 +1,171 @@
+import hashlib
+import shutil
+import tempfile
+from datetime import datetime
+from io import BytesIO
+
+from django.test import SimpleTestCase, TestCase
+
+from db_model.models import File, Project, ProjectMember, Task, User
+from . import storage as storage_module
+from .dedup import accessible_blob, adopt_blob, cas_key, staging_key
+from .storage import LocalStorage
+
+CONTENT = b"0123456789abcdefghij"
+
+
+class LocalStorageTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.root = tempfile.mkdtemp()
+        self.storage = LocalStorage(self.root)
+        self._previous, storage_module._storage = storage_module._storage, self.storage
+
+    def tearDown(self):
+        storage_module._storage = self._previous
+        shutil.rmtree(self.root, ignore_errors=True)
+        super().tearDown()
+
+    def put(self, key, data):
+        return self.storage.save(key, BytesIO(data))
+
+
+class LocalDownloadTests(LocalStorageTestMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.put("docs/a.txt", CONTENT)
+        self.url = self.storage.download_url("docs/a.txt", "a.txt")
+
+    def get(self, **headers):
+        return self.client.get(self.url, headers=headers)
+
+    def body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_full_download(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), CONTENT)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertTrue(response["ETag"])
+
+    def test_range(self):
+        response = self.get(Range="bytes=2-5")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(self.body(response), CONTENT[2:6])
+        self.assertEqual(response["Content-Range"], f"bytes 2-5/{len(CONTENT)}")
+        self.assertEqual(response["Content-Length"], "4")
+
+    def test_range_has_same_type_and_disposition_as_full_response(self):
+        self.put("docs/b.pdf", CONTENT)
+        self.url = self.storage.download_url("docs/b.pdf", "보고서.pdf")
+        full, partial = self.get(), self.get(Range="bytes=0-3")
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial["Content-Type"], "application/pdf")
+        self.assertEqual(partial["Content-Type"], full["Content-Type"])
+        self.assertEqual(partial["Content-Disposition"], full["Content-Disposition"])
+        self.assertIn("attachment", partial["Content-Disposition"])
+
+    def test_open_ended_and_suffix_ranges(self):
+        response = self.get(Range="bytes=15-")
+        self.assertEqual(self.body(response), CONTENT[15:])
+        response = self.get(Range="bytes=-3")
+        self.assertEqual(self.body(response), CONTENT[-3:])
+        self.assertEqual(response["Content-Range"], f"bytes {len(CONTENT) - 3}-{len(CONTENT) - 1}/{len(CONTENT)}")
+
+    def test_range_end_is_clamped(self):
+        response = self.get(Range="bytes=18-100")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(self.body(response), CONTENT[18:])
+
+    def test_unsatisfiable_range(self):
+        response = self.get(Range=f"bytes={len(CONTENT)}-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(CONTENT)}")
+
+    def test_if_none_match(self):
+        etag = self.get()["ETag"]
+        response = self.get(If_None_Match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(self.get(If_None_Match='"other"').status_code, 200)
+
+    def test_if_range_mismatch_returns_full_body(self):
+        response = self.get(Range="bytes=0-1", If_Range='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), CONTENT)
+
+    def test_invalid_token(self):
+        self.assertEqual(self.client.get(self.url[:-4] + "xyz/").status_code, 404)
+
+
+class DedupTests(LocalStorageTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.member = User.objects.create(name='kim', email='kim@example.com', password='pw')
+        self.outsider = User.objects.create(name='lee', email='lee@example.com', password='pw')
+        project = Project.objects.create(project_name='P')
+        ProjectMember.objects.create(user=self.member, project=project, role=1)
+        self.task = Task.objects.create(project=project, task_name='T', start_date=datetime(2025, 5, 1),
+                                        end_date=datetime(2025, 5, 2))
+        self.hash = hashlib.sha256(CONTENT).hexdigest()
+
+    def save_meta(self, user, **data):
+        session = self.client.session
+        session['user_id'] = user.user_id
+        session.save()
+        body = {'file_name': 'a.bin', 'task': self.task.task_id, 'user': user.user_id, **data}
+        return self.client.post('/api/files/save-meta/', body, content_type='application/json')
+
+    def test_verified_upload_moves_to_cas_key(self):
+        key = self.put(staging_key('a.txt'), CONTENT)
+        self.assertEqual(adopt_blob(key, self.hash, len(CONTENT)), cas_key(self.hash))
+        self.assertFalse(self.storage.exists(key))
+        self.assertEqual(self.storage.read(cas_key(self.hash)), CONTENT)
+
+    def test_mismatched_upload_is_not_adopted(self):
+        key = self.put(staging_key('a.txt'), b"other bytes")
+        self.assertIsNone(adopt_blob(key, self.hash, len(b"other bytes")))
+        self.assertIsNone(adopt_blob(key, self.hash, len(CONTENT)))
+        self.assertTrue(self.storage.exists(key))
+        self.assertFalse(self.storage.exists(cas_key(self.hash)))
+
+    def test_upload_of_existing_content_reuses_blob(self):
+        existing = self.put(cas_key(self.hash), CONTENT)
+        File.objects.create(file_name='a.txt', file_path=existing, task=self.task, user=self.member,
+                            content_hash=self.hash, size=len(CONTENT))
+        key = self.put(staging_key('b.txt'), CONTENT)
+        self.assertEqual(adopt_blob(key, self.hash, len(CONTENT)), existing)
+        self.assertFalse(self.storage.exists(key))
+
+    def test_reuse_requires_access_and_matching_size(self):
+        File.objects.create(file_name='a.txt', file_path=cas_key(self.hash), task=self.task, user=self.member,
+                            content_hash=self.hash, size=len(CONTENT))
+        self.assertEqual(accessible_blob(self.hash, len(CONTENT), self.member.user_id), cas_key(self.hash))
+        self.assertIsNone(accessible_blob(self.hash, len(CONTENT), self.outsider.user_id))
+        self.assertIsNone(accessible_blob(self.hash, len(CONTENT) + 1, self.member.user_id))
+        self.assertIsNone(accessible_blob(self.hash, None, self.member.user_id))
+
+    def test_save_meta_without_upload(self):
+        File.objects.create(file_name='a.txt', file_path=cas_key(self.hash), task=self.task, user=self.member,
+                            content_hash=self.hash, size=len(CONTENT))
+        self.assertEqual(self.save_meta(self.member, content_hash=self.hash, size=len(CONTENT)).status_code, 201)
+        self.assertEqual(self.save_meta(self.outsider, content_hash=self.hash, size=len(CONTENT)).status_code, 400)
+        self.assertEqual(self.save_meta(self.member, content_hash=self.hash).status_code, 400)  # size 필수
+
+    def test_save_meta_with_upload_token(self):
+        self.client.session  # 세션 생성
+        response = self.client.get('/api/files/upload-url/', {
+            'file_name': 'a.bin', 'file_type': 'application/octet-stream', 'sha256': self.hash, 'size': len(CONTENT),
+        })
+        self.assertEqual(response.status_code, 200)
+        self.put(response.data['key'], b"x" * len(CONTENT))  # 선언과 다른 내용
+
+        response = self.save_meta(self.member, content_hash=self.hash, size=len(CONTENT),
+                                  upload_token=response.data['upload_token'])
+
+        self.assertEqual(response.status_code, 201)
+        file_obj = File.objects.get(pk=response.data['file_id'])
+        self.assertIsNone(file_obj.content_hash)
+        self.assertTrue(file_obj.file_path.startswith('uploads/'))
@@ -0,0 +1,136 @@
+"""
+첨부 파일 본문 색인 / 검색
+- 첨부 저장 후 요청과 분리하여 본문 추출 → FileText에 저장
+  - 원본 읽기·DB 저장(I/O)은 스레드 풀, 파싱(CPU)은 프로세스 풀 (file/extraction.py)
+- 같은 blob을 공유하는 파일(중복 업로드)은 추출 결과를 함께 사용
+- 검색: MySQL은 FULLTEXT(ngram) MATCH ... AGAINST, 그 외 DB는 LIKE
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.db import close_old_connections, connection
+from django.db.models import Q, Value
+from django.db.models.functions import Greatest, Lower, StrIndex, Substr
+from django.utils import timezone
+
+from db_model.models import File, FileText
+from .extraction import SUPPORTED_EXTENSIONS, extract_text
+from .storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "2"))
+MAX_SOURCE_BYTES = 50 * 1024 * 1024
+SNIPPET_CHARS = 200
+SNIPPET_BEFORE = 60
+
+_io_pool = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix="text-io")
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool():
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # 서버 프로세스의 백그라운드 스레드 상태를 물려받지 않도록 spawn
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=EXTRACT_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _process_pool
+
+
+def is_indexable(file_name):
+    return os.path.splitext(file_name or "")[1].lower() in SUPPORTED_EXTENSIONS
+
+
+def _store(key, file_id, content):
+    """추출 결과를 이 파일과 같은 blob을 쓰는 파일 전체에 저장"""
+    file_ids = set(File.objects.filter(file_path=key).values_list('file_id', flat=True))
+    file_ids.add(file_id)
+    for fid in file_ids:
+        FileText.objects.update_or_create(
+            file_id=fid, defaults={'content': content, 'extracted_at': timezone.now()},
+        )
+
+
+def _extract(key, file_name):
+    data = get_storage().read(key)
+    if len(data) > MAX_SOURCE_BYTES:
+        return None
+    return _get_process_pool().submit(extract_text, file_name, data).result()
+
+
+def _index(file_id, key, file_name):
+    try:
+        content = _extract(key, file_name)
+        if content:
+            _store(key, file_id, content)
+    except Exception:
+        logger.exception(f"첨부 본문 추출 실패 (file_id={file_id}, key={key})")
+
+
+def _index_in_background(file_id, key, file_name):
+    try:
+        _index(file_id, key, file_name)
+    finally:
+        close_old_connections()
+
+
+def index_file(file_obj, wait=False):
+    """
+    첨부 본문 색인 예약 (기본은 즉시 반환)
+    같은 blob을 쓰는 파일이 이미 색인되어 있으면 그 본문을 복사
+    """
+    if not is_indexable(file_obj.file_name):
+        return None
+    key = file_obj.file_path or file_obj.file_name
+    existing = (
+        FileText.objects.filter(file__file_path=key)
+        .exclude(file_id=file_obj.pk).values_list('content', flat=True).first()
+    )
+    if existing:
+        FileText.objects.update_or_create(file_id=file_obj.pk, defaults={'content': existing})
+        return None
+    if wait:
+        return _index(file_obj.pk, key, file_obj.file_name)
+    return _io_pool.submit(_index_in_background, file_obj.pk, key, file_obj.file_name)
+
+
+def _boolean_query(terms):
+    # 모든 단어 포함 (ngram 파서는 단어 내부 일치도 찾음)
+    return " ".join('+"{}"'.format(term.replace('"', '')) for term in terms)
+
+
+def search_files(files, q):
+    """
+    File 쿼리셋 중 파일명 또는 본문에 검색어(공백 구분, 모두 포함)가 있는 파일
+    snippet: 본문에서 첫 검색어 주변 일부 (본문 일치가 없으면 None)
+    """
+    terms = [term for term in q.split() if term]
+    if not terms:
+        return files.none()
+
+    name_match = Q()
+    for term in terms:
+        name_match &= Q(file_name__icontains=term)
+
+    if connection.vendor == 'mysql':
+        text_ids = FileText.objects.extra(
+            where=["MATCH(content) AGAINST (%s IN BOOLEAN MODE)"], params=[_boolean_query(terms)],
+        ).values('file_id')
+        text_match = Q(file_id__in=text_ids)
+    else:
+        text_match = Q(text__isnull=False)
+        for term in terms:
+            text_match &= Q(text__content__icontains=term)
+
+    position = StrIndex(Lower('text__content'), Value(terms[0].lower()))
+    return files.filter(name_match | text_match).annotate(
+        snippet=Substr('text__content', Greatest(position - SNIPPET_BEFORE, 1), SNIPPET_CHARS),
+        match_position=position,
+    )
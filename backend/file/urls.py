@@ -3,8 +3,20 @@ from . import views
 
 urlpatterns = [
     path('list/', views.take_files, name='take_files'),
+    path('search/', views.search_project_files, name='search_project_files'),
     path('download/', views.download_files, name='download_files'),
+    path('download/batch/', views.download_files_batch, name='download_files_batch'),
     path('upload-url/', views.file_upload, name='file_upload'),     # 이동됨
     path('save-meta/', views.save_file_meta, name='save_file_meta'), # 이동됨
     path('task-files/', views.get_task_files, name='get_task_files'),
+    # 분할 업로드 (대용량 첨부)
+    path('multipart/', views.multipart_initiate, name='multipart_initiate'),
+    path('multipart/<str:upload_id>/', views.multipart_detail, name='multipart_detail'),
+    path('multipart/<str:upload_id>/parts/', views.multipart_part_urls, name='multipart_part_urls'),
+    path('multipart/<str:upload_id>/parts/<int:part_number>/', views.multipart_part_done, name='multipart_part_done'),
+    path('multipart/<str:upload_id>/complete/', views.multipart_complete, name='multipart_complete'),
+    # 로컬 저장소 (FILE_STORAGE_BACKEND=local)
+    path('local/upload/', views.local_upload, name='local_upload'),
+    path('local/parts/<str:token>/', views.local_upload_part, name='local_upload_part'),
+    path('local/<str:token>/', views.local_download, name='local_download'),
 ]
\ No newline at end of file
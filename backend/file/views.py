@@ -1,26 +1,34 @@
-import boto3
-import urllib.parse
 import logging
-from django.conf import settings
+import mimetypes
+import os
+import re
+from django.core import signing
+from django.db.models import Q
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse, Http404
 from django.shortcuts import get_object_or_404
+from django.utils.http import content_disposition_header, http_date
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 
-from db_model.models import File
+from django.views.decorators.csrf import csrf_exempt
+from db_model.models import File, FileUpload
 from comments.serializers import FileSerializer
+from db_model.sparse import sparse_queryset
 from log.views import create_log
+from .dedup import normalize_hash, staging_key, upload_token, load_upload_token, accessible_blob, adopt_blob
+from .derivatives import generate_derivatives, is_image
+from .multipart import (
+    MultipartError, initiate_upload, part_urls, part_count, record_part, completed_parts,
+    complete_upload, abort_upload,
+)
+from .storage import get_storage, LocalStorage, StorageError
+from .text_index import index_file, search_files
 
 logger = logging.getLogger(__name__)
 
-def get_s3_client():
-    """S3 Client 생성 헬퍼 함수"""
-    return boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
+MAX_BATCH_FILES = 200
+SEARCH_LIMIT = 50
 
 @api_view(["GET"])
 def take_files(request):
@@ -33,13 +41,41 @@ def take_files(request):
         # TaskManager를 통해 프로젝트와 연결된 파일들 조회 (중복 제거)
         files = File.objects.filter(
             task__taskmanager__project_id=project_id
-        ).select_related('user', 'task').distinct().order_by("-created_date")
-        
-        return Response(FileSerializer(files, many=True).data, status=status.HTTP_200_OK)
+        ).select_related('user').distinct().order_by("-created_date")
+        files = sparse_queryset(files, FileSerializer, request.query_params)
+
+        return Response(FileSerializer(files, many=True, context={'request': request}).data, status=status.HTTP_200_OK)
     except Exception as e:
         logger.error(f"Take Files Error: {e}")
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@api_view(["GET"])
+def search_project_files(request):
+    """
+    프로젝트 첨부 검색 (파일명 + 추출된 본문)
+    ?project_id=&q=<검색어 (공백 구분, 모두 포함)>
+    """
+    project_id = request.GET.get("project_id")
+    q = request.GET.get("q", "").strip()
+    if not project_id or not q:
+        return Response({"error": "project_id and q required"}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        files = File.objects.filter(
+            task__taskmanager__project_id=project_id
+        ).select_related('user').distinct()
+        files = search_files(files, q).order_by("-created_date")[:SEARCH_LIMIT]
+
+        results = []
+        for file_obj in files:
+            data = FileSerializer(file_obj, context={'request': request}).data
+            data['snippet'] = file_obj.snippet if file_obj.match_position else None
+            results.append(data)
+        return Response(results, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"File Search Error: {e}")
+        return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 @api_view(["GET"])
 def download_files(request):
     """파일 다운로드용 Presigned URL 생성"""
@@ -49,60 +85,145 @@ def download_files(request):
         
     try:
         file_obj = get_object_or_404(File, pk=file_id)
-        s3 = get_s3_client()
-        
+
         # DB에 저장된 파일명(S3 Key) 사용
         # file_path가 있으면 그것을, 없으면 file_name 사용 (모델 구조에 따라 조정)
         key = file_obj.file_path if file_obj.file_path else file_obj.file_name
-        
-        # 한글 파일명 다운로드 처리 (RFC5987)
-        quoted_name = urllib.parse.quote(file_obj.file_name, safe="")
-        disposition = f"attachment; filename*=UTF-8''{quoted_name}"
-
-        url = s3.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                "Key": key,
-                "ResponseContentDisposition": disposition,
-            },
-            ExpiresIn=3600,
-        )
+        # ?variant=thumb.webp 등: 이미지 파생본 (아직 없으면 원본)
+        key = (file_obj.variants or {}).get(request.GET.get("variant"), key)
+        url = request.build_absolute_uri(get_storage().download_url(key, file_obj.file_name))
         return Response({"url": url}, status=status.HTTP_200_OK)
 
     except Exception as e:
         logger.error(f"Download Error: {e}")
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@api_view(["GET", "POST"])
+def download_files_batch(request):
+    """
+    여러 파일의 다운로드 Presigned URL 한 번에 생성 (파일 목록 화면용)
+    - GET ?file_ids=1,2,3 또는 POST {"file_ids": [1, 2, 3]}
+    - variant: 이미지 파생본 이름 (예: thumb.webp, 없는 파일은 원본)
+
+    Returns:
+        {"urls": {file_id: url}, "missing": [없는 file_id]}
+    """
+    raw = request.data.get("file_ids") if request.method == "POST" else request.GET.get("file_ids", "").split(",")
+    try:
+        file_ids = list(dict.fromkeys(int(f) for f in (raw or []) if str(f).strip()))
+    except (TypeError, ValueError):
+        return Response({"error": "file_ids must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+    if not file_ids:
+        return Response({"error": "file_ids required"}, status=status.HTTP_400_BAD_REQUEST)
+    if len(file_ids) > MAX_BATCH_FILES:
+        return Response({"error": f"최대 {MAX_BATCH_FILES}개까지 요청할 수 있습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        variant = request.data.get("variant") if request.method == "POST" else request.GET.get("variant")
+        files = File.objects.filter(pk__in=file_ids).only('file_id', 'file_name', 'file_path', 'variants')
+        storage = get_storage()
+        urls = {
+            f.file_id: request.build_absolute_uri(storage.download_url(
+                (f.variants or {}).get(variant, f.file_path or f.file_name), f.file_name
+            ))
+            for f in files
+        }
+        missing = [f for f in file_ids if f not in urls]
+        return Response({"urls": urls, "missing": missing}, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        logger.error(f"Batch Download Error: {e}")
+        return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 @api_view(['GET'])
 def file_upload(request):
-    """업로드용 Presigned URL 생성 (comments 앱에서 이동됨)"""
+    """
+    업로드용 Presigned URL 생성 (comments 앱에서 이동됨)
+    - sha256(+size)을 함께 보내면 접근 가능한 같은 내용의 파일이 이미 있을 때 업로드 생략
+      → {"exists": true, "key", "content_hash"} 응답 후 save-meta만 호출
+    - 없으면 임시 키로 업로드 후 응답의 upload_token을 save-meta에 전달 (서버가 내용 검증)
+    """
     file_name = request.GET.get('file_name')
     file_type = request.GET.get('file_type')
 
     if not file_name or not file_type:
         return Response({"error": "file_name & file_type required"}, status=status.HTTP_400_BAD_REQUEST)
 
+    content_hash = None
+    if request.GET.get('sha256'):
+        try:
+            content_hash = normalize_hash(request.GET['sha256'])
+            size = int(request.GET.get('size', ''))
+        except ValueError as e:
+            return Response({"error": f"sha256 & size required: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
     try:
-        s3 = get_s3_client()
-        presigned_post = s3.generate_presigned_post(
-            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-            Key=file_name,
-            Fields={"Content-Type": file_type},
-            Conditions=[{"Content-Type": file_type}],
-            ExpiresIn=3600
-        )
-        return Response({'data': presigned_post}, status=status.HTTP_200_OK)
+        token = None
+        if content_hash:
+            key = accessible_blob(content_hash, size, request.session.get("user_id"))
+            if key:
+                return Response({'exists': True, 'key': key, 'content_hash': content_hash}, status=status.HTTP_200_OK)
+            key = staging_key(file_name)
+            token = upload_token(key, content_hash, size)
+        else:
+            key = file_name
+        presigned_post = get_storage().upload_target(key, file_type, sha256=content_hash)
+        presigned_post["url"] = request.build_absolute_uri(presigned_post["url"])
+        return Response({'data': presigned_post, 'key': key, 'content_hash': content_hash, 'upload_token': token},
+                        status=status.HTTP_200_OK)
     except Exception as e:
         logger.error(f"Presigned Post Error: {e}")
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-@api_view(['POST'])
-def save_file_meta(request):
-    """파일 메타데이터 DB 저장 (comments 앱에서 이동됨)"""
-    serializer = FileSerializer(data=request.data)
+def _schedule_file_derivatives(file_obj):
+    """이미지 첨부 파생본 생성 (같은 blob을 공유하는 파일에 이미 있으면 재사용)"""
+    key = file_obj.file_path or file_obj.file_name
+    existing = (
+        File.objects.filter(file_path=key, variants__isnull=False)
+        .exclude(pk=file_obj.pk).values_list('variants', flat=True).first()
+    )
+    if existing:
+        File.objects.filter(pk=file_obj.pk).update(variants=existing)
+        return
+    generate_derivatives(
+        key,
+        on_done=lambda keys: File.objects.filter(Q(file_path=key) | Q(pk=file_obj.pk)).update(variants=keys),
+    )
+
+def _save_file(data, user_id=None, token=None, **extra):
+    """
+    File 행 저장 + 업로드 로그 (save_file_meta / 분할 업로드 완료 공통)
+    content_hash가 있고 file_path가 정해지지 않았으면
+    - token(upload_token)이 있으면 임시 키에 올라온 내용을 검증 (다르면 임시 키 그대로, content_hash 없이 저장)
+    - 없으면 user_id가 접근할 수 있는 같은 내용의 blob (없으면 400)
+    """
+    serializer = FileSerializer(data=data)
     if serializer.is_valid():
-        file_obj = serializer.save()
+        content_hash = serializer.validated_data.get('content_hash')
+        size = serializer.validated_data.get('size')
+        if content_hash and 'file_path' not in extra:
+            if token:
+                try:
+                    key, token_hash, token_size = load_upload_token(token)
+                except signing.BadSignature:
+                    return Response({"error": "업로드 토큰이 만료되었거나 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+                if (token_hash, token_size) != (content_hash, size):
+                    return Response({"error": "업로드 토큰과 파일 정보가 일치하지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+                if not get_storage().exists(key):
+                    return Response({"error": "업로드된 파일이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+                verified = adopt_blob(key, content_hash, size)
+                extra['file_path'] = verified or key
+                if not verified:
+                    extra.update(content_hash=None, size=get_storage().size(key))
+            else:
+                key = accessible_blob(content_hash, size, user_id)
+                if not key:
+                    return Response({"error": "업로드된 파일이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+                extra['file_path'] = key
+        file_obj = serializer.save(**extra)
+        if is_image(file_obj.file_name):
+            _schedule_file_derivatives(file_obj)
+        index_file(file_obj)
         
         # 로그 기록
         create_log(
@@ -114,6 +235,11 @@ def save_file_meta(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@api_view(['POST'])
+def save_file_meta(request):
+    """파일 메타데이터 DB 저장 (comments 앱에서 이동됨)"""
+    return _save_file(request.data, user_id=request.session.get("user_id"), token=request.data.get("upload_token"))
+
 @api_view(["GET"])
 def get_task_files(request):
     """특정 업무의 파일 목록 조회"""
@@ -122,4 +248,239 @@ def get_task_files(request):
         return Response({"error": "task_id required"}, status=status.HTTP_400_BAD_REQUEST)
 
     files = File.objects.filter(task_id=task_id).select_related('user').order_by("created_date")
-    return Response(FileSerializer(files, many=True).data)
\ No newline at end of file
+    files = sparse_queryset(files, FileSerializer, request.query_params)
+    return Response(FileSerializer(files, many=True, context={'request': request}).data)
+
+
+# ──────────────────────────────────────────
+# 분할(multipart) 업로드
+# ──────────────────────────────────────────
+def _session_upload(request, upload_id):
+    """세션 사용자의 진행 중 업로드 (없으면 404)"""
+    return get_object_or_404(FileUpload, pk=upload_id, user_id=request.session.get("user_id"))
+
+def _upload_status(upload):
+    return {
+        "upload_id": upload.upload_id,
+        "key": upload.key,
+        "file_name": upload.file_name,
+        "size": upload.size,
+        "part_size": upload.part_size,
+        "part_count": part_count(upload),
+        "completed_parts": [{"part_number": n, "etag": etag, "size": size} for n, etag, size in completed_parts(upload)],
+    }
+
+@api_view(['POST'])
+def multipart_initiate(request):
+    """
+    분할 업로드 시작
+    Body: {file_name, file_type, task, size, sha256(선택, 주면 size 필수)}
+    Returns: upload_id, part_size, part_count
+    """
+    user_id = request.session.get("user_id")
+    if not user_id:
+        return Response({"error": "로그인이 필요합니다."}, status=status.HTTP_401_UNAUTHORIZED)
+    file_name = request.data.get("file_name")
+    if not file_name or not request.data.get("task"):
+        return Response({"error": "file_name & task required"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        size = int(request.data["size"]) if request.data.get("size") else None
+        task_id = int(request.data["task"])
+        content_hash = normalize_hash(request.data["sha256"]) if request.data.get("sha256") else None
+    except (TypeError, ValueError):
+        return Response({"error": "size & task must be integers, sha256 must be hex"}, status=status.HTTP_400_BAD_REQUEST)
+    if content_hash and size is None:
+        # 크기 없이 해시만으로는 같은 내용인지 확인하지 않음
+        return Response({"error": "sha256 requires size"}, status=status.HTTP_400_BAD_REQUEST)
+
+    # 접근 가능한 같은 내용의 파일이 이미 있으면 업로드 없이 File만 저장
+    if content_hash and accessible_blob(content_hash, size, user_id):
+        response = _save_file({"file_name": file_name, "task": task_id, "user": user_id,
+                               "content_hash": content_hash, "size": size}, user_id=user_id)
+        if response.status_code == status.HTTP_201_CREATED:
+            response.data = {"deduplicated": True, "file": response.data}
+        return response
+
+    try:
+        upload = initiate_upload(user_id, file_name, request.data.get("file_type", ""), task_id=task_id, size=size,
+                                 content_hash=content_hash)
+    except StorageError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Multipart Initiate Error: {e}")
+        return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response(_upload_status(upload), status=status.HTTP_201_CREATED)
+
+@api_view(['GET', 'DELETE'])
+def multipart_detail(request, upload_id):
+    """GET: 진행 상태(완료된 조각 목록, 재개용) / DELETE: 업로드 취소"""
+    upload = _session_upload(request, upload_id)
+    if request.method == 'DELETE':
+        abort_upload(upload)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    return Response(_upload_status(upload))
+
+@api_view(['POST'])
+def multipart_part_urls(request, upload_id):
+    """조각 업로드 URL 발급 Body: {part_numbers: [1, 2, ...]}"""
+    upload = _session_upload(request, upload_id)
+    try:
+        numbers = [int(n) for n in request.data.get("part_numbers") or []]
+        urls = part_urls(upload, numbers)
+    except (TypeError, ValueError, MultipartError) as e:
+        return Response({"error": str(e) or "part_numbers must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({"urls": {n: request.build_absolute_uri(url) for n, url in urls.items()}})
+
+@api_view(['POST'])
+def multipart_part_done(request, upload_id, part_number):
+    """조각 업로드 완료 보고 Body: {etag, size}"""
+    upload = _session_upload(request, upload_id)
+    etag = request.data.get("etag")
+    if not etag:
+        return Response({"error": "etag required"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        size = int(request.data["size"]) if request.data.get("size") not in (None, "") else None
+    except (TypeError, ValueError):
+        return Response({"error": "size must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+    record_part(upload, part_number, etag, size)
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+@api_view(['POST'])
+def multipart_complete(request, upload_id):
+    """분할 업로드 완료 → 조각 합치기 + File 저장 (save_file_meta와 같은 응답)"""
+    upload = _session_upload(request, upload_id)
+    data = {"file_name": upload.file_name, "task": upload.task_id, "user": upload.user_id,
+            "content_hash": upload.content_hash, "size": upload.size}
+    try:
+        key, data["content_hash"] = complete_upload(upload)
+    except MultipartError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Multipart Complete Error: {e}")
+        return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return _save_file(data, file_path=key)
+
+
+# ──────────────────────────────────────────
+# 로컬 저장소 (FILE_STORAGE_BACKEND=local)
+# ──────────────────────────────────────────
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+@api_view(['POST'])
+def local_upload(request):
+    """
+    로컬 저장소 업로드 (S3 Presigned POST와 같은 multipart 형식: fields + file)
+    업로드 URL 발급 시 서명한 token으로 key를 검증
+    """
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise Http404
+    upload = request.FILES.get('file')
+    try:
+        key, content_type, sha256 = storage.load_upload_token(request.data.get('token', ''))
+    except signing.BadSignature:
+        return Response({"error": "업로드 토큰이 만료되었거나 올바르지 않습니다."}, status=status.HTTP_403_FORBIDDEN)
+    if upload is None or request.data.get('key') != key:
+        return Response({"error": "key & file required"}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        storage.save(key, upload, content_type)
+    except StorageError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if sha256 and storage.sha256(key) != sha256:
+        storage.delete(key)
+        return Response({"error": "파일 내용이 sha256과 일치하지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(status=status.HTTP_204_NO_CONTENT)  # S3 POST 업로드 성공 응답과 동일
+
+
+@csrf_exempt
+def local_upload_part(request, token):
+    """로컬 저장소 조각 업로드 (S3 upload_part Presigned URL과 같이 PUT 본문 = 조각, 응답 헤더 ETag)"""
+    storage = get_storage()
+    if request.method != "PUT" or not isinstance(storage, LocalStorage):
+        raise Http404
+    try:
+        upload_id, part_number = storage.load_part_token(token)
+        etag = storage.save_part(upload_id, part_number, request)
+    except signing.BadSignature:
+        return HttpResponse(status=403)
+    except StorageError:
+        raise Http404
+    response = HttpResponse(status=200)
+    response["ETag"] = etag
+    return response
+
+
+def _iter_range(path, start, length):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def local_download(request, token):
+    """
+    로컬 저장소 다운로드 (서명된 URL)
+    - 전체 응답은 FileResponse → 서버가 지원하면 sendfile(zero-copy)
+    - Range: bytes=a-b (단일 구간) → 206, If-None-Match 일치 → 304
+      (206 응답도 전체 응답과 같은 Content-Type / Content-Disposition → 동영상·PDF 탐색, 이어받기)
+    """
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise Http404
+    try:
+        key, file_name = storage.load_download_token(token)
+        path = storage.path(key)
+        stat = os.stat(path)
+    except (signing.BadSignature, StorageError, FileNotFoundError):
+        raise Http404
+
+    size = stat.st_size
+    download_name = file_name or os.path.basename(key)
+    etag = f'"{size:x}-{stat.st_mtime_ns:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(stat.st_mtime),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=3600",
+    }
+    if etag in [t.strip() for t in request.headers.get("If-None-Match", "").split(",")]:
+        response = HttpResponseNotModified()
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    range_header = request.headers.get("Range", "")
+    if_range = request.headers.get("If-Range")
+    match = RANGE_RE.match(range_header) if range_header and (not if_range or if_range == etag) else None
+    if match and match.group(1) + match.group(2):
+        first, last = match.groups()
+        if first:
+            start, end = int(first), min(int(last) if last else size - 1, size - 1)
+        else:
+            start, end = max(size - int(last), 0), size - 1  # bytes=-N: 마지막 N바이트
+        if start > end or start >= size:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+        content_type = mimetypes.guess_type(download_name)[0] or "application/octet-stream"
+        response = StreamingHttpResponse(
+            _iter_range(path, start, end - start + 1), status=206, content_type=content_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+        response["Content-Disposition"] = content_disposition_header(bool(file_name), download_name)
+    else:
+        response = FileResponse(open(path, 'rb'), as_attachment=bool(file_name), filename=download_name)
+
+    for name, value in headers.items():
+        response[name] = value
+    return response
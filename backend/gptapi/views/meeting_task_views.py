@@ -16,7 +16,7 @@ from django.db import transaction
 from asgiref.sync import sync_to_async
 from dotenv import load_dotenv
 
-from db_model.models import Task, TaskManager, User, Project, Minutes
+from db_model.models import Task, TaskStatus, TaskManager, User, Project, Minutes
 from log.views import create_log
 
 load_dotenv()
@@ -215,7 +215,7 @@ def bulk_create_tasks_from_minutes(request):
                     description=task_data.get('description'),
                     start_date=task_data.get('start_date'),
                     end_date=task_data.get('end_date'),
-                    status='0',
+                    status=TaskStatus.REQUESTED,
                     parent_task=None
                 )
                 
@@ -245,7 +245,7 @@ def bulk_create_tasks_from_minutes(request):
                         description=subtask_data.get('description'),
                         start_date=subtask_data.get('start_date'),
                         end_date=subtask_data.get('end_date'),
-                        status='0'
+                        status=TaskStatus.REQUESTED
                     )
                     
                     sub_assignee_name = subtask_data.get('assignee')
@@ -40,8 +40,7 @@ def get_task_info_str(project):
         for task in tasks:
             tm = TaskManager.objects.filter(task=task, project=project).first()
             user_name = tm.user.name if tm and tm.user else "미배정"
-            status_map = {'0': '요청', '1': '진행중', '2': '이슈/피드백', '3': '완료'}
-            status = status_map.get(task.status, task.status)
+            status = task.get_status_display()
 
             info += f"- 업무명: {task.task_name}\n"
             info += f"  담당자: {user_name} | 상태: {status}\n"
@@ -10,7 +10,7 @@ from django.db import transaction
 from asgiref.sync import sync_to_async
 from dotenv import load_dotenv
 
-from db_model.models import Project, Task, TaskManager, User, ProjectMember
+from db_model.models import Project, Task, TaskStatus, TaskManager, User, ProjectMember
 
 load_dotenv()
 api_key = os.getenv("OPENAI_API_KEY")
@@ -260,7 +260,7 @@ def confirm_tasks(request):
                     description=json.dumps(task_data),
                     start_date=start,
                     end_date=end,
-                    status='0', 
+                    status=TaskStatus.REQUESTED,
                     parent_task=parent
                 )
                 
@@ -0,0 +1,154 @@
+"""
+자동 로그 압축
+- 상위 업무 일정 변경 / 상태 전파 한 번에 하위 업무 수만큼 쌓이는 자동 로그를 묶음 요약 행 1개로 교체
+  - 같은 프로젝트·사용자·액션의 자동 로그가 BURST_GAP 이내 간격으로 이어지면 한 묶음
+  - 요약 행 payload: {"count", "started", "content", "entries": [[task_id, task_name, content, 초 오프셋], ...]}
+    (묶음 내 내용이 모두 같으면 "content"에 한 번만 두고 항목의 content는 null)
+- 오래된 요약 행은 entries(상세)를 제거하고 건수만 보관
+- 실행: python manage.py compact_logs (주기적으로)
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from db_model.models import Log
+from users.cache import invalidate_project_dashboards
+
+AUTO_ACTIONS = ("일정 자동 조정", "업무 상태 변경 (자동)")
+BURST_GAP = timedelta(seconds=10)
+MIN_BURST = 2
+MIN_AGE = timedelta(minutes=10)      # 최근 로그는 피드에 바로 보이도록 압축하지 않음
+DETAIL_RETENTION_DAYS = 90
+BATCH_SIZE = 500
+
+FIELDS = ('log_id', 'project_id', 'user_id', 'action', 'content', 'task_id', 'task_name', 'created_date')
+
+
+def _bursts(rows):
+    """(프로젝트, 사용자, 액션, 시각) 순 정렬된 행 → 묶음 목록"""
+    burst = []
+    for row in rows:
+        if burst:
+            prev = burst[-1]
+            same_key = (prev['project_id'], prev['user_id'], prev['action']) == \
+                       (row['project_id'], row['user_id'], row['action'])
+            if not same_key or row['created_date'] - prev['created_date'] > BURST_GAP:
+                yield burst
+                burst = []
+        burst.append(row)
+    if burst:
+        yield burst
+
+
+def summarize_burst(burst):
+    """묶음 → 요약 Log (저장 전)"""
+    first, last = burst[0], burst[-1]
+    contents = {row['content'] for row in burst}
+    common = contents.pop() if len(contents) == 1 else None
+    count = len(burst)
+    entries = [[
+        row['task_id'],
+        row['task_name'],
+        None if common is not None else row['content'],
+        int((row['created_date'] - first['created_date']).total_seconds()),
+    ] for row in burst]
+    return Log(
+        action=first['action'],
+        content=f"{common} (업무 {count}개)" if common is not None else f"업무 {count}개 {first['action']}",
+        user_id=first['user_id'],
+        project_id=first['project_id'],
+        created_date=last['created_date'],
+        payload={
+            "count": count,
+            "started": first['created_date'].isoformat(),
+            "content": common,
+            "entries": entries,
+        },
+    )
+
+
+def _replace(summaries, detail_ids):
+    with transaction.atomic():
+        Log.objects.bulk_create(summaries, batch_size=BATCH_SIZE)
+        for i in range(0, len(detail_ids), BATCH_SIZE):
+            Log.objects.filter(pk__in=detail_ids[i:i + BATCH_SIZE]).delete()
+
+
+def compact_logs(before=None, project_ids=None):
+    """
+    자동 로그 묶음을 요약 행으로 교체
+
+    Args:
+        before: 이 시각 이전 로그만 대상 (기본: 현재 - MIN_AGE)
+        project_ids: 특정 프로젝트만 (None이면 전체)
+
+    Returns:
+        (요약 행 수, 삭제된 상세 행 수)
+    """
+    before = before or timezone.now() - MIN_AGE
+    qs = Log.objects.filter(
+        action__in=AUTO_ACTIONS,
+        payload__isnull=True,
+        project_id__isnull=False,
+        created_date__lt=before,
+    )
+    if project_ids:
+        qs = qs.filter(project_id__in=project_ids)
+    rows = (
+        qs.order_by('project_id', 'user_id', 'action', 'created_date', 'log_id')
+        .values(*FIELDS)
+        .iterator(chunk_size=2000)
+    )
+
+    summaries, detail_ids, projects = [], [], set()
+    total_summaries = total_removed = 0
+    for burst in _bursts(rows):
+        if len(burst) < MIN_BURST:
+            continue
+        summaries.append(summarize_burst(burst))
+        detail_ids.extend(row['log_id'] for row in burst)
+        projects.add(burst[0]['project_id'])
+        if len(summaries) >= BATCH_SIZE:
+            _replace(summaries, detail_ids)
+            total_summaries += len(summaries)
+            total_removed += len(detail_ids)
+            summaries, detail_ids = [], []
+
+    if summaries:
+        _replace(summaries, detail_ids)
+        total_summaries += len(summaries)
+        total_removed += len(detail_ids)
+
+    # 대시보드 최근 로그에서 상세 행이 빠졌으므로 캐시 무효화
+    for project_id in projects:
+        invalidate_project_dashboards(project_id)
+    return total_summaries, total_removed
+
+
+def age_out_details(days=DETAIL_RETENTION_DAYS):
+    """
+    days일 지난 요약 행의 상세(entries) 제거 (건수·공통 내용은 유지)
+
+    Returns:
+        int: 정리된 요약 행 수
+    """
+    cutoff = timezone.now() - timedelta(days=days)
+    rows = (
+        Log.objects
+        .filter(payload__has_key='entries', created_date__lt=cutoff)
+        .only('log_id', 'payload')
+    )
+    changed = []
+    total = 0
+    for log in rows.iterator(chunk_size=BATCH_SIZE):
+        log.payload = {k: v for k, v in log.payload.items() if k != 'entries'}
+        changed.append(log)
+        if len(changed) >= BATCH_SIZE:
+            Log.objects.bulk_update(changed, ['payload'])
+            total += len(changed)
+            changed = []
+    if changed:
+        Log.objects.bulk_update(changed, ['payload'])
+        total += len(changed)
+    return total
@@ -0,0 +1,86 @@
+"""
+프로젝트 활동 로그 내보내기 (CSV / NDJSON 스트리밍)
+- (project_id, created_date) 인덱스를 따라 (created_date, log_id) 키셋으로 BATCH_SIZE씩 조회
+  → 행 수와 관계없이 메모리 사용량 일정 (MySQL 드라이버는 .iterator()도 결과 전체를 받아오므로 키셋 사용)
+- 기간 / 액션 필터는 모두 SQL 조건으로 처리
+"""
+import csv
+import json
+
+from django.db.models import Q
+
+from db_model.models import Log
+
+BATCH_SIZE = 2000
+
+COLUMNS = ['log_id', 'created_date', 'action', 'user_name', 'task_id', 'task_name', 'content', 'count']
+FIELDS = ('log_id', 'created_date', 'action', 'user__name', 'task_id', 'task_name', 'content', 'payload')
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 의사(pseudo) 버퍼"""
+    def write(self, value):
+        return value
+
+
+def iter_project_logs(project_id, start=None, end=None, actions=None):
+    """
+    프로젝트 로그 (오래된 순) 행 생성기
+
+    Args:
+        start / end: created_date 범위 [start, end)
+        actions: 액션 목록 (None이면 전체)
+    """
+    qs = Log.objects.filter(project_id=project_id)
+    if start:
+        qs = qs.filter(created_date__gte=start)
+    if end:
+        qs = qs.filter(created_date__lt=end)
+    if actions:
+        qs = qs.filter(action__in=actions)
+    qs = qs.order_by('created_date', 'log_id').values(*FIELDS)
+
+    last = None
+    while True:
+        batch = qs
+        if last:
+            batch = qs.filter(
+                Q(created_date__gt=last['created_date']) |
+                Q(created_date=last['created_date'], log_id__gt=last['log_id'])
+            )
+        rows = list(batch[:BATCH_SIZE])
+        if not rows:
+            return
+        yield from rows
+        last = rows[-1]
+
+
+def _row(log):
+    payload = log['payload'] or {}
+    return {
+        'log_id': log['log_id'],
+        'created_date': log['created_date'].strftime("%Y-%m-%d %H:%M:%S"),
+        'action': log['action'],
+        'user_name': log['user__name'] or "알 수 없음",
+        'task_id': log['task_id'],
+        'task_name': log['task_name'],
+        'content': log['content'],
+        'count': payload.get('count', 1),
+    }
+
+
+def iter_log_csv(project_id, **filters):
+    writer = csv.writer(_Echo())
+    yield '\ufeff' + writer.writerow(COLUMNS)  # Excel 한글 깨짐 방지 BOM
+    for log in iter_project_logs(project_id, **filters):
+        row = _row(log)
+        yield writer.writerow(['' if row[c] is None else row[c] for c in COLUMNS])
+
+
+def iter_log_ndjson(project_id, **filters):
+    """한 줄에 로그 1건 (자동 로그 요약 행은 payload 포함)"""
+    for log in iter_project_logs(project_id, **filters):
+        row = _row(log)
+        if log['payload']:
+            row['payload'] = log['payload']
+        yield json.dumps(row, ensure_ascii=False) + '\n'
@@ -0,0 +1,110 @@
+"""
+활동 로그 버퍼 (create_log 백엔드)
+- 로그를 바로 INSERT하지 않고 메모리 버퍼에 모았다가 bulk_create로 한 번에 저장
+- 트랜잭션 안에서 기록된 로그는 커밋 후에 버퍼로 이동 (롤백되면 버려짐)
+- 버퍼가 LOG_BUFFER_SIZE개 이상이거나 LOG_FLUSH_INTERVAL초가 지나면 백그라운드 스레드가 저장
+- 프로세스 종료 시(atexit) 남은 로그 저장
+- 일괄 저장 실패 시 행 단위 저장으로 대체, LOG_BUFFERING=0이면 항상 즉시 저장(동기)
+- bulk_create는 post_save를 보내지 않으므로 저장 후 logs_flushed 시그널 발송
+"""
+import atexit
+import logging
+import os
+import threading
+
+from django.db import IntegrityError, close_old_connections, transaction
+from django.dispatch import Signal
+
+from db_model.models import Log
+
+logger = logging.getLogger(__name__)
+
+BUFFERING = os.getenv("LOG_BUFFERING", "1") != "0"
+BUFFER_SIZE = int(os.getenv("LOG_BUFFER_SIZE", "200"))
+FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "1.0"))
+
+# 일괄 저장 완료 (kwargs: logs = 저장된 Log 목록)
+logs_flushed = Signal()
+
+
+def _save_one(log):
+    """동기 저장 (삭제된 업무/댓글을 가리키면 연결만 끊고 저장)"""
+    try:
+        log.save(force_insert=True)
+    except IntegrityError:
+        log.task = None
+        log.comment = None
+        log.save(force_insert=True)
+
+
+class LogBuffer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = []
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def _ensure_thread(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name="log-buffer", daemon=True)
+            self.thread.start()
+
+    def _enqueue(self, log):
+        with self.lock:
+            self.entries.append(log)
+            self._ensure_thread()
+            if len(self.entries) >= BUFFER_SIZE:
+                self.wakeup.set()
+
+    def add(self, log):
+        """로그 추가 (트랜잭션 안이면 커밋 후 버퍼로 이동)"""
+        if not BUFFERING:
+            _save_one(log)
+            return
+        transaction.on_commit(lambda: self._enqueue(log))
+
+    def flush(self):
+        """버퍼의 로그 일괄 저장 → 저장된 수"""
+        with self.lock:
+            batch, self.entries = self.entries, []
+        if not batch:
+            return 0
+
+        try:
+            Log.objects.bulk_create(batch, batch_size=BUFFER_SIZE)
+        except Exception as e:
+            logger.warning(f"로그 일괄 저장 실패, 행 단위로 재시도 ({len(batch)}건): {e}")
+            saved = []
+            for log in batch:
+                try:
+                    _save_one(log)
+                    saved.append(log)
+                except Exception as e:
+                    logger.error(f"❌ Failed to create log: {e} (action={log.action}, content={log.content})")
+            batch = saved
+
+        if batch:
+            logs_flushed.send(sender=Log, logs=batch)
+        return len(batch)
+
+    def _run(self):
+        while True:
+            self.wakeup.wait(FLUSH_INTERVAL)
+            self.wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("로그 버퍼 저장 실패")
+            finally:
+                close_old_connections()
+
+
+log_buffer = LogBuffer()
+
+
+def flush_logs():
+    """버퍼에 남은 로그 즉시 저장 (관리 명령 종료 전 등 저장 시점을 보장해야 할 때)"""
+    return log_buffer.flush()
+
+
+atexit.register(flush_logs)
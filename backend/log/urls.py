@@ -1,8 +1,10 @@
 # backend/Log/urls.py
 from django.urls import path
-from .views import get_project_logs
+from .views import get_project_logs, export_project_logs
 
 urlpatterns = [
     # /api/projects/<project_id>/logs/
     path("projects/<int:project_id>/logs/", get_project_logs),
+    # /api/projects/<project_id>/logs/export/?type=csv|ndjson&from=&to=&action=
+    path("projects/<int:project_id>/logs/export/", export_project_logs),
 ]
@@ -1,84 +1,116 @@
+from datetime import date, datetime, timedelta
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from django.db.models import Q, F
 from django.contrib.auth.models import AnonymousUser
-from db_model.models import Log, TaskManager
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from db_model.models import Log, ProjectMember
+from users.pagination import keyset_page
+from .export import iter_log_csv, iter_log_ndjson
+from .sink import log_buffer
+
+LOG_PAGE_SIZE = 100
+MAX_LOG_PAGE_SIZE = 200
 
 # ──────────────────────────────────────────
 # ① 프로젝트별 로그 조회 (개선됨)
 # ──────────────────────────────────────────
+def project_log_page(project_id, before=None, limit=LOG_PAGE_SIZE):
+    """
+    프로젝트 활동 로그 한 페이지 (최신순 키셋)
+    - (project_id, created_date) 인덱스 범위 조회 한 번 (프로젝트 업무 수와 무관)
+    - 삭제된 업무의 로그도 Log.project_id / task_name 스냅샷으로 포함
+
+    Returns:
+        (rows, next_cursor), 커서 형식 오류 시 ValueError
+    """
+    limit = max(1, min(int(limit), MAX_LOG_PAGE_SIZE))
+    qs = Log.objects.filter(project_id=project_id).select_related("user")
+    return keyset_page(qs, "created_date", "log_id", before, limit)
+
+
 @api_view(["GET"])
 def get_project_logs(request, project_id):
     """
-    프로젝트와 관련된 모든 로그 조회
-    1. Task가 존재하고 해당 프로젝트에 속한 경우
-    2. Task가 삭제되었지만 해당 프로젝트의 Task였던 경우
-    
+    프로젝트와 관련된 모든 로그 조회 (삭제된 업무의 로그 포함)
+
+    Query Params:
+        before: 이전 응답의 next_cursor (없으면 최신부터)
+        limit: 페이지 크기 (기본 100, 최대 200)
+
     ✅ 개선사항:
-    - content__icontains 제거 (성능 문제)
-    - TaskManager 기반으로 프로젝트 소속 Task ID 먼저 수집
-    - 삭제된 Task도 정확하게 추적
+    - 프로젝트 업무 ID 전체를 IN 목록으로 조회하던 방식 → project_id 인덱스 범위 조회
+    - 업무명은 기록 시점 스냅샷 컬럼 사용 (content 정규식 파싱 제거)
+    - 커서 기반 페이지네이션
     """
     try:
-        # 1. 해당 프로젝트에 속한 모든 Task ID 수집 (현재 + 과거)
-        project_task_ids = set(
-            TaskManager.objects
-            .filter(project_id=project_id)
-            .values_list('task_id', flat=True)
-        )
-        
-        # 2. 로그 조회: 해당 Task ID들과 연결된 로그만 가져오기
-        logs = (
-            Log.objects
-            .filter(
-                Q(task_id__in=project_task_ids) |  # Task가 있는 경우
-                Q(task_id__isnull=True)             # Task가 삭제된 경우도 포함
-            )
-            .select_related("user", "task")
-            .order_by("-created_date")[:100]  # 최신 100개
+        rows, next_cursor = project_log_page(
+            project_id,
+            before=request.GET.get("before"),
+            limit=request.GET.get("limit", LOG_PAGE_SIZE),
         )
+    except ValueError:
+        return Response({"error": "잘못된 커서 또는 limit 값입니다."}, status=400)
+
+    try:
+        data = [{
+            "log_id": log.log_id,
+            "created_date": log.created_date.strftime("%Y-%m-%d %H:%M:%S"),
+            "action": log.action,
+            "content": log.content,
+            "user_name": log.user.name if log.user else "알 수 없음",
+            "task_name": log.task_name or (None if log.payload else "삭제된 업무"),
+            "count": log.payload["count"] if log.payload else 1,  # 자동 로그 묶음 요약 행은 묶인 건수
+        } for log in rows]
+        return Response({"items": data, "next_cursor": next_cursor}, status=200)
 
-        data = []
-        for log in logs:
-            # Task가 삭제되었는지 확인
-            task_name = log.task.task_name if log.task else None
-            
-            # Task가 None이고 content에 스냅샷이 있으면 파싱
-            if not task_name and log.content:
-                task_name = _parse_task_name_from_snapshot(log.content)
-            
-            data.append({
-                "log_id": log.log_id,
-                "created_date": log.created_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "action": log.action,
-                "content": log.content,
-                "user_name": log.user.name if log.user else "알 수 없음",
-                "task_name": task_name or "삭제된 업무",
-            })
-            
-        return Response(data, status=200)
-        
     except Exception as e:
         print(f"❌ Log Error: {e}")
         return Response({"error": str(e)}, status=500)
 
 
-def _parse_task_name_from_snapshot(content):
+@api_view(["GET"])
+def export_project_logs(request, project_id):
     """
-    로그 content에서 업무명 추출
-    예: "[task_id=123] 백엔드 API 개발 업무가 삭제됨" → "백엔드 API 개발"
+    프로젝트 활동 로그 전체 스트리밍 내보내기 (프로젝트 멤버만)
+
+    Query Params:
+        type: csv(기본) | ndjson
+        from / to: 기간 (YYYY-MM-DD, to 포함)
+        action: 액션 필터 (여러 번 지정 가능)
     """
-    import re
-    match = re.match(r'^\[task_id=\d+\]\s*(.+?)\s*(업무가\s*삭제됨|업무\s*생성)?$', content)
-    if match:
-        return match.group(1).strip()
-    return None
+    session_uid = request.session.get("user_id")
+    if not session_uid:
+        return Response({"error": "로그인이 필요합니다."}, status=401)
+    if not ProjectMember.objects.filter(user_id=session_uid, project_id=project_id).exists():
+        return Response({"error": "권한이 없습니다."}, status=403)
+
+    export_type = request.GET.get("type", "csv")
+    if export_type not in ("csv", "ndjson"):
+        return Response({"error": "type은 csv 또는 ndjson이어야 합니다."}, status=400)
+    try:
+        start = date.fromisoformat(request.GET["from"]) if request.GET.get("from") else None
+        end = date.fromisoformat(request.GET["to"]) + timedelta(days=1) if request.GET.get("to") else None
+    except ValueError:
+        return Response({"error": "from/to는 YYYY-MM-DD 형식이어야 합니다."}, status=400)
+
+    filters = {
+        "start": datetime.combine(start, datetime.min.time()) if start else None,
+        "end": datetime.combine(end, datetime.min.time()) if end else None,
+        "actions": request.GET.getlist("action") or None,
+    }
+    if export_type == "ndjson":
+        response = StreamingHttpResponse(iter_log_ndjson(project_id, **filters), content_type="application/x-ndjson; charset=utf-8")
+    else:
+        response = StreamingHttpResponse(iter_log_csv(project_id, **filters), content_type="text/csv; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="project_{project_id}_logs.{export_type}"'
+    return response
 
 
 # ──────────────────────────────────────────
 # ② 공통 로그 기록 함수 (Service Layer)
 # ──────────────────────────────────────────
-def create_log(action, content, user=None, task=None, comment=None):
+def create_log(action, content, user=None, task=None, comment=None, project_id=None, task_name=None):
     """
     로그 생성 헬퍼 함수
     
@@ -88,14 +120,17 @@ def create_log(action, content, user=None, task=None, comment=None):
         user: User 객체 (None 가능)
         task: Task 객체 (None 가능)
         comment: Comment 객체 (None 가능)
+        project_id: 프로젝트 ID (생략 시 task의 프로젝트)
+        task_name: 업무명 스냅샷 (생략 시 task의 현재 업무명)
     
     Returns:
-        Log 객체 또는 None (실패 시)
+        Log 객체 (버퍼에 적재, 저장 전이면 log_id 없음) 또는 None (실패 시)
     
     ✅ 개선사항:
     - AnonymousUser 처리
     - PK 없는 객체 방어 로직
     - 에러 로깅 개선
+    - 요청마다 INSERT하지 않고 로그 버퍼(log/sink.py)에 적재 → 커밋 후 일괄 저장
     """
     # 인증되지 않은 유저(AnonymousUser)는 None으로 처리
     if isinstance(user, AnonymousUser):
@@ -106,13 +141,18 @@ def create_log(action, content, user=None, task=None, comment=None):
         user = None
 
     try:
-        return Log.objects.create(
+        log = Log(
             action=action,
             content=content,
             user=user,
             task=task,
             comment=comment,
+            project_id=project_id or (task.project_id if task else None),
+            task_name=task_name or (task.task_name if task else None),
+            created_date=timezone.now(),  # 저장 시점이 아닌 발생 시점 기록
         )
+        log_buffer.add(log)
+        return log
     except Exception as e:
         print(f"❌ Failed to create log: {e}")
         print(f"   - action: {action}")
@@ -0,0 +1,139 @@
+"""
+템플릿 프로젝트 복제
+- 업무 트리 / 담당자 / 선후행 관계 / 프로젝트 일정을 집합 단위 INSERT로 복사
+- 상위 업무 ID는 메모리에서 재매핑 (행 단위 save() 없음), 전체 단일 트랜잭션
+"""
+from datetime import timedelta
+
+from django.db import transaction
+
+from db_model.models import (
+    Project, ProjectMember, Task, TaskStatus, TaskManager, TaskDependency, Schedule
+)
+from log.views import create_log
+from .utils import bulk_create_with_pk, touch_project_tasks
+from .stats import refresh_project_aggregates
+from .signals import tasks_bulk_saved
+
+BATCH_SIZE = 500
+TASK_FIELDS = ['task_id', 'parent_task_id', 'task_name', 'status', 'start_date', 'end_date',
+               'description', 'required_skills']
+
+
+def clone_project(source_id, project_name, log_user=None, start_date=None, keep_status=False):
+    """
+    프로젝트 복제
+
+    Args:
+        source_id: 원본(템플릿) 프로젝트 ID
+        project_name: 새 프로젝트 이름
+        log_user: 복제를 요청한 사용자 (새 프로젝트에 원본 멤버가 없으면 팀장으로 추가)
+        start_date: 새 프로젝트 시작일 (date). 지정 시 원본의 가장 이른 시작일 기준으로 전체 일정 이동
+        keep_status: True면 업무 상태 유지, False면 모두 요청(0)으로 초기화
+
+    Returns:
+        dict: {'project_id', 'tasks', 'assignments', 'dependencies', 'schedules'}
+    """
+    source_tasks = list(
+        Task.objects.filter(project_id=source_id).order_by('task_id').values(*TASK_FIELDS)
+    )
+
+    shift = timedelta(0)
+    if start_date and source_tasks:
+        earliest = min(t['start_date'] for t in source_tasks if t['start_date'])
+        shift = timedelta(days=(start_date - earliest.date()).days)
+
+    with transaction.atomic():
+        project = Project.objects.create(project_name=project_name)
+
+        # 1. 멤버
+        members = list(ProjectMember.objects.filter(project_id=source_id).values_list('user_id', 'role'))
+        if log_user and log_user.user_id not in {uid for uid, _ in members}:
+            members.append((log_user.user_id, 1))
+        ProjectMember.objects.bulk_create(
+            [ProjectMember(user_id=uid, project=project, role=role) for uid, role in members],
+            batch_size=BATCH_SIZE,
+        )
+
+        # 2. 업무 (상위 연결 없이 INSERT → ID 재매핑 후 상위만 bulk_update)
+        new_tasks = [
+            Task(
+                project=project,
+                task_name=t['task_name'],
+                status=t['status'] if keep_status else TaskStatus.REQUESTED,
+                start_date=t['start_date'] + shift if t['start_date'] else None,
+                end_date=t['end_date'] + shift if t['end_date'] else None,
+                description=t['description'],
+                required_skills=t['required_skills'],
+            )
+            for t in source_tasks
+        ]
+        bulk_create_with_pk(Task, new_tasks, batch_size=BATCH_SIZE)
+        id_map = {t['task_id']: new.task_id for t, new in zip(source_tasks, new_tasks)}
+
+        linked = []
+        for t, new in zip(source_tasks, new_tasks):
+            parent_id = id_map.get(t['parent_task_id'])
+            if parent_id:
+                new.parent_task_id = parent_id
+                linked.append(new)
+        Task.objects.bulk_update(linked, ['parent_task'], batch_size=BATCH_SIZE)
+
+        # 3. 담당자
+        assignments = [
+            TaskManager(user_id=uid, project=project, task_id=id_map[tid])
+            for uid, tid in (
+                TaskManager.objects
+                .filter(project_id=source_id, task_id__in=id_map.keys())
+                .values_list('user_id', 'task_id')
+            )
+        ]
+        TaskManager.objects.bulk_create(assignments, batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+        # 4. 선후행 관계
+        dependencies = [
+            TaskDependency(predecessor_id=id_map[pred], successor_id=id_map[succ], lag_days=lag)
+            for pred, succ, lag in (
+                TaskDependency.objects
+                .filter(predecessor_id__in=id_map.keys(), successor_id__in=id_map.keys())
+                .values_list('predecessor_id', 'successor_id', 'lag_days')
+            )
+        ]
+        TaskDependency.objects.bulk_create(dependencies, batch_size=BATCH_SIZE)
+
+        # 5. 프로젝트 일정
+        schedule_shift = timedelta(days=shift.days)
+        schedules = [
+            Schedule(
+                user_id=s['user_id'],
+                project=project,
+                title=s['title'],
+                start_time=s['start_time'] + schedule_shift,
+                end_time=s['end_time'] + schedule_shift,
+                location=s['location'],
+                description=s['description'],
+            )
+            for s in Schedule.objects.filter(project_id=source_id).values(
+                'user_id', 'title', 'start_time', 'end_time', 'location', 'description'
+            )
+        ]
+        Schedule.objects.bulk_create(schedules, batch_size=BATCH_SIZE)
+
+        create_log(
+            action="프로젝트 복제",
+            content=f"[project_id={source_id}] → [project_id={project.project_id}] {project_name} (업무 {len(new_tasks)}개)",
+            user=log_user,
+            project_id=project.project_id,
+        )
+
+    touch_project_tasks(project.project_id)
+    refresh_project_aggregates(project.project_id)
+    tasks_bulk_saved.send(sender=Task, task_ids=[t.task_id for t in new_tasks])
+
+    return {
+        'project_id': project.project_id,
+        'tasks': len(new_tasks),
+        'assignments': len(assignments),
+        'dependencies': len(dependencies),
+        'schedules': len(schedules),
+    }
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from log.compaction import compact_logs, age_out_details, DETAIL_RETENTION_DAYS
+
+
+class Command(BaseCommand):
+    help = "자동 로그(일정 자동 조정, 상태 자동 변경) 묶음을 요약 행으로 압축하고 오래된 상세 제거 (주기적으로 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, action='append', dest='projects',
+                            help="특정 프로젝트만 압축 (여러 번 지정 가능)")
+        parser.add_argument('--detail-days', type=int, default=DETAIL_RETENTION_DAYS,
+                            help=f"요약 행 상세 보관 기간 (일, 기본값: {DETAIL_RETENTION_DAYS})")
+
+    def handle(self, *args, **options):
+        summaries, removed = compact_logs(project_ids=options['projects'])
+        aged = age_out_details(options['detail_days'])
+        self.stdout.write(self.style.SUCCESS(
+            f"자동 로그 {removed}건 → 요약 {summaries}건으로 압축, 오래된 상세 {aged}건 정리 완료"
+        ))
@@ -0,0 +1,23 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.snapshots import record_all_snapshots
+
+
+class Command(BaseCommand):
+    help = "프로젝트별 업무 상태 일자 스냅샷 기록 (번다운/속도 차트용, 하루 1회 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help="기록할 날짜 (YYYY-MM-DD, 기본값: 오늘)")
+        parser.add_argument('--project', type=int, action='append', dest='projects',
+                            help="특정 프로젝트만 기록 (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        try:
+            day = date.fromisoformat(options['date']) if options['date'] else date.today()
+        except ValueError:
+            raise CommandError("--date must be YYYY-MM-DD")
+
+        count = record_all_snapshots(day, options['projects'])
+        self.stdout.write(self.style.SUCCESS(f"{day} 스냅샷 {count}개 프로젝트 기록 완료"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from tasks.stats import refresh_all_project_stats
+
+
+class Command(BaseCommand):
+    help = "프로젝트별 업무 집계(ProjectStats) 재계산 (초기 적재 및 불일치 복구용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, action='append', dest='projects',
+                            help="특정 프로젝트만 재계산 (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        count = refresh_all_project_stats(options['projects'])
+        self.stdout.write(self.style.SUCCESS(f"프로젝트 집계 {count}개 갱신 완료"))
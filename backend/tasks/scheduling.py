@@ -0,0 +1,203 @@
+"""
+업무 선후행(Finish-to-Start) 일정 전파 엔진
+- 날짜가 바뀐 업무에서 출발해 영향받는 하류(downstream) DAG 영역만 조회
+- 위상 정렬 순서로 후행 업무 시작일을 밀어내고 변경분만 bulk_update
+- 밀려난 업무의 하위 업무도 함께 이동하고, 그 하위 업무의 후행까지 이어서 전파
+- 순환 의존성 감지
+"""
+from collections import defaultdict, deque
+from datetime import timedelta
+
+from django.db import transaction
+
+from db_model.models import Task, TaskDependency
+from log.views import create_log
+from .utils import auto_adjust_subtask_dates, touch_project_tasks
+from .stats import refresh_project_stats
+from .signals import tasks_bulk_saved
+
+
+class DependencyCycleError(Exception):
+    """선후행 관계에 순환이 존재할 때 발생"""
+
+
+def would_create_cycle(predecessor_id, successor_id):
+    """
+    predecessor → successor 관계를 추가하면 순환이 생기는지 검사
+
+    successor에서 후행 방향으로 도달 가능한 업무 중 predecessor가 있으면 순환
+    """
+    if predecessor_id == successor_id:
+        return True
+
+    visited = {successor_id}
+    frontier = [successor_id]
+    while frontier:
+        next_ids = set(
+            TaskDependency.objects
+            .filter(predecessor_id__in=frontier)
+            .values_list('successor_id', flat=True)
+        )
+        if predecessor_id in next_ids:
+            return True
+        frontier = list(next_ids - visited)
+        visited.update(frontier)
+    return False
+
+
+def _collect_downstream(seed_ids):
+    """
+    seed 업무들에서 후행 방향으로 도달 가능한 업무 ID 집합 (seed 제외)
+    깊이(level)당 쿼리 1회
+    """
+    seeds = set(seed_ids)
+    region = set()
+    frontier = list(seeds)
+    while frontier:
+        next_ids = set(
+            TaskDependency.objects
+            .filter(predecessor_id__in=frontier)
+            .values_list('successor_id', flat=True)
+        )
+        frontier = list(next_ids - region - seeds)
+        region.update(frontier)
+    return region
+
+
+def _topological_order(nodes, edges):
+    """
+    Kahn 알고리즘으로 region 내부 위상 정렬
+    처리하지 못한 노드가 남으면 순환으로 판단
+    """
+    indegree = {n: 0 for n in nodes}
+    out_edges = defaultdict(list)
+    for pred_id, succ_id in edges:
+        if pred_id in indegree and succ_id in indegree:
+            indegree[succ_id] += 1
+            out_edges[pred_id].append(succ_id)
+
+    queue = deque(sorted(n for n, d in indegree.items() if d == 0))
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for succ_id in out_edges[node]:
+            indegree[succ_id] -= 1
+            if indegree[succ_id] == 0:
+                queue.append(succ_id)
+
+    if len(order) != len(indegree):
+        raise DependencyCycleError("업무 선후행 관계에 순환이 있습니다.")
+    return order
+
+
+def _shift_downstream(seeds, log_user):
+    """
+    seeds에서 후행 방향으로 1회 전파 (변경분 bulk_update + 로그)
+
+    Returns:
+        list: [(이동한 Task, 이동 기간 timedelta)]
+    """
+    region = _collect_downstream(seeds)
+    if not region:
+        return []
+
+    # region 업무로 들어오는 모든 선행 관계 (region 밖 선행 업무 포함)
+    incoming = list(
+        TaskDependency.objects
+        .filter(successor_id__in=region)
+        .values_list('predecessor_id', 'successor_id', 'lag_days')
+    )
+    pred_ids = {pred_id for pred_id, _, _ in incoming}
+
+    tasks = Task.objects.only('task_id', 'project_id', 'start_date', 'end_date').in_bulk(region | pred_ids)
+
+    preds_of = defaultdict(list)
+    for pred_id, succ_id, lag in incoming:
+        preds_of[succ_id].append((pred_id, lag))
+
+    order = _topological_order(region | seeds, [(p, s) for p, s, _ in incoming])
+
+    moved = set(seeds)
+    updated = []
+    for task_id in order:
+        if task_id in seeds:
+            continue
+        links = preds_of.get(task_id, [])
+        if not any(pred_id in moved for pred_id, _ in links):
+            continue
+
+        task = tasks.get(task_id)
+        if task is None:
+            continue
+
+        required_start = max(
+            tasks[pred_id].end_date + timedelta(days=lag)
+            for pred_id, lag in links if pred_id in tasks
+        )
+        if task.start_date >= required_start:
+            continue
+
+        shift = required_start - task.start_date
+        task.start_date += shift
+        task.end_date += shift
+        moved.add(task_id)
+        updated.append((task, shift))
+
+    if not updated:
+        return []
+
+    with transaction.atomic():
+        Task.objects.bulk_update([t for t, _ in updated], ['start_date', 'end_date'], batch_size=100)
+        for task, shift in updated:
+            create_log(
+                action="일정 자동 조정",
+                content=f"선행 업무 일정 변경에 따라 자동 조정됨 ({shift.days:+d}일)",
+                user=log_user,
+                task=task
+            )
+    return updated
+
+
+def propagate_schedule(changed_task_ids, log_user=None):
+    """
+    날짜가 변경된 업무들의 후행 업무 일정 전파 (증분 방식)
+
+    후행 업무 시작일이 (선행 업무 종료일 + lag_days)보다 이르면
+    기간을 유지한 채 뒤로 이동시킨다. 실제로 이동한 업무의 후행만 다시 검사한다.
+    이동한 업무에 하위 업무가 있으면 같은 일수만큼 옮기고, 옮긴 하위 업무에서 다시 전파한다.
+    (업무마다 하위 이동은 1회만 → 상하위·선후행이 얽힌 구조에서도 종료)
+
+    Args:
+        changed_task_ids: 날짜가 변경된 업무 ID 목록 (함께 옮겨진 하위 업무 포함)
+        log_user: 로그 기록할 사용자
+
+    Returns:
+        list: 일정이 자동 조정된 업무 task_id 리스트
+    """
+    seeds = set(changed_task_ids)
+    adjusted_parents = set()
+    bulk_updated = {}   # 선후행 전파로 이동 (bulk_update)
+    subtask_ids = []    # 상위 이동에 따라 이동 (save → 시그널 발생)
+    while seeds:
+        updated = _shift_downstream(seeds, log_user)
+        seeds = set()
+        for task, shift in updated:
+            bulk_updated[task.task_id] = task
+            if task.task_id in adjusted_parents or not shift.days:
+                continue
+            adjusted_parents.add(task.task_id)
+            moved = auto_adjust_subtask_dates(task, shift.days, log_user)
+            subtask_ids.extend(moved)
+            seeds.update(moved)
+
+    if not bulk_updated:
+        return []
+
+    # bulk_update는 post_save 시그널을 보내지 않으므로 직접 버전·집계 갱신
+    for project_id in {task.project_id for task in bulk_updated.values() if task.project_id}:
+        touch_project_tasks(project_id)
+        refresh_project_stats(project_id)
+
+    tasks_bulk_saved.send(sender=Task, task_ids=list(bulk_updated))
+    return list(dict.fromkeys([*bulk_updated, *subtask_ids]))
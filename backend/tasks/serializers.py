@@ -1,12 +1,14 @@
 # tasks/serializers.py
 from rest_framework import serializers
 from db_model.models import Task, TaskManager
+from db_model.sparse import SparseFieldsMixin
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     업무(Task) Serializer
     - assignee: TaskManager를 통해 단일 담당자 이름 반환 (프론트엔드 호환)
     - assignees: TaskManager를 통해 모든 담당자 이름 리스트 반환
+    - ?fields= / ?omit= 로 응답 필드 선택 (SparseFieldsMixin)
     """
     assignee = serializers.SerializerMethodField()
     assignees = serializers.SerializerMethodField()
@@ -14,6 +16,7 @@ class TaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = '__all__'
+        sparse_requires = {'assignee': [], 'assignees': []}
 
     def get_assignee(self, obj):
         """
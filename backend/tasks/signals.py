@@ -0,0 +1,30 @@
+"""
+업무(Task) 변경 시그널 수신기
+- Task / TaskManager 저장·삭제 시 프로젝트 업무 버전 갱신 (캐시 무효화용)
+- Task 저장·삭제 시 프로젝트 집계(ProjectStats) 갱신 예약
+- tasks_bulk_saved: bulk_create/bulk_update처럼 post_save가 없는 일괄 저장 후 발송
+  (kwargs: task_ids) → 다른 앱이 업무 단위 후처리를 할 수 있도록
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver, Signal
+
+from db_model.models import Task, TaskManager
+from .utils import touch_project_tasks
+from .stats import schedule_stats_refresh
+
+tasks_bulk_saved = Signal()
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=TaskManager)
+@receiver(post_delete, sender=TaskManager)
+def on_task_changed(sender, instance, **kwargs):
+    if instance.project_id:
+        touch_project_tasks(instance.project_id)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def on_task_stats_changed(sender, instance, **kwargs):
+    schedule_stats_refresh(instance.project_id)
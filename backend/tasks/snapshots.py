@@ -0,0 +1,160 @@
+"""
+프로젝트 일자별 업무 상태 스냅샷
+- 업무 저장·삭제 시 해당 프로젝트의 오늘 스냅샷 갱신 (tasks/stats.py에서 집계와 함께 커밋 시점에 처리)
+- 관리 명령(record_project_snapshots)으로 전체 프로젝트 일괄 기록
+- 번다운/속도 시리즈는 스냅샷만 읽어서 계산 (Log 재생 없음)
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db import connection
+from django.db.models import Count
+
+from db_model.models import Project, Task, TaskStatus, ProjectDailySnapshot
+
+STATUS_FIELDS = {
+    TaskStatus.REQUESTED: 'requested_count',
+    TaskStatus.IN_PROGRESS: 'in_progress_count',
+    TaskStatus.FEEDBACK: 'feedback_count',
+    TaskStatus.DONE: 'done_count',
+}
+COUNT_FIELDS = ['total_count', *STATUS_FIELDS.values()]
+
+
+def _counts_from_rows(rows):
+    """(status, cnt) 목록 → 스냅샷 필드 dict"""
+    counts = dict.fromkeys(COUNT_FIELDS, 0)
+    for status, cnt in rows:
+        counts['total_count'] += cnt
+        field = STATUS_FIELDS.get(status)
+        if field:
+            counts[field] += cnt
+    return counts
+
+
+def record_project_snapshot(project_id, day=None):
+    """
+    한 프로젝트의 스냅샷 기록 (같은 날짜는 덮어씀)
+
+    Returns:
+        ProjectDailySnapshot
+    """
+    day = day or date.today()
+    rows = (
+        Task.objects
+        .filter(project_id=project_id)
+        .values('status')
+        .annotate(cnt=Count('task_id'))
+        .values_list('status', 'cnt')
+    )
+    snapshot, _ = ProjectDailySnapshot.objects.update_or_create(
+        project_id=project_id,
+        snapshot_date=day,
+        defaults=_counts_from_rows(rows),
+    )
+    return snapshot
+
+
+def record_all_snapshots(day=None, project_ids=None):
+    """
+    전체(또는 지정) 프로젝트 스냅샷 일괄 기록
+    - 집계 쿼리 1회 + upsert(bulk_create update_conflicts) 1회
+    - 업무가 없는 프로젝트도 0으로 기록 (업무를 모두 지운 뒤 이전 스냅샷이 이어지지 않도록)
+
+    Returns:
+        int: 기록된 프로젝트 수
+    """
+    day = day or date.today()
+    qs = Task.objects.filter(project_id__isnull=False)
+    if project_ids is not None:
+        qs = qs.filter(project_id__in=project_ids)
+
+    rows_by_project = defaultdict(list)
+    for project_id, status, cnt in (
+        qs.values('project_id', 'status')
+        .annotate(cnt=Count('task_id'))
+        .values_list('project_id', 'status', 'cnt')
+    ):
+        rows_by_project[project_id].append((status, cnt))
+
+    if project_ids is None:
+        project_ids = Project.objects.values_list('project_id', flat=True)
+    snapshots = [
+        ProjectDailySnapshot(project_id=pid, snapshot_date=day, **_counts_from_rows(rows_by_project.get(pid, [])))
+        for pid in project_ids
+    ]
+    if not snapshots:
+        return 0
+
+    options = {'update_conflicts': True, 'update_fields': COUNT_FIELDS}
+    if connection.features.supports_update_conflicts_with_target:
+        options['unique_fields'] = ['project', 'snapshot_date']
+    ProjectDailySnapshot.objects.bulk_create(snapshots, batch_size=500, **options)
+    return len(snapshots)
+
+
+def _daily_series(project_id, start, end):
+    """start~end 일자별 스냅샷 (빈 날짜는 직전 스냅샷으로 채움)"""
+    rows = list(
+        ProjectDailySnapshot.objects
+        .filter(project_id=project_id, snapshot_date__lte=end)
+        .order_by('snapshot_date')
+        .values('snapshot_date', *COUNT_FIELDS)
+    )
+    by_day = {r['snapshot_date']: r for r in rows}
+    last = next((r for r in reversed(rows) if r['snapshot_date'] < start), None)
+
+    series = []
+    day = start
+    while day <= end:
+        last = by_day.get(day, last)
+        series.append((day, last))
+        day += timedelta(days=1)
+    return series
+
+
+def burndown_series(project_id, days=30, end=None):
+    """
+    번다운 시리즈 (남은 업무 = 전체 - 완료)
+
+    Returns:
+        dict: {'dates', 'total', 'done', 'remaining'} (스냅샷 없는 날은 None)
+    """
+    end = end or date.today()
+    start = end - timedelta(days=days - 1)
+    series = _daily_series(project_id, start, end)
+
+    def pick(row, key):
+        return row[key] if row else None
+
+    return {
+        'dates': [d.isoformat() for d, _ in series],
+        'total': [pick(r, 'total_count') for _, r in series],
+        'done': [pick(r, 'done_count') for _, r in series],
+        'remaining': [r['total_count'] - r['done_count'] if r else None for _, r in series],
+    }
+
+
+def velocity_series(project_id, weeks=8, end=None):
+    """
+    주간 속도 시리즈 (주마다 새로 완료된 업무 수)
+
+    Returns:
+        dict: {'week_ends', 'completed'}
+    """
+    end = end or date.today()
+    start = end - timedelta(weeks=weeks)
+    series = _daily_series(project_id, start, end)
+
+    week_ends, completed = [], []
+    prev_done = series[0][1]['done_count'] if series[0][1] else None
+    for i in range(7, len(series), 7):
+        day, row = series[i]
+        done = row['done_count'] if row else None
+        if prev_done is None:
+            # 범위 이전 스냅샷이 없으면 이 주의 첫 스냅샷을 기준으로 (기록 전에 누적된 완료를 속도로 세지 않음)
+            prev_done = next((r['done_count'] for _, r in series[i - 6:i + 1] if r), None)
+        week_ends.append(day.isoformat())
+        completed.append(max(done - prev_done, 0) if done is not None and prev_done is not None else 0)
+        prev_done = done
+    return {'week_ends': week_ends, 'completed': completed}
@@ -0,0 +1,362 @@
+"""
+업무 CSV/XLSX 가져오기 · CSV 내보내기
+- 가져오기: 파일을 행 단위 스트리밍으로 읽고 BATCH_SIZE 행마다
+  Task / TaskManager를 bulk_create (배치당 쿼리 수 고정)
+- 상위 업무는 key / parent_key 컬럼으로 메모리에서 연결 (자기 참조·순환 행은 연결하지 않고 오류로 보고)
+- 내보내기: task_id 기준 키셋 페이지네이션으로 배치 조회 후 스트리밍 출력
+"""
+import codecs
+import csv
+from datetime import date, datetime
+
+from django.db import transaction
+
+from db_model.models import Task, TaskStatus, TaskManager, User, ProjectMember
+from log.views import create_log
+from .utils import bulk_create_with_pk, touch_project_tasks
+from .stats import refresh_project_aggregates
+from .signals import tasks_bulk_saved
+
+BATCH_SIZE = 500
+MAX_ERRORS = 50
+
+COLUMNS = ['key', 'parent_key', 'task_name', 'status', 'start_date', 'end_date', 'assignees', 'description']
+
+# 스프레드시트에서 흔히 쓰는 한글 헤더 허용
+COLUMN_ALIASES = {
+    '키': 'key', '번호': 'key', 'task_id': 'key',
+    '상위': 'parent_key', '상위업무': 'parent_key', 'parent_task_id': 'parent_key',
+    '업무명': 'task_name', '상태': 'status',
+    '시작일': 'start_date', '종료일': 'end_date',
+    '담당자': 'assignees', 'assignee': 'assignees',
+    '설명': 'description',
+}
+
+STATUS_CODES = {label: value for value, label in TaskStatus.choices}
+
+
+class ImportFormatError(Exception):
+    """가져오기 파일 형식 오류"""
+
+
+# ──────────────────────────────────────────
+# 파일 → 행(dict) 스트리밍
+# ──────────────────────────────────────────
+def _normalize_header(header):
+    names = []
+    for h in header:
+        h = (str(h).strip() if h is not None else '')
+        names.append(COLUMN_ALIASES.get(h, h.lower()))
+    if 'task_name' not in names:
+        raise ImportFormatError("task_name(업무명) 컬럼이 필요합니다.")
+    return names
+
+
+def _iter_csv_rows(upload):
+    reader = csv.reader(codecs.iterdecode(upload, 'utf-8-sig'))
+    header = next(reader, None)
+    if header is None:
+        return
+    names = _normalize_header(header)
+    for values in reader:
+        yield dict(zip(names, values))
+
+
+def _iter_xlsx_rows(upload):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX 가져오기에는 openpyxl 패키지가 필요합니다.")
+
+    workbook = load_workbook(upload, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        names = _normalize_header(header)
+        for values in rows:
+            yield dict(zip(names, values))
+    finally:
+        workbook.close()
+
+
+def iter_upload_rows(upload):
+    """업로드 파일(CSV/XLSX)을 행 dict 단위로 순회"""
+    name = (upload.name or '').lower()
+    if name.endswith('.xlsx'):
+        return _iter_xlsx_rows(upload)
+    if name.endswith('.csv') or name.endswith('.txt'):
+        return _iter_csv_rows(upload)
+    raise ImportFormatError("CSV 또는 XLSX 파일만 지원합니다.")
+
+
+# ──────────────────────────────────────────
+# 값 변환
+# ──────────────────────────────────────────
+def _text(value):
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def _parse_status(value):
+    text = _text(value)
+    if not text:
+        return TaskStatus.REQUESTED
+    if text in STATUS_CODES:
+        return STATUS_CODES[text]
+    if text.endswith('.0'):  # XLSX 숫자 셀
+        text = text[:-2]
+    if text.isdigit() and int(text) in TaskStatus.values:
+        return int(text)
+    raise ValueError(f"알 수 없는 상태값: {text}")
+
+
+def _parse_date(value):
+    if value in (None, ''):
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    value = _text(value)
+    for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y/%m/%d", "%Y.%m.%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"날짜 형식 오류: {value}")
+
+
+def _split_names(value):
+    value = _text(value).replace(';', ',')
+    return [n.strip() for n in value.split(',') if n.strip()]
+
+
+# ──────────────────────────────────────────
+# 가져오기
+# ──────────────────────────────────────────
+class _TaskImporter:
+    def __init__(self, project_id, log_user):
+        self.project_id = project_id
+        self.log_user = log_user
+        self.key_map = {}          # 파일의 key → 생성된 task_id
+        self.parent_of = {}        # 이번 가져오기에서 연결한 task_id → 상위 task_id (순환 검사용)
+        self.pending_parents = []  # (line, task_id, parent_key): 상위가 뒤에 나오는 경우
+        self.user_ids = dict(
+            ProjectMember.objects
+            .filter(project_id=project_id)
+            .values_list('user__name', 'user_id')
+        )
+        self.created = 0
+        self.created_ids = []
+        self.errors = []
+
+    def _error(self, line, message):
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def _resolve_users(self, names):
+        unknown = set(names) - set(self.user_ids)
+        if unknown:
+            self.user_ids.update(
+                User.objects.filter(name__in=unknown).values_list('name', 'user_id')
+            )
+
+    def add_batch(self, rows):
+        """rows: [(line, row dict)] → Task/TaskManager 일괄 생성"""
+        tasks, metas = [], []
+        for line, row in rows:
+            name = _text(row.get('task_name'))
+            if not name:
+                self._error(line, "업무명이 비어 있습니다.")
+                continue
+            try:
+                fields = {
+                    'project_id': self.project_id,
+                    'task_name': name[:500],
+                    'status': _parse_status(row.get('status')),
+                    'description': _text(row.get('description')) or None,
+                }
+                start = _parse_date(row.get('start_date'))
+                end = _parse_date(row.get('end_date'))
+            except ValueError as e:
+                self._error(line, str(e))
+                continue
+            if start:
+                fields['start_date'] = start
+            if end:
+                fields['end_date'] = end
+
+            tasks.append(Task(**fields))
+            metas.append((
+                line,
+                _text(row.get('key')) or f"#{line}",
+                _text(row.get('parent_key')),
+                _split_names(row.get('assignees')),
+            ))
+
+        if not tasks:
+            return
+
+        self._resolve_users({n for _, _, _, names in metas for n in names})
+        bulk_create_with_pk(Task, tasks, batch_size=BATCH_SIZE)
+
+        linked, managers = [], []
+        for task, (line, key, parent_key, names) in zip(tasks, metas):
+            # 상위는 이 행의 key를 등록하기 전에 조회 (자기 자신을 상위로 연결하지 않도록)
+            if parent_key == key:
+                self._error(line, "자기 자신을 상위 업무로 지정할 수 없습니다.")
+            elif parent_key:
+                parent_id = self.key_map.get(parent_key)
+                if parent_id:
+                    # 이 행의 업무는 방금 생성되어 아직 하위가 없으므로 순환이 생기지 않음
+                    task.parent_task_id = parent_id
+                    self.parent_of[task.task_id] = parent_id
+                    linked.append(task)
+                else:
+                    self.pending_parents.append((line, task.task_id, parent_key))
+            self.key_map[key] = task.task_id
+
+            user_ids = [self.user_ids[n] for n in names if n in self.user_ids]
+            if not user_ids and self.log_user:
+                user_ids = [self.log_user.user_id]
+            for uid in dict.fromkeys(user_ids):
+                managers.append(TaskManager(user_id=uid, project_id=self.project_id, task_id=task.task_id))
+
+        if linked:
+            Task.objects.bulk_update(linked, ['parent_task'], batch_size=BATCH_SIZE)
+        TaskManager.objects.bulk_create(managers, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        self.created += len(tasks)
+        self.created_ids.extend(task.task_id for task in tasks)
+
+    def _creates_cycle(self, task_id, parent_id):
+        """parent_id의 상위를 따라 올라가다 task_id를 만나면 순환"""
+        while parent_id:
+            if parent_id == task_id:
+                return True
+            parent_id = self.parent_of.get(parent_id)
+        return False
+
+    def finish(self):
+        """
+        파일 뒤쪽에 나온 상위 업무 연결
+        순환(A → B → A)이 되는 행은 연결하지 않고 오류로 보고
+
+        Returns:
+            int: 상위를 찾지 못한 행 수
+        """
+        linked, unresolved = [], 0
+        for line, task_id, parent_key in self.pending_parents:
+            parent_id = self.key_map.get(parent_key)
+            if not parent_id:
+                unresolved += 1
+            elif self._creates_cycle(task_id, parent_id):
+                self._error(line, f"상위 업무 연결이 순환됩니다: {parent_key}")
+            else:
+                self.parent_of[task_id] = parent_id
+                linked.append(Task(task_id=task_id, parent_task_id=parent_id))
+        if linked:
+            Task.objects.bulk_update(linked, ['parent_task'], batch_size=BATCH_SIZE)
+        return unresolved
+
+
+def import_tasks(project_id, upload, log_user=None):
+    """
+    CSV/XLSX 파일에서 업무 일괄 가져오기 (전체 단일 트랜잭션)
+
+    Returns:
+        dict: {'created': 생성 수, 'unresolved_parents': 상위를 못 찾은 수, 'errors': [...]}
+    """
+    importer = _TaskImporter(project_id, log_user)
+
+    with transaction.atomic():
+        batch = []
+        # 헤더가 1행이므로 데이터는 2행부터
+        for line, row in enumerate(iter_upload_rows(upload), start=2):
+            if not any(_text(v) for v in row.values()):
+                continue
+            batch.append((line, row))
+            if len(batch) >= BATCH_SIZE:
+                importer.add_batch(batch)
+                batch = []
+        if batch:
+            importer.add_batch(batch)
+        unresolved = importer.finish()
+
+        if importer.created:
+            create_log(
+                action="업무 일괄 가져오기",
+                content=f"{upload.name}에서 업무 {importer.created}개 가져옴",
+                user=log_user,
+                project_id=project_id,
+            )
+
+    # bulk_create는 시그널을 보내지 않으므로 직접 갱신
+    if importer.created:
+        touch_project_tasks(project_id)
+        refresh_project_aggregates(project_id)
+        tasks_bulk_saved.send(sender=Task, task_ids=importer.created_ids)
+
+    return {
+        'created': importer.created,
+        'unresolved_parents': unresolved,
+        'errors': importer.errors,
+    }
+
+
+# ──────────────────────────────────────────
+# 내보내기
+# ──────────────────────────────────────────
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 의사(pseudo) 버퍼"""
+    def write(self, value):
+        return value
+
+
+def _format_dt(value):
+    return value.strftime("%Y-%m-%d") if value else ''
+
+
+def iter_export_rows(project_id):
+    """
+    프로젝트 업무 CSV 행 생성기 (헤더 포함)
+    task_id 키셋으로 BATCH_SIZE씩 조회하여 메모리 사용량 일정 유지 (배치당 쿼리 2회)
+    """
+    writer = csv.writer(_Echo())
+    yield '\ufeff' + writer.writerow(COLUMNS)  # Excel 한글 깨짐 방지 BOM
+
+    last_id = 0
+    while True:
+        rows = list(
+            Task.objects
+            .filter(project_id=project_id, task_id__gt=last_id)
+            .order_by('task_id')
+            .values_list('task_id', 'parent_task_id', 'task_name', 'status',
+                         'start_date', 'end_date', 'description')[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        assignees = {}
+        for task_id, name in (
+            TaskManager.objects
+            .filter(task_id__in=[r[0] for r in rows])
+            .order_by('tm_id')
+            .values_list('task_id', 'user__name')
+        ):
+            assignees.setdefault(task_id, []).append(name)
+
+        for task_id, parent_id, name, status, start, end, description in rows:
+            yield writer.writerow([
+                task_id,
+                parent_id or '',
+                name or '',
+                TaskStatus(status).label,
+                _format_dt(start),
+                _format_dt(end),
+                ', '.join(assignees.get(task_id, [])),
+                description or '',
+            ])
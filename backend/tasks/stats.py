@@ -0,0 +1,147 @@
+"""
+프로젝트별 업무 집계(ProjectStats) 유지
+- 업무 생성/수정/삭제 시그널 → 커밋 시점에 해당 프로젝트 집계와 오늘 스냅샷(번다운/속도 차트) 재계산
+  (업무를 저장하는 모든 경로에 적용되므로 뷰마다 갱신하지 않음)
+- 같은 트랜잭션 안의 여러 변경은 프로젝트당 1회로 합쳐서 처리
+- 재계산은 항상 Task 원본에서 다시 집계하므로 누락·중복 갱신이 누적되지 않음
+- 관리 명령(refresh_project_stats)으로 전체 재계산 가능
+"""
+import threading
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+
+from db_model.models import Project, ProjectStats, Task, TaskStatus, Log
+from .snapshots import record_project_snapshot
+
+STATUS_FIELDS = {
+    TaskStatus.REQUESTED: 'requested_count',
+    TaskStatus.IN_PROGRESS: 'in_progress_count',
+    TaskStatus.FEEDBACK: 'feedback_count',
+    TaskStatus.DONE: 'done_count',
+    TaskStatus.ON_HOLD: 'on_hold_count',
+}
+STAT_FIELDS = [
+    'total_count', *STATUS_FIELDS.values(), 'next_deadline', 'last_deadline',
+]
+
+_pending = threading.local()
+
+
+def _stats_aggregates():
+    aggregates = {'total_count': Count('task_id')}
+    for status, field in STATUS_FIELDS.items():
+        aggregates[field] = Count('task_id', filter=Q(status=status))
+    aggregates['next_deadline'] = Min('end_date', filter=~Q(status=TaskStatus.DONE))
+    aggregates['last_deadline'] = Max('end_date')
+    return aggregates
+
+
+def refresh_project_stats(project_id):
+    """
+    한 프로젝트의 집계 재계산 (집계 쿼리 1회 + upsert 1회)
+
+    Returns:
+        ProjectStats | None: 프로젝트가 삭제된 경우 None
+    """
+    if not Project.objects.filter(pk=project_id).exists():
+        return None
+
+    values = Task.objects.filter(project_id=project_id).aggregate(**_stats_aggregates())
+    values['last_activity'] = timezone.now()
+    stats, _ = ProjectStats.objects.update_or_create(project_id=project_id, defaults=values)
+    return stats
+
+
+def refresh_project_aggregates(project_id):
+    """프로젝트 집계(ProjectStats) + 오늘 스냅샷 재계산 (프로젝트가 삭제된 경우 무시)"""
+    if refresh_project_stats(project_id) is not None:
+        record_project_snapshot(project_id)
+
+
+def _flush_pending():
+    project_ids = getattr(_pending, 'project_ids', set())
+    _pending.project_ids = set()
+    for project_id in project_ids:
+        refresh_project_aggregates(project_id)
+
+
+def schedule_stats_refresh(project_id):
+    """
+    프로젝트 집계·스냅샷 갱신 예약
+    - 트랜잭션 밖: 즉시 재계산
+    - 트랜잭션 안: 커밋 후 프로젝트당 1회 재계산 (롤백 시 취소)
+    """
+    if not project_id:
+        return
+    if not transaction.get_connection().in_atomic_block:
+        refresh_project_aggregates(project_id)
+        return
+
+    if not hasattr(_pending, 'project_ids'):
+        _pending.project_ids = set()
+    _pending.project_ids.add(project_id)
+    # 콜백은 매번 등록하되 처음 실행된 콜백이 대기 목록을 비우므로 나머지는 no-op
+    # (savepoint 롤백으로 일부 콜백이 취소되어도 남은 콜백이 처리)
+    transaction.on_commit(_flush_pending)
+
+
+def refresh_all_project_stats(project_ids=None):
+    """
+    전체(또는 지정) 프로젝트 집계 일괄 재계산
+    - 집계 쿼리 1회 + upsert(bulk_create update_conflicts) 1회
+    - last_activity는 기존 값을 유지하고, 새 행만 업무 로그 최신 시각으로 채움
+
+    Returns:
+        int: 갱신된 프로젝트 수
+    """
+    projects = Project.objects.all()
+    if project_ids is not None:
+        projects = projects.filter(project_id__in=project_ids)
+    pids = list(projects.values_list('project_id', flat=True))
+    if not pids:
+        return 0
+
+    values_by_project = defaultdict(lambda: dict.fromkeys(STAT_FIELDS, None))
+    for row in (
+        Task.objects
+        .filter(project_id__in=pids)
+        .values('project_id')
+        .annotate(**_stats_aggregates())
+    ):
+        values_by_project[row.pop('project_id')] = row
+
+    last_logs = dict(
+        Log.objects
+        .filter(task__project_id__in=pids)
+        .values('task__project_id')
+        .annotate(last=Max('created_date'))
+        .values_list('task__project_id', 'last')
+    )
+
+    rows = []
+    for pid in pids:
+        values = values_by_project[pid]
+        for field in STAT_FIELDS:
+            if field.endswith('_count') and values[field] is None:
+                values[field] = 0
+        rows.append(ProjectStats(project_id=pid, last_activity=last_logs.get(pid), **values))
+
+    options = {'update_conflicts': True, 'update_fields': STAT_FIELDS}
+    if connection.features.supports_update_conflicts_with_target:
+        options['unique_fields'] = ['project']
+    ProjectStats.objects.bulk_create(rows, **options)
+    return len(rows)
+
+
+def get_project_stats(project_ids):
+    """
+    프로젝트 ID 목록 → {project_id: ProjectStats} (행이 없는 프로젝트는 빈 집계)
+    """
+    stats = {s.project_id: s for s in ProjectStats.objects.filter(project_id__in=project_ids)}
+    for pid in project_ids:
+        if pid not in stats:
+            stats[pid] = ProjectStats(project_id=pid)
+    return stats
@@ -0,0 +1,195 @@
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from db_model.models import Project, ProjectDailySnapshot, ProjectMember, Task, TaskDependency, TaskStatus, User
+from .scheduling import DependencyCycleError, _topological_order, propagate_schedule, would_create_cycle
+from .spreadsheet import import_tasks
+from .views import update_task_direct
+
+BASE = datetime(2025, 5, 1)
+
+
+class TaskTestMixin:
+    def setUp(self):
+        self.user = User.objects.create(name='kim', email='kim@example.com', password='pw')
+        self.project = Project.objects.create(project_name='P')
+        ProjectMember.objects.create(user=self.user, project=self.project, role=1)
+
+    def make_task(self, name, start, end, parent=None):
+        return Task.objects.create(
+            project=self.project, task_name=name, status=TaskStatus.REQUESTED,
+            start_date=BASE + timedelta(days=start), end_date=BASE + timedelta(days=end),
+            parent_task=parent,
+        )
+
+    def link(self, predecessor, successor, lag_days=0):
+        return TaskDependency.objects.create(predecessor=predecessor, successor=successor, lag_days=lag_days)
+
+    def days(self, task):
+        task.refresh_from_db()
+        return (task.start_date - BASE).days, (task.end_date - BASE).days
+
+
+class DependencyCycleTests(TaskTestMixin, TestCase):
+    def test_self_link_is_cycle(self):
+        a = self.make_task('A', 0, 1)
+        self.assertTrue(would_create_cycle(a.task_id, a.task_id))
+
+    def test_direct_and_indirect_cycles(self):
+        a, b, c = (self.make_task(n, 0, 1) for n in 'ABC')
+        self.link(a, b)
+        self.link(b, c)
+        self.assertTrue(would_create_cycle(b.task_id, a.task_id))
+        self.assertTrue(would_create_cycle(c.task_id, a.task_id))
+        self.assertFalse(would_create_cycle(a.task_id, c.task_id))
+
+    def test_topological_order_detects_cycle(self):
+        with self.assertRaises(DependencyCycleError):
+            _topological_order({1, 2, 3}, [(1, 2), (2, 3), (3, 1)])
+        self.assertEqual(_topological_order({1, 2, 3}, [(1, 2), (2, 3)]), [1, 2, 3])
+
+    def test_dependency_endpoint_rejects_cycle(self):
+        a, b = self.make_task('A', 0, 1), self.make_task('B', 2, 3)
+        self.link(a, b)
+        response = self.client.post(
+            f'/api/tasks/{a.task_id}/dependencies/', {'predecessor_id': b.task_id}, content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(TaskDependency.objects.filter(predecessor=b, successor=a).exists())
+
+
+class PropagateScheduleTests(TaskTestMixin, TestCase):
+    def test_chain_is_pushed_with_lag(self):
+        a, b, c = self.make_task('A', 0, 4), self.make_task('B', 2, 3), self.make_task('C', 3, 5)
+        self.link(a, b)
+        self.link(b, c, lag_days=1)
+
+        shifted = propagate_schedule([a.task_id])
+
+        self.assertEqual(set(shifted), {b.task_id, c.task_id})
+        self.assertEqual(self.days(b), (4, 5))   # 기간 유지
+        self.assertEqual(self.days(c), (6, 8))   # B 종료 + 1일
+
+    def test_successor_with_slack_is_not_moved(self):
+        a, b = self.make_task('A', 0, 2), self.make_task('B', 5, 6)
+        self.link(a, b)
+        self.assertEqual(propagate_schedule([a.task_id]), [])
+        self.assertEqual(self.days(b), (5, 6))
+
+    def test_moved_successor_carries_subtasks_and_their_successors(self):
+        a = self.make_task('A', 0, 5)
+        b = self.make_task('B', 3, 5)
+        child = self.make_task('B-1', 3, 4, parent=b)
+        d = self.make_task('D', 4, 6)
+        self.link(a, b)
+        self.link(child, d)
+
+        shifted = propagate_schedule([a.task_id])
+
+        self.assertEqual(self.days(b), (5, 7))
+        self.assertEqual(self.days(child), (5, 6))
+        self.assertEqual(self.days(d), (6, 8))
+        self.assertEqual(set(shifted), {b.task_id, child.task_id, d.task_id})
+
+    def test_updating_parent_pushes_successors_of_its_subtasks(self):
+        parent = self.make_task('P', 0, 2)
+        child = self.make_task('P-1', 0, 2, parent=parent)
+        successor = self.make_task('S', 3, 4)
+        self.link(child, successor)
+
+        response = self.client.patch(
+            f'/api/tasks/{parent.task_id}/',
+            {'start_date': '2025-05-04T00:00:00', 'end_date': '2025-05-06T00:00:00', 'user': self.user.user_id},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.days(child), (3, 5))
+        self.assertEqual(self.days(successor), (5, 6))
+
+
+class TaskImporterTests(TaskTestMixin, TestCase):
+    def run_import(self, rows):
+        text = "key,parent_key,task_name\n" + "".join(f"{k},{p},{n}\n" for k, p, n in rows)
+        return import_tasks(self.project.project_id, SimpleUploadedFile('tasks.csv', text.encode()), self.user)
+
+    def parent_name(self, name):
+        task = Task.objects.select_related('parent_task').get(project=self.project, task_name=name)
+        return task.parent_task.task_name if task.parent_task else None
+
+    def test_forward_and_backward_parent_keys(self):
+        result = self.run_import([('A', '', 'a'), ('B', 'A', 'b'), ('C', 'D', 'c'), ('D', '', 'd')])
+
+        self.assertEqual(result['created'], 4)
+        self.assertEqual(result['unresolved_parents'], 0)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(self.parent_name('b'), 'a')  # 상위가 앞에 있음
+        self.assertEqual(self.parent_name('c'), 'd')  # 상위가 뒤에 있음
+
+    def test_unknown_parent_is_counted(self):
+        result = self.run_import([('A', 'Z', 'a')])
+        self.assertEqual(result['unresolved_parents'], 1)
+        self.assertIsNone(self.parent_name('a'))
+
+    def test_self_reference_is_reported(self):
+        result = self.run_import([('A', 'A', 'a')])
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual([e['line'] for e in result['errors']], [2])
+        self.assertIsNone(self.parent_name('a'))
+
+    def test_cycle_is_reported_and_not_linked(self):
+        result = self.run_import([('A', 'B', 'a'), ('B', 'C', 'b'), ('C', 'A', 'c')])
+
+        self.assertEqual(result['created'], 3)
+        self.assertEqual([e['line'] for e in result['errors']], [3])
+        self.assertEqual(self.parent_name('c'), 'a')
+        self.assertEqual(self.parent_name('a'), 'b')
+        self.assertIsNone(self.parent_name('b'))  # 마지막 연결(B → C)이 순환이 되므로 거부
+
+
+class WorkloadCacheTests(TaskTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.url = f'/api/projects/{self.project.project_id}/workload/'
+
+    def fetch_twice(self):
+        with mock.patch('tasks.views.compute_workload', return_value={'load': []}) as compute:
+            self.client.get(self.url)
+            self.client.get(self.url)
+        return compute.call_count
+
+    @override_settings(DASHBOARD_CACHE=False)
+    def test_not_cached_without_shared_cache(self):
+        self.assertEqual(self.fetch_twice(), 2)
+
+    @override_settings(DASHBOARD_CACHE=True)
+    def test_cached_until_tasks_change(self):
+        self.assertEqual(self.fetch_twice(), 1)
+        self.make_task('A', 0, 1)  # 업무 버전 갱신
+        self.assertEqual(self.fetch_twice(), 1)
+
+
+class SnapshotRefreshTests(TaskTestMixin, TestCase):
+    def snapshot(self):
+        return ProjectDailySnapshot.objects.get(project=self.project, snapshot_date=date.today())
+
+    def test_snapshot_follows_every_save_path(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = self.make_task('A', 0, 1)
+        self.assertEqual((self.snapshot().total_count, self.snapshot().requested_count), (1, 1))
+
+        request = APIRequestFactory().patch(f'/tasks/{task.task_id}/', {'status': TaskStatus.DONE}, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(update_task_direct(request, task.task_id).status_code, 200)
+        self.assertEqual((self.snapshot().requested_count, self.snapshot().done_count), (0, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.delete()
+        self.assertEqual(self.snapshot().total_count, 0)
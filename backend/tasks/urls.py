@@ -21,9 +21,18 @@ urlpatterns = [
     # router가 처리하지 못하는 패턴이어야 함.
     # change-name은 /tasks/<id>/change-name/ 이므로 router와 충돌하지 않음.
     path('tasks/<int:task_id>/change-name/', views.change_task_name, name='change_task_name'),
+    path('tasks/<int:task_id>/dependencies/', views.task_dependencies, name='task_dependencies'),
+    path('tasks/<int:task_id>/dependencies/<int:dependency_id>/', views.delete_task_dependency, name='delete_task_dependency'),
     
     # 4. 프로젝트 관련
     path('projects/<int:project_id>/progress/', views.project_progress, name='project_progress'),
+    path('projects/<int:project_id>/gantt/', views.project_gantt, name='project_gantt'),
+    path('projects/<int:project_id>/workload/', views.project_workload, name='project_workload'),
+    path('projects/<int:project_id>/burndown/', views.project_burndown, name='project_burndown'),
+    path('projects/<int:project_id>/velocity/', views.project_velocity, name='project_velocity'),
+    path('projects/<int:project_id>/tasks/import/', views.import_project_tasks, name='import_project_tasks'),
+    path('projects/<int:project_id>/tasks/export/', views.export_project_tasks, name='export_project_tasks'),
+    path('projects/<int:project_id>/clone/', views.clone_project_view, name='clone_project'),
 
     # 5. 유저별 프로젝트
     path('users/<int:user_id>/projects/', views.get_user_projects_with_favorite, name='get_user_projects'),
@@ -3,12 +3,77 @@
 - 상태 자동 연동 (하위 완료 → 상위 자동 완료)
 - 날짜 변경 → 하위 자동 조정
 - 완료율 계산
+- 프로젝트 업무 버전 (캐시 키용)
+- PK를 채워주는 bulk_create
 """
-from django.db import transaction
+import time
+
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.db.models import Q
+from db_model.models import TaskStatus
 from log.views import create_log
 
 
+def _task_version_key(project_id):
+    return f"tasks:version:{project_id}"
+
+
+def get_project_task_version(project_id):
+    """
+    프로젝트 업무의 마지막 변경 시점(버전) 조회
+    업무 데이터 기반 캐시의 키로 사용 (변경 시 자동으로 새 키가 됨)
+    버전 갱신이 다른 프로세스에 보이려면 공유 캐시여야 하므로 settings.DASHBOARD_CACHE일 때만 캐시에 사용
+    """
+    version = cache.get(_task_version_key(project_id))
+    if version is None:
+        version = touch_project_tasks(project_id)
+    return version
+
+
+def touch_project_tasks(project_id):
+    """프로젝트 업무 변경 기록 (버전 갱신)"""
+    version = time.time_ns()
+    cache.set(_task_version_key(project_id), version, None)
+    return version
+
+
+def bulk_create_with_pk(model, objs, batch_size=500):
+    """
+    bulk_create 후 각 객체에 PK가 채워지도록 보장
+
+    PostgreSQL/SQLite/MariaDB(RETURNING)는 INSERT 결과로 PK를 돌려받지만,
+    MySQL은 돌려주지 않으므로 batch_size 행씩 INSERT 한 번마다
+    LAST_INSERT_ID()(이 연결에서 방금 INSERT한 첫 행의 ID)를 읽어 PK를 채운다.
+    행 수가 정해진 다중 행 INSERT는 innodb_autoinc_lock_mode와 관계없이 연속된 ID를 받으므로
+    동시에 실행되는 다른 INSERT와 겹치지 않는다 (간격은 auto_increment_increment).
+
+    Args:
+        model: 모델 클래스
+        objs: 저장할 (PK 없는) 모델 객체 리스트
+        batch_size: INSERT 1회당 행 수
+
+    Returns:
+        list: PK가 채워진 객체 리스트
+    """
+    if not objs:
+        return objs
+
+    if connection.features.can_return_rows_from_bulk_insert:
+        return model.objects.bulk_create(objs, batch_size=batch_size)
+
+    pk_name = model._meta.pk.attname
+    with transaction.atomic(), connection.cursor() as cursor:
+        for i in range(0, len(objs), batch_size):
+            batch = objs[i:i + batch_size]
+            model.objects.bulk_create(batch, batch_size=len(batch))
+            cursor.execute("SELECT LAST_INSERT_ID(), @@auto_increment_increment")
+            first_pk, step = cursor.fetchone()
+            for n, obj in enumerate(batch):
+                setattr(obj, pk_name, first_pk + n * step)
+    return objs
+
+
 def get_all_subtasks(task):
     """
     재귀적으로 모든 하위 업무 조회
@@ -40,16 +105,16 @@ def auto_adjust_subtask_dates(parent_task, days_shift, log_user):
         log_user: 로그 기록할 사용자
         
     Returns:
-        int: 업데이트된 하위 업무 수
+        list: 날짜가 조정된 하위 업무 task_id 리스트
     """
     from datetime import timedelta
     
     subtasks = get_all_subtasks(parent_task)
     
     if not subtasks:
-        return 0
+        return []
     
-    updated_count = 0
+    updated_ids = []
     
     with transaction.atomic():
         # 벌크 업데이트로 성능 최적화
@@ -72,9 +137,9 @@ def auto_adjust_subtask_dates(parent_task, days_shift, log_user):
                     task=subtask
                 )
                 
-                updated_count += 1
+                updated_ids.append(subtask.task_id)
     
-    return updated_count
+    return updated_ids
 
 
 def auto_update_parent_status(task, log_user):
@@ -94,54 +159,44 @@ def auto_update_parent_status(task, log_user):
     Returns:
         list: 자동 업데이트된 상위 업무 task_id 리스트
     """
-    STATUS_LABEL = {
-        '0': "요청", '1': "진행", '2': "피드백", '3': "완료",
-        0: "요청", 1: "진행", 2: "피드백", 3: "완료"
-    }
-    
     updated_parents = []
     current = task.parent_task
     
     while current:
-        siblings = current.sub_tasks.all()
+        # 하위 업무들의 상태 분석
+        statuses = list(current.sub_tasks.values_list('status', flat=True))
         
-        if not siblings.exists():
+        if not statuses:
             # 하위 업무가 없으면 더 이상 전파하지 않음
             break
         
-        # 하위 업무들의 상태 분석
-        statuses = [str(s.status) for s in siblings]
-        
         # ✅ [개선] 상태 결정 로직 (우선순위 기반)
-        if '2' in statuses:
+        if TaskStatus.FEEDBACK in statuses:
             # 하나라도 피드백이면 → 피드백
-            new_status = '2'
-        elif '1' in statuses:
+            new_status = TaskStatus.FEEDBACK
+        elif TaskStatus.IN_PROGRESS in statuses:
             # 하나라도 진행이면 → 진행
-            new_status = '1'
-        elif all(s == '3' for s in statuses):
+            new_status = TaskStatus.IN_PROGRESS
+        elif all(s == TaskStatus.DONE for s in statuses):
             # 모두 완료면 → 완료
-            new_status = '3'
-        elif all(s == '0' for s in statuses):
+            new_status = TaskStatus.DONE
+        elif all(s == TaskStatus.REQUESTED for s in statuses):
             # 모두 요청이면 → 요청
-            new_status = '0'
+            new_status = TaskStatus.REQUESTED
         else:
             # 혼재 상황 (요청 + 완료 혼합 등) → 진행으로 처리
-            new_status = '1'
+            new_status = TaskStatus.IN_PROGRESS
         
         # 상태 변경 필요 시 업데이트
-        if str(current.status) != new_status:
-            old_status = current.status
+        if current.status != new_status:
+            old_label = current.get_status_display()
             current.status = new_status
             current.save(update_fields=['status'])
             
             # 로그 기록
-            old_label = STATUS_LABEL.get(old_status, str(old_status))
-            new_label = STATUS_LABEL.get(new_status, new_status)
-            
             create_log(
                 action="업무 상태 변경 (자동)",
-                content=f"{old_label} → {new_label}",
+                content=f"{old_label} → {new_status.label}",
                 user=log_user,
                 task=current
             )
@@ -177,7 +232,7 @@ def calculate_subtask_completion_rate(task):
         return {'total': 0, 'completed': 0, 'rate': 0}
     
     total = len(subtasks)
-    completed = sum(1 for s in subtasks if str(s.status) == '3')
+    completed = sum(1 for s in subtasks if s.status == TaskStatus.DONE)
     rate = round((completed / total) * 100) if total > 0 else 0
     
     return {
@@ -1,5 +1,9 @@
 import logging
+from datetime import date
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.db.models import Count, Exists, OuterRef, Q
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets
@@ -8,16 +12,24 @@ from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.authentication import SessionAuthentication
 
-from db_model.models import Task, User, Project, FavoriteProject, TaskManager, File
+from db_model.models import Task, TaskStatus, User, Project, ProjectMember, FavoriteProject, TaskManager, File, TaskDependency
 from log.views import create_log
 from .serializers import TaskSerializer, TaskNameSerializer, TaskManagerSerializer
 from comments.serializers import FileSerializer
+from db_model.sparse import sparse_queryset
 
 from .utils import (
     auto_adjust_subtask_dates,
     auto_update_parent_status,
-    calculate_subtask_completion_rate
+    calculate_subtask_completion_rate,
+    get_project_task_version
 )
+from .scheduling import propagate_schedule, would_create_cycle, DependencyCycleError
+from .workload import compute_workload
+from .snapshots import burndown_series, velocity_series
+from .stats import get_project_stats
+from .spreadsheet import import_tasks, iter_export_rows, ImportFormatError
+from .cloning import clone_project
 
 logger = logging.getLogger(__name__)
 
@@ -36,21 +48,21 @@ def get_log_user(request):
         return User.objects.filter(pk=uid).first()
     return None
 
-def cascade_complete(task, log_user, status_label_map):
+def cascade_complete(task, log_user):
     """하위 업무가 모두 완료되면 상위 업무도 자동으로 완료 처리"""
     parent = task.parent_task
     while parent:
-        if parent.sub_tasks.exclude(status='3').exists():
+        if parent.sub_tasks.exclude(status=TaskStatus.DONE).exists():
             break
         
-        if parent.status != '3':
-            old_status = parent.status
-            parent.status = '3'
+        if parent.status != TaskStatus.DONE:
+            old_label = parent.get_status_display()
+            parent.status = TaskStatus.DONE
             parent.save(update_fields=["status"])
 
             create_log(
                 action="업무 상태 변경 (자동)",
-                content=f"{status_label_map.get(old_status, old_status)} → 완료",
+                content=f"{old_label} → 완료",
                 user=log_user,
                 task=parent
             )
@@ -66,19 +78,18 @@ class TaskViewSet(viewsets.ModelViewSet):
     permission_classes = []
     pagination_class = None
     lookup_field = 'task_id'
-    
-    STATUS_LABEL = {
-        '0': "요청", '1': "진행", '2': "피드백", '3': "완료",
-        0: "요청", 1: "진행", 2: "피드백", 3: "완료"
-    }
 
     # backend/tasks/views.py - get_queryset() 개선
 
     def get_queryset(self):
         queryset = Task.objects.all()
         
-        # 상세 조회/수정/삭제 시 필터링 건너뛰기
-        if self.action in ['retrieve', 'update', 'partial_update', 'destroy']:
+        # 상세 조회 시 ?fields= / ?omit= 에 맞춰 조회 컬럼 축소
+        if self.action == 'retrieve':
+            return sparse_queryset(queryset, self.get_serializer_class(), self.request.query_params)
+
+        # 수정/삭제 시 필터링 건너뛰기
+        if self.action in ['update', 'partial_update', 'destroy']:
             return queryset
 
         # 안전장치: URL 파라미터에 task_id 또는 pk가 있어도 필터링 건너뜀
@@ -133,7 +144,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         
         # 상태 필터 (다중 선택)
         if statuses:
-            status_list = [s.strip() for s in statuses.split(',') if s.strip()]
+            status_list = [int(s) for s in statuses.split(',') if s.strip().isdigit()]
             if status_list:
                 queryset = queryset.filter(status__in=status_list)
         
@@ -161,7 +172,8 @@ class TaskViewSet(viewsets.ModelViewSet):
         else:
             queryset = queryset.order_by('-created_date')  # 기본값
         
-        return queryset
+        # ?fields= / ?omit= 에 맞춰 조회 컬럼 축소 (description 등 대용량 컬럼 제외)
+        return sparse_queryset(queryset, self.get_serializer_class(), self.request.query_params)
 
     def perform_create(self, serializer):
         log_user = get_log_user(self.request)
@@ -197,6 +209,7 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         old_instance = self.get_object()
         old_status = old_instance.status
+        old_lbl = old_instance.get_status_display()
         old_start = old_instance.start_date
         old_end = old_instance.end_date
         
@@ -209,18 +222,28 @@ class TaskViewSet(viewsets.ModelViewSet):
             # 시작일 기준 변경 일수 계산
             days_shift = (task.start_date.date() - old_start.date()).days
             
+            adjusted_ids = []
             if days_shift != 0:
-                updated_count = auto_adjust_subtask_dates(task, days_shift, log_user)
+                adjusted_ids = auto_adjust_subtask_dates(task, days_shift, log_user)
                 
-                if updated_count > 0:
-                    logger.info(f"✅ 하위 업무 {updated_count}개 일정 자동 조정 완료 (task_id={task.task_id}, shift={days_shift:+d}일)")
+                if adjusted_ids:
+                    logger.info(f"✅ 하위 업무 {len(adjusted_ids)}개 일정 자동 조정 완료 (task_id={task.task_id}, shift={days_shift:+d}일)")
+
+            # 선후행 관계로 연결된 후행 업무 일정 전파 (함께 이동한 하위 업무의 후행 포함)
+            try:
+                shifted = propagate_schedule([task.task_id, *adjusted_ids], log_user)
+            except DependencyCycleError as e:
+                logger.warning(f"⚠️ 일정 전파 중단 (task_id={task.task_id}): {e}")
+                shifted = []
+
+            if shifted:
+                logger.info(f"✅ 후행 업무 {len(shifted)}개 일정 자동 조정 완료 (task_id={task.task_id})")
 
        # ──────────────────────────────────────────
         # ✅ [신규] 상태 변경 감지 → 상위 업무 자동 업데이트
         # ──────────────────────────────────────────
-        if str(old_status) != str(task.status):
-            old_lbl = self.STATUS_LABEL.get(old_status, str(old_status))
-            new_lbl = self.STATUS_LABEL.get(task.status, str(task.status))
+        if old_status != task.status:
+            new_lbl = task.get_status_display()
             
             create_log(
                 action="업무 상태 변경",
@@ -266,7 +289,9 @@ class TaskViewSet(viewsets.ModelViewSet):
             action="업무 삭제",
             content=f"[task_id={instance.task_id}] {instance.task_name} 삭제됨",
             user=log_user,
-            task=None
+            task=None,
+            project_id=instance.project_id,
+            task_name=instance.task_name,
         )
         instance.delete()
 
@@ -276,7 +301,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         
         parent = instance.parent_task
         while parent:
-            old_parent_statuses[parent.task_id] = str(parent.status)
+            old_parent_statuses[parent.task_id] = parent.status
             parent = parent.parent_task
         
         # 실제 업데이트 수행 (여기서 perform_update가 호출됨)
@@ -291,7 +316,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             parent.refresh_from_db()
             old_status = old_parent_statuses.get(parent.task_id)
             
-            if old_status and str(parent.status) != old_status:
+            if old_status is not None and parent.status != old_status:
                 # 상태가 변경된 상위 업무만 추가
                 auto_updated_parents.append(parent.task_id)
             
@@ -358,21 +383,67 @@ def get_user_projects_with_favorite(request, user_id):
 
 
 @api_view(['GET'])
-def project_progress(request, user_id, project_id):
+def project_progress(request, project_id):
+    user_id = request.session.get("user_id")
+    if not user_id:
+        return Response({"error": "로그인이 필요합니다."}, status=401)
     if not ProjectMember.objects.filter(user_id=user_id, project_id=project_id).exists():
         return Response({"error": "팀원이 아닙니다."}, status=404)
 
-    tasks = Task.objects.filter(taskmanager__project_id=project_id).distinct()
-    total = tasks.count()
-    completed = tasks.filter(status='3').count()
-    
-    progress = round((completed / total) * 100) if total > 0 else 0
+    stats = get_project_stats([project_id])[project_id]
+
+    return Response({
+        "project_id": project_id,
+        "progress": stats.progress,
+        "total_tasks": stats.total_count,
+        "completed_tasks": stats.done_count
+    })
+
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _epoch_day(dt):
+    """datetime/date → 1970-01-01 기준 일수 (None 유지)"""
+    return dt.toordinal() - EPOCH_ORDINAL if dt else None
+
+
+@api_view(['GET'])
+def project_gantt(request, project_id):
+    """
+    간트 차트용 컬럼형(column-oriented) 업무 데이터
+    - 모델 인스턴스 생성 없이 values_list로 필요한 컬럼만 조회
+    - 날짜는 epoch-day 정수, 상위 업무는 배열 인덱스(parent, 없으면 -1)로 반환
+    """
+    rows = (
+        Task.objects
+        .filter(project_id=project_id)
+        .order_by('task_id')
+        .values_list('task_id', 'parent_task_id', 'task_name', 'status', 'start_date', 'end_date')
+    )
+
+    task_ids, parent_ids, names, statuses, starts, ends = [], [], [], [], [], []
+    for task_id, parent_id, name, status_code, start, end in rows:
+        task_ids.append(task_id)
+        parent_ids.append(parent_id)
+        names.append(name)
+        statuses.append(status_code)
+        starts.append(_epoch_day(start))
+        ends.append(_epoch_day(end))
+
+    index_of = {tid: i for i, tid in enumerate(task_ids)}
+    parents = [index_of.get(pid, -1) for pid in parent_ids]
 
     return Response({
         "project_id": project_id,
-        "progress": progress,
-        "total_tasks": total,
-        "completed_tasks": completed
+        "epoch": "1970-01-01",
+        "count": len(task_ids),
+        "task_id": task_ids,
+        "parent": parents,
+        "name": names,
+        "status": statuses,
+        "start": starts,
+        "end": ends,
     })
 
 
@@ -464,4 +535,217 @@ def task_files(request):
     else:
         files = File.objects.filter(task_id=task_id).select_related('user').order_by('-created_date')
 
-    return Response(FileSerializer(files, many=True).data)
\ No newline at end of file
+    files = sparse_queryset(files, FileSerializer, request.query_params)
+    return Response(FileSerializer(files, many=True, context={'request': request}).data)
+
+WORKLOAD_CACHE_SECONDS = 600
+
+
+@api_view(['GET'])
+def project_workload(request, project_id):
+    """
+    팀원별 업무량 히트맵 (팀원 × 일자 부하 행렬)
+    - start, end: YYYY-MM-DD (선택, 기본값은 업무 기간 전체)
+    - include_done: true면 완료 업무 포함
+    - 프로젝트 업무 버전을 캐시 키에 포함하여 업무 변경 시 자동 무효화
+      (버전이 모든 워커에 보이는 공유 캐시(settings.DASHBOARD_CACHE)일 때만 캐시)
+    """
+    try:
+        start = date.fromisoformat(request.query_params['start']) if request.query_params.get('start') else None
+        end = date.fromisoformat(request.query_params['end']) if request.query_params.get('end') else None
+    except ValueError:
+        return Response({"error": "start/end must be YYYY-MM-DD"}, status=400)
+    include_done = request.query_params.get('include_done', 'false').lower() == 'true'
+
+    if settings.DASHBOARD_CACHE:
+        version = get_project_task_version(project_id)
+        cache_key = f"workload:{project_id}:{version}:{start}:{end}:{int(include_done)}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = compute_workload(project_id, start, end, include_done)
+            cache.set(cache_key, data, WORKLOAD_CACHE_SECONDS)
+    else:
+        data = compute_workload(project_id, start, end, include_done)
+
+    return Response({
+        "project_id": project_id,
+        "epoch": "1970-01-01",
+        **data,
+    })
+
+
+def _positive_int_param(request, name, default, maximum):
+    try:
+        return max(1, min(int(request.query_params.get(name, default)), maximum))
+    except (TypeError, ValueError):
+        return default
+
+
+@api_view(['GET'])
+def project_burndown(request, project_id):
+    """번다운 시리즈 (일자별 전체/완료/남은 업무, 스냅샷 기반) - days: 기본 30일"""
+    days = _positive_int_param(request, 'days', 30, 366)
+    return Response({"project_id": project_id, **burndown_series(project_id, days)})
+
+
+@api_view(['GET'])
+def project_velocity(request, project_id):
+    """주간 완료 업무 수 시리즈 (스냅샷 기반) - weeks: 기본 8주"""
+    weeks = _positive_int_param(request, 'weeks', 8, 52)
+    return Response({"project_id": project_id, **velocity_series(project_id, weeks)})
+
+
+@api_view(['POST'])
+def import_project_tasks(request, project_id):
+    """
+    CSV/XLSX 업무 일괄 가져오기 (multipart, 필드명 file)
+    컬럼: key, parent_key, task_name, status, start_date, end_date, assignees, description
+    """
+    log_user = get_log_user(request)
+    if not log_user:
+        raise PermissionDenied("로그인이 필요합니다.")
+
+    project = get_object_or_404(Project, pk=project_id)
+    upload = request.FILES.get('file')
+    if not upload:
+        return Response({"error": "file required"}, status=400)
+
+    try:
+        result = import_tasks(project.project_id, upload, log_user)
+    except (ImportFormatError, UnicodeDecodeError) as e:
+        return Response({"error": str(e)}, status=400)
+
+    return Response(result, status=201 if result['created'] else 400)
+
+
+@api_view(['GET'])
+def export_project_tasks(request, project_id):
+    """프로젝트 업무 CSV 스트리밍 내보내기 (가져오기와 같은 컬럼 형식)"""
+    project = get_object_or_404(Project, pk=project_id)
+    response = StreamingHttpResponse(iter_export_rows(project.project_id), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="project_{project.project_id}_tasks.csv"'
+    return response
+
+
+@api_view(['POST'])
+def clone_project_view(request, project_id):
+    """
+    템플릿 프로젝트 복제
+    - project_name: 새 프로젝트 이름 (필수, 중복 불가)
+    - start_date: 새 시작일 YYYY-MM-DD (선택, 전체 일정을 이 날짜 기준으로 이동)
+    - keep_status: true면 업무 상태 유지 (기본값: 모두 요청으로 초기화)
+    """
+    log_user = get_log_user(request)
+    if not log_user:
+        raise PermissionDenied("로그인이 필요합니다.")
+
+    source = get_object_or_404(Project, pk=project_id)
+    project_name = (request.data.get("project_name") or "").strip()
+    if not project_name:
+        return Response({"error": "project_name required"}, status=400)
+    if Project.objects.filter(project_name=project_name).exists():
+        return Response({"error": "이미 존재하는 프로젝트 이름입니다."}, status=400)
+
+    start_date = request.data.get("start_date")
+    try:
+        start_date = date.fromisoformat(start_date) if start_date else None
+    except ValueError:
+        return Response({"error": "start_date must be YYYY-MM-DD"}, status=400)
+    keep_status = str(request.data.get("keep_status", "false")).lower() == "true"
+
+    result = clone_project(source.project_id, project_name, log_user, start_date, keep_status)
+    return Response(result, status=201)
+
+
+def _serialize_dependency(dep):
+    return {
+        "dependency_id": dep.dependency_id,
+        "predecessor_id": dep.predecessor_id,
+        "predecessor_name": dep.predecessor.task_name,
+        "successor_id": dep.successor_id,
+        "successor_name": dep.successor.task_name,
+        "lag_days": dep.lag_days,
+    }
+
+
+@api_view(['GET', 'POST'])
+def task_dependencies(request, task_id):
+    """
+    업무 선후행 관계 조회/추가
+    - GET: 해당 업무의 선행(predecessors)/후행(successors) 목록
+    - POST: {"predecessor_id"} 또는 {"successor_id"}, "lag_days"(선택)
+      순환이 생기면 400, 추가 후 후행 업무 일정 즉시 전파
+    """
+    task = get_object_or_404(Task, pk=task_id)
+
+    if request.method == 'GET':
+        deps = TaskDependency.objects.filter(
+            Q(predecessor=task) | Q(successor=task)
+        ).select_related('predecessor', 'successor')
+        return Response({
+            "task_id": task.task_id,
+            "predecessors": [_serialize_dependency(d) for d in deps if d.successor_id == task.task_id],
+            "successors": [_serialize_dependency(d) for d in deps if d.predecessor_id == task.task_id],
+        })
+
+    predecessor_id = request.data.get("predecessor_id")
+    successor_id = request.data.get("successor_id")
+    try:
+        if predecessor_id:
+            predecessor_id, successor_id = int(predecessor_id), task.task_id
+        elif successor_id:
+            predecessor_id, successor_id = task.task_id, int(successor_id)
+        else:
+            return Response({"error": "predecessor_id or successor_id required"}, status=400)
+        lag_days = int(request.data.get("lag_days", 0))
+    except (TypeError, ValueError):
+        return Response({"error": "Invalid parameters"}, status=400)
+
+    other = get_object_or_404(Task, pk=predecessor_id if successor_id == task.task_id else successor_id)
+    if other.project_id != task.project_id:
+        return Response({"error": "같은 프로젝트의 업무끼리만 연결할 수 있습니다."}, status=400)
+
+    if would_create_cycle(predecessor_id, successor_id):
+        return Response({"error": "순환 의존성이 생겨 연결할 수 없습니다."}, status=400)
+
+    log_user = get_log_user(request)
+    with transaction.atomic():
+        dep, created = TaskDependency.objects.get_or_create(
+            predecessor_id=predecessor_id,
+            successor_id=successor_id,
+            defaults={'lag_days': lag_days}
+        )
+        if not created and dep.lag_days != lag_days:
+            dep.lag_days = lag_days
+            dep.save(update_fields=['lag_days'])
+
+        create_log(
+            action="선행 업무 연결",
+            content=f"[task_id={predecessor_id}] → [task_id={successor_id}]",
+            user=log_user,
+            task=task
+        )
+        shifted = propagate_schedule([predecessor_id], log_user)
+
+    dep = TaskDependency.objects.select_related('predecessor', 'successor').get(pk=dep.pk)
+    data = _serialize_dependency(dep)
+    data['auto_updated'] = shifted
+    return Response(data, status=201 if created else 200)
+
+
+@api_view(['DELETE'])
+def delete_task_dependency(request, task_id, dependency_id):
+    """업무 선후행 관계 삭제"""
+    task = get_object_or_404(Task, pk=task_id)
+    dep = get_object_or_404(
+        TaskDependency.objects.filter(Q(predecessor=task) | Q(successor=task)),
+        pk=dependency_id
+    )
+    create_log(
+        action="선행 업무 해제",
+        content=f"[task_id={dep.predecessor_id}] → [task_id={dep.successor_id}]",
+        user=get_log_user(request),
+        task=task
+    )
+    dep.delete()
+    return Response({"message": "선후행 관계가 삭제되었습니다."}, status=200)
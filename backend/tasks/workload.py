@@ -0,0 +1,87 @@
+"""
+팀원별 업무량(workload) 히트맵 계산
+- 프로젝트의 (담당자, 시작일, 종료일, 상태) 튜플을 한 번에 조회
+- NumPy 차분 배열(difference array)로 팀원 × 일자 부하 행렬을 벡터 연산으로 계산
+"""
+from datetime import date
+
+import numpy as np
+
+from db_model.models import ProjectMember, TaskManager, TaskStatus
+
+MAX_DAYS = 366
+EPOCH = date(1970, 1, 1)
+
+
+def _to_epoch_days(values):
+    """datetime 리스트 → epoch-day int64 배열"""
+    return np.array(values, dtype='datetime64[D]').astype(np.int64)
+
+
+def compute_workload(project_id, start=None, end=None, include_done=False):
+    """
+    팀원 × 일자 업무 부하 행렬 계산
+
+    Args:
+        project_id: 프로젝트 ID
+        start, end: 조회 구간 (date, 양 끝 포함). 없으면 업무 기간 전체
+        include_done: 완료(3) 업무 포함 여부
+
+    Returns:
+        dict: {
+            'start': 구간 시작 (epoch-day),
+            'days': 일 수,
+            'members': [{'user_id', 'name'}, ...],
+            'load': 팀원별 일자 부하 (2차원 리스트, members 순서)
+        }
+    """
+    members = list(
+        ProjectMember.objects
+        .filter(project_id=project_id)
+        .order_by('user_id')
+        .values_list('user_id', 'user__name')
+    )
+    rows = list(
+        TaskManager.objects
+        .filter(project_id=project_id)
+        .values_list('user_id', 'task__start_date', 'task__end_date', 'task__status')
+    )
+
+    member_index = {uid: i for i, (uid, _) in enumerate(members)}
+    # 멤버 목록에 없는 담당자도 행을 추가
+    for uid, _, _, _ in rows:
+        if uid not in member_index:
+            member_index[uid] = len(members)
+            members.append((uid, None))
+
+    rows = [r for r in rows if r[1] and r[2] and (include_done or r[3] != TaskStatus.DONE)]
+
+    if rows:
+        users = np.fromiter((member_index[r[0]] for r in rows), dtype=np.int64, count=len(rows))
+        starts = _to_epoch_days([r[1] for r in rows])
+        ends = _to_epoch_days([r[2] for r in rows])
+    else:
+        users = starts = ends = np.empty(0, dtype=np.int64)
+
+    lo = (start - EPOCH).days if start else (int(starts.min()) if starts.size else (date.today() - EPOCH).days)
+    hi = (end - EPOCH).days if end else (int(ends.max()) if ends.size else lo)
+    hi = max(lo, min(hi, lo + MAX_DAYS - 1))
+    days = hi - lo + 1
+
+    # 구간과 겹치는 업무만 남기고 구간 경계로 자르기
+    mask = (ends >= starts) & (ends >= lo) & (starts <= hi)
+    users = users[mask]
+    s_idx = np.clip(starts[mask], lo, hi) - lo
+    e_idx = np.clip(ends[mask], lo, hi) - lo
+
+    diff = np.zeros((len(members), days + 1), dtype=np.int32)
+    np.add.at(diff, (users, s_idx), 1)
+    np.add.at(diff, (users, e_idx + 1), -1)
+    load = np.cumsum(diff[:, :days], axis=1)
+
+    return {
+        'start': lo,
+        'days': days,
+        'members': [{'user_id': uid, 'name': name} for uid, name in members],
+        'load': load.tolist(),
+    }
@@ -0,0 +1,76 @@
+"""
+사용자 대시보드 응답 캐시
+- 사용자별 버전 키를 캐시 키에 포함 → 버전 갱신만으로 해당 사용자의 모든 월 캐시 무효화
+- 무효화는 시그널(users/signals.py)에서 호출하며, 트랜잭션 안이면 커밋 후 사용자당 1회 처리
+- 프로젝트 단위 변경은 커밋 시점에 프로젝트 멤버 전체로 펼쳐서 무효화
+- 버전 키가 모든 프로세스에 보여야 하므로 공유 캐시(settings.DASHBOARD_CACHE, REDIS_URL)일 때만 사용
+  (프로세스별 LocMem 캐시에서는 다른 워커의 무효화가 전달되지 않아 오래된 응답을 돌려줌)
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from db_model.models import ProjectMember
+
+DASHBOARD_TIMEOUT = 60 * 10  # 무효화 누락 대비 최대 보존 시간
+DASHBOARD_CACHE_ENABLED = getattr(settings, 'DASHBOARD_CACHE', False)
+
+_pending = threading.local()
+
+
+def _version_key(user_id):
+    return f"dashboard:version:{user_id}"
+
+
+def get_dashboard_version(user_id):
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = time.time_ns()
+        cache.set(_version_key(user_id), version, None)
+    return version
+
+
+def dashboard_cache_key(user_id, month_start, today):
+    """(사용자, 월) 대시보드 캐시 키 - 날짜가 바뀌면 남은 일수·긴급 업무가 달라지므로 오늘 날짜 포함"""
+    return f"dashboard:{user_id}:{month_start:%Y-%m}:{today.isoformat()}:{get_dashboard_version(user_id)}"
+
+
+def _flush_pending():
+    user_ids = getattr(_pending, 'user_ids', set())
+    project_ids = getattr(_pending, 'project_ids', set())
+    _pending.user_ids, _pending.project_ids = set(), set()
+
+    if project_ids:
+        user_ids |= set(
+            ProjectMember.objects
+            .filter(project_id__in=project_ids)
+            .values_list('user_id', flat=True)
+        )
+    if user_ids:
+        version = time.time_ns()
+        cache.set_many({_version_key(uid): version for uid in user_ids}, None)
+
+
+def _schedule(user_ids=(), project_ids=()):
+    if not DASHBOARD_CACHE_ENABLED:
+        return
+    if not hasattr(_pending, 'user_ids'):
+        _pending.user_ids, _pending.project_ids = set(), set()
+    _pending.user_ids.update(uid for uid in user_ids if uid)
+    _pending.project_ids.update(pid for pid in project_ids if pid)
+    # 커밋 전에 무효화하면 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있으므로 커밋 후 처리
+    # (트랜잭션 밖이면 즉시 실행, 먼저 실행된 콜백이 대기 목록을 비우므로 나머지는 no-op)
+    transaction.on_commit(_flush_pending)
+
+
+def invalidate_user_dashboards(*user_ids):
+    """지정 사용자들의 대시보드 캐시 무효화"""
+    _schedule(user_ids=user_ids)
+
+
+def invalidate_project_dashboards(*project_ids):
+    """프로젝트 멤버 전원의 대시보드 캐시 무효화"""
+    _schedule(project_ids=project_ids)
@@ -0,0 +1,28 @@
+"""
+비동기 뷰용 DB 전용 스레드 풀
+- sync_to_async(thread_sensitive=True)는 모든 호출을 한 스레드에서 순서대로 실행하므로
+  asyncio.gather로 묶어도 쿼리가 동시에 돌지 않음
+- 독립적인 조회는 이 풀(thread_sensitive=False)에서 실행하여 실제로 병렬 처리
+- 스레드마다 DB 연결을 따로 가지므로 작업이 끝나면 요청 종료와 같은 방식으로 연결 정리
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+
+_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="db-pool")
+
+
+def _call(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_in_db_pool(func, *args, **kwargs):
+    """동기 ORM 함수를 DB 전용 스레드 풀에서 실행"""
+    return await sync_to_async(_call, thread_sensitive=False, executor=_executor)(func, args, kwargs)
@@ -0,0 +1,286 @@
+"""
+알림함(Notification) 적재 및 조회
+- 댓글 / DM / 그룹 메시지는 저장 시점에 수신자별 알림 행으로 펼쳐서 저장 (fan-out on write)
+- 그룹 메시지·댓글에서 멘션된 사용자는 멘션 알림으로 저장 (멘션 추출·저장은 users/mentions.py)
+- 마감 임박 업무는 관리 명령(notify_urgent_tasks)이 주기적으로 적재
+- 적재된 알림은 커밋 후 수신자별 WebSocket 그룹(notify_<user_id>)으로 즉시 전송
+- 조회는 (user_id, created_at) 인덱스를 타는 키셋 페이지네이션 1회
+"""
+import json
+from collections import defaultdict
+from datetime import date, timedelta
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from db_model.models import (
+    Notification, NotificationKind, Task, TaskManager, TaskStatus
+)
+from tasks.utils import bulk_create_with_pk
+from .mentions import record_message_mentions, record_comment_mentions, project_members
+from .pagination import keyset_page
+
+URGENT_DAYS = 3
+URGENT_STATUS_LIST = [TaskStatus.IN_PROGRESS, TaskStatus.FEEDBACK]
+PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+
+
+# ──────────────────────────────────────────
+# 실시간 전송
+# ──────────────────────────────────────────
+def notification_group(user_id):
+    """사용자별 알림 WebSocket 그룹 이름"""
+    return f"notify_{user_id}"
+
+
+def _push(notification_ids):
+    """알림을 수신자별 그룹으로 전송 (채널 레이어로 보낼 수 있도록 JSON 호환 값으로 변환)"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None or not notification_ids:
+        return
+
+    items_by_user = defaultdict(list)
+    for n in (
+        Notification.objects
+        .filter(notification_id__in=notification_ids)
+        .select_related('actor', 'project', 'task')
+        .order_by('-created_at', '-notification_id')
+    ):
+        items_by_user[n.user_id].append(serialize_notification(n))
+
+    send = async_to_sync(channel_layer.group_send)
+    for user_id, items in items_by_user.items():
+        send(notification_group(user_id), {
+            "type": "notify.push",
+            "items": json.loads(json.dumps(items, cls=DjangoJSONEncoder)),
+        })
+
+
+def _save_and_push(notifications):
+    """알림 저장 후 커밋 시점에 실시간 전송"""
+    if not notifications:
+        return 0
+    with transaction.atomic():
+        bulk_create_with_pk(Notification, notifications)
+        ids = [n.notification_id for n in notifications]
+        transaction.on_commit(lambda: _push(ids))
+    return len(notifications)
+
+
+def _save_unique_and_push(notifications):
+    """
+    dedup_key가 있는 알림 저장 후 커밋 시점에 실시간 전송
+    다른 프로세스가 먼저 적재한 알림(유니크 제약 충돌)은 건너뛰고, 이번에 저장된 알림만 전송
+    """
+    if not notifications:
+        return 0
+    created_at = notifications[0].created_at
+    with transaction.atomic():
+        Notification.objects.bulk_create(notifications, batch_size=500, ignore_conflicts=True)
+        # ignore_conflicts INSERT는 PK를 돌려주지 않으므로 이번 적재 시각으로 다시 조회
+        ids = list(
+            Notification.objects
+            .filter(kind=notifications[0].kind, created_at=created_at,
+                    task_id__in={n.task_id for n in notifications})
+            .values_list('notification_id', flat=True)
+        )
+        transaction.on_commit(lambda: _push(ids))
+    return len(ids)
+
+
+# ──────────────────────────────────────────
+# 적재 (fan-out)
+# ──────────────────────────────────────────
+def notify_comment(comment):
+    """업무 댓글 → 업무 담당자(작성자 제외), 멘션된 프로젝트 멤버는 멘션 알림"""
+    if not comment.task_id:
+        return 0
+    managers = list(
+        TaskManager.objects
+        .filter(task_id=comment.task_id)
+        .exclude(user_id=comment.user_id)
+        .values_list('user_id', 'project_id')
+    )
+    project_id = Task.objects.filter(pk=comment.task_id).values_list('project_id', flat=True).first()
+    mentioned = record_comment_mentions(comment)
+
+    notifications, seen = [], set()
+    recipients = managers + [(uid, None) for uid in sorted(mentioned)]
+    for user_id, tm_project_id in recipients:
+        if user_id in seen:
+            continue
+        seen.add(user_id)
+        notifications.append(Notification(
+            user_id=user_id,
+            kind=NotificationKind.MENTION if user_id in mentioned else NotificationKind.COMMENT,
+            actor_id=comment.user_id,
+            project_id=project_id or tm_project_id,
+            task_id=comment.task_id,
+            source_id=comment.comment_id,
+            content=comment.content,
+            created_at=comment.created_date,
+        ))
+    return _save_and_push(notifications)
+
+
+def notify_direct_message(dm):
+    """DM → 방의 상대방"""
+    room = dm.room
+    recipient_id = room.user2_id if dm.user_id == room.user1_id else room.user1_id
+    if not recipient_id or recipient_id == dm.user_id:
+        return 0
+    return _save_and_push([Notification(
+        user_id=recipient_id,
+        kind=NotificationKind.DM,
+        actor_id=dm.user_id,
+        room_id=room.room_id,
+        source_id=dm.message_id,
+        content=dm.content,
+        created_at=dm.created_date,
+    )])
+
+
+def notify_group_message(message):
+    """그룹 메시지 → 프로젝트 멤버(작성자 제외), 멘션된 멤버는 멘션 알림"""
+    members = project_members(message.project_id, exclude_user_id=message.user_id)
+    mentioned = record_message_mentions(message, members)
+
+    notifications = [
+        Notification(
+            user_id=user_id,
+            kind=NotificationKind.MENTION if user_id in mentioned else NotificationKind.GROUP_MESSAGE,
+            actor_id=message.user_id,
+            project_id=message.project_id,
+            source_id=message.message_id,
+            content=message.content,
+            created_at=message.created_date,
+        )
+        for user_id in members
+    ]
+    return _save_and_push(notifications)
+
+
+def notify_urgent_tasks(today=None, task_ids=None):
+    """
+    마감 D-3 이내 진행/피드백 업무 → 담당자
+    같은 마감일에 대한 알림은 한 번만 적재 (마감일이 바뀌면 다시 알림)
+    - 여러 프로세스가 동시에 적재해도 (user, kind, task, dedup_key) 유니크 제약으로 1건만 저장
+
+    Returns:
+        int: 새로 적재된 알림 수
+    """
+    today = today or date.today()
+    tasks = Task.objects.filter(
+        status__in=URGENT_STATUS_LIST,
+        end_date__date__range=(today, today + timedelta(days=URGENT_DAYS)),
+    )
+    if task_ids is not None:
+        tasks = tasks.filter(task_id__in=task_ids)
+    due_by_task = dict(tasks.values_list('task_id', 'end_date'))
+    if not due_by_task:
+        return 0
+
+    existing = set(
+        Notification.objects
+        .filter(kind=NotificationKind.URGENT_TASK, task_id__in=due_by_task)
+        .values_list('user_id', 'task_id', 'content')
+    )
+
+    notifications, seen = [], set()
+    now = timezone.now()
+    for user_id, task_id, project_id in (
+        TaskManager.objects
+        .filter(task_id__in=due_by_task)
+        .values_list('user_id', 'task_id', 'project_id')
+    ):
+        due = due_by_task[task_id].isoformat()
+        key = (user_id, task_id, due)
+        if key in existing or key in seen:
+            continue
+        seen.add(key)
+        notifications.append(Notification(
+            user_id=user_id,
+            kind=NotificationKind.URGENT_TASK,
+            project_id=project_id,
+            task_id=task_id,
+            source_id=task_id,
+            content=due,
+            dedup_key=due,
+            created_at=now,
+        ))
+    return _save_unique_and_push(notifications)
+
+
+# ──────────────────────────────────────────
+# 조회
+# ──────────────────────────────────────────
+def serialize_notification(n):
+    """알림 행 → 프론트엔드 알림 항목 (type별 필드는 기존 응답 형식 유지)"""
+    item = {
+        "notification_id": n.notification_id,
+        "type": n.kind,
+        "id": n.source_id,
+        "is_read": n.read_at is not None,
+        "created_at": n.created_at,
+        "project_id": n.project_id,
+        "project_name": n.project.project_name if n.project else None,
+    }
+    actor_name = n.actor.name if n.actor else "알 수 없음"
+
+    if n.kind == NotificationKind.URGENT_TASK:
+        item.update({
+            "title": n.task.task_name if n.task else None,
+            "due": n.task.end_date if n.task else n.content,
+            "status_code": n.task.status if n.task else None,
+        })
+    elif n.kind == NotificationKind.COMMENT:
+        item.update({
+            "task_id": n.task_id,
+            "task_name": n.task.task_name if n.task else None,
+            "author_name": actor_name,
+            "content": n.content,
+        })
+    elif n.kind == NotificationKind.DM:
+        item.update({"room_id": n.room_id, "from_name": actor_name, "content": n.content})
+    else:  # group_message / mention
+        item.update({"from_name": actor_name, "content": n.content})
+        if n.task_id:  # 댓글 멘션
+            item.update({"task_id": n.task_id, "task_name": n.task.task_name if n.task else None})
+    return item
+
+
+def inbox_page(uid, before=None, limit=PAGE_SIZE, kinds=None, unread_only=False):
+    """
+    알림함 한 페이지 (최신순 키셋)
+
+    Returns:
+        (items, next_cursor)
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    qs = Notification.objects.filter(user_id=uid)
+    if kinds:
+        qs = qs.filter(kind__in=kinds)
+    if unread_only:
+        qs = qs.filter(read_at__isnull=True)
+
+    rows, next_cursor = keyset_page(
+        qs.select_related('actor', 'project', 'task'),
+        'created_at', 'notification_id', before, limit,
+    )
+    return [serialize_notification(n) for n in rows], next_cursor
+
+
+def unread_count(uid):
+    return Notification.objects.filter(user_id=uid, read_at__isnull=True).count()
+
+
+def mark_read(uid, notification_ids=None):
+    """알림 읽음 처리 (ids 미지정 시 전체) → 처리된 수"""
+    qs = Notification.objects.filter(user_id=uid, read_at__isnull=True)
+    if notification_ids is not None:
+        qs = qs.filter(notification_id__in=notification_ids)
+    return qs.update(read_at=timezone.now())
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from users.mentions import backfill_mentions
+
+
+class Command(BaseCommand):
+    help = "Mention 테이블 도입 전 그룹 메시지·업무 댓글의 @멘션 적재 (배포 후 1회 실행, 재실행해도 중복 없음)"
+
+    def handle(self, *args, **options):
+        message_count, comment_count = backfill_mentions()
+        self.stdout.write(self.style.SUCCESS(
+            f"멘션 적재 완료: 메시지 {message_count}건, 댓글 {comment_count}건"
+        ))
@@ -0,0 +1,21 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.inbox import notify_urgent_tasks
+
+
+class Command(BaseCommand):
+    help = "마감 임박(D-3 이내) 업무 알림을 담당자 알림함에 적재 (주기적으로 실행, 중복 적재 없음)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help="기준 날짜 (YYYY-MM-DD, 기본값: 오늘)")
+
+    def handle(self, *args, **options):
+        try:
+            today = date.fromisoformat(options['date']) if options['date'] else date.today()
+        except ValueError:
+            raise CommandError("--date must be YYYY-MM-DD")
+
+        count = notify_urgent_tasks(today)
+        self.stdout.write(self.style.SUCCESS(f"{today} 기준 마감 임박 알림 {count}건 적재 완료"))
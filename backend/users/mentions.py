@@ -0,0 +1,202 @@
+"""
+@멘션 추출 및 조회
+- 그룹 메시지 / 업무 댓글 저장 시 @이름, @사용자ID를 파싱하여 Mention 행으로 저장
+- 멘션 대상 후보는 해당 프로젝트 멤버 (작성자 제외)
+- 멘션 피드·개수는 (mentioned_user_id, created_at) 인덱스 조회
+- Mention 테이블 도입 전 메시지·댓글은 관리 명령(backfill_mentions)으로 채움
+"""
+import re
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from db_model.models import Comment, Mention, Message, ProjectMember, Task, TaskManager
+from tasks.utils import bulk_create_with_pk
+from .pagination import keyset_page
+
+PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+
+
+def mentioned_user_ids(content, members):
+    """
+    내용에서 멘션된 사용자 ID 추출
+
+    Args:
+        members: {user_id: name} 멘션 대상 후보
+    """
+    content = content or ""
+    if "@" not in content:
+        return set()
+    uids_by_name = {}
+    for uid, name in members.items():
+        if name:
+            uids_by_name.setdefault(name, set()).add(uid)
+
+    # 긴 이름부터 시도 → "@김철수"는 "김철"이 아니라 "김철수"로, 조사·호칭이 붙어도("@김철수님") 멘션
+    names = sorted(uids_by_name, key=len, reverse=True)
+    pattern = "|".join([re.escape(name) for name in names] + [r"\d+"])
+    mentioned = set()
+    for token in re.findall(rf"@({pattern})", content):
+        if token in uids_by_name:
+            mentioned |= uids_by_name[token]
+        elif int(token) in members:
+            mentioned.add(int(token))
+    return mentioned
+
+
+def project_members(project_id, exclude_user_id=None):
+    """프로젝트 멤버 {user_id: name}"""
+    qs = ProjectMember.objects.filter(project_id=project_id)
+    if exclude_user_id:
+        qs = qs.exclude(user_id=exclude_user_id)
+    return dict(qs.values_list('user_id', 'user__name'))
+
+
+def _save(mentioned, **fields):
+    if mentioned:
+        with transaction.atomic():
+            bulk_create_with_pk(Mention, [Mention(mentioned_user_id=uid, **fields) for uid in sorted(mentioned)])
+    return mentioned
+
+
+def record_message_mentions(message, members=None):
+    """
+    그룹 메시지 멘션 저장
+
+    Returns:
+        set: 멘션된 사용자 ID
+    """
+    if members is None:
+        members = project_members(message.project_id, exclude_user_id=message.user_id)
+    mentioned = mentioned_user_ids(message.content, members)
+    return _save(
+        mentioned,
+        author_id=message.user_id,
+        project_id=message.project_id,
+        message_id=message.message_id,
+        created_at=message.created_date,
+    )
+
+
+def record_comment_mentions(comment):
+    """
+    업무 댓글 멘션 저장 (업무가 속한 프로젝트 멤버 대상)
+
+    Returns:
+        set: 멘션된 사용자 ID
+    """
+    if not comment.task_id or "@" not in (comment.content or ""):
+        return set()
+    project_id = (
+        Task.objects.filter(pk=comment.task_id).values_list('project_id', flat=True).first()
+        or TaskManager.objects.filter(task_id=comment.task_id).values_list('project_id', flat=True).first()
+    )
+    if not project_id:
+        return set()
+    mentioned = mentioned_user_ids(comment.content, project_members(project_id, exclude_user_id=comment.user_id))
+    return _save(
+        mentioned,
+        author_id=comment.user_id,
+        project_id=project_id,
+        task_id=comment.task_id,
+        comment_id=comment.comment_id,
+        created_at=comment.created_date,
+    )
+
+
+def backfill_mentions(batch_size=1000):
+    """
+    Mention 행이 없는 기존 그룹 메시지·업무 댓글의 멘션 저장 (여러 번 실행해도 중복 없음)
+    멘션 대상은 현재 프로젝트 멤버 기준
+
+    Returns:
+        (int, int): 저장된 메시지 멘션 수, 댓글 멘션 수
+    """
+    members_cache = {}
+
+    def members_of(project_id, author_id):
+        if project_id not in members_cache:
+            members_cache[project_id] = project_members(project_id)
+        return {uid: name for uid, name in members_cache[project_id].items() if uid != author_id}
+
+    def flush(rows):
+        if rows:
+            Mention.objects.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+    message_count, rows = 0, []
+    messages = (
+        Message.objects
+        .filter(content__contains='@')
+        .exclude(Exists(Mention.objects.filter(message_id=OuterRef('pk'))))
+        .values_list('message_id', 'user_id', 'project_id', 'content', 'created_date')
+    )
+    for message_id, user_id, project_id, content, created_date in messages.iterator(chunk_size=batch_size):
+        for uid in sorted(mentioned_user_ids(content, members_of(project_id, user_id))):
+            rows.append(Mention(mentioned_user_id=uid, author_id=user_id, project_id=project_id,
+                                message_id=message_id, created_at=created_date))
+        if len(rows) >= batch_size:
+            message_count += flush(rows)
+            rows = []
+    message_count += flush(rows)
+
+    comment_count, rows = 0, []
+    comments = (
+        Comment.objects
+        .filter(content__contains='@', task__isnull=False)
+        .exclude(Exists(Mention.objects.filter(comment_id=OuterRef('pk'))))
+        .values_list('comment_id', 'user_id', 'task_id', 'task__project_id', 'content', 'created_date')
+    )
+    for comment_id, user_id, task_id, project_id, content, created_date in comments.iterator(chunk_size=batch_size):
+        project_id = project_id or (
+            TaskManager.objects.filter(task_id=task_id).values_list('project_id', flat=True).first()
+        )
+        if not project_id:
+            continue
+        for uid in sorted(mentioned_user_ids(content, members_of(project_id, user_id))):
+            rows.append(Mention(mentioned_user_id=uid, author_id=user_id, project_id=project_id,
+                                task_id=task_id, comment_id=comment_id, created_at=created_date))
+        if len(rows) >= batch_size:
+            comment_count += flush(rows)
+            rows = []
+    comment_count += flush(rows)
+    return message_count, comment_count
+
+
+def mention_feed(uid, before=None, limit=PAGE_SIZE, since=None):
+    """
+    나를 멘션한 메시지·댓글 (최신순 키셋)
+
+    Returns:
+        (items, next_cursor)
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    qs = Mention.objects.filter(mentioned_user_id=uid)
+    if since:
+        qs = qs.filter(created_at__gte=since)
+
+    rows, next_cursor = keyset_page(
+        qs.select_related('author', 'project', 'task', 'message', 'comment'),
+        'created_at', 'mention_id', before, limit,
+    )
+    items = [{
+        "mention_id": m.mention_id,
+        "type": "comment" if m.comment_id else "group_message",
+        "id": m.comment_id or m.message_id,
+        "project_id": m.project_id,
+        "project_name": m.project.project_name if m.project else None,
+        "task_id": m.task_id,
+        "task_name": m.task.task_name if m.task else None,
+        "from_name": m.author.name if m.author else "알 수 없음",
+        "content": (m.comment.content if m.comment else m.message.content if m.message else ""),
+        "created_at": m.created_at,
+    } for m in rows]
+    return items, next_cursor
+
+
+def mention_count(uid, since=None):
+    qs = Mention.objects.filter(mentioned_user_id=uid)
+    if since:
+        qs = qs.filter(created_at__gte=since)
+    return qs.count()
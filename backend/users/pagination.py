@@ -0,0 +1,38 @@
+"""
+시간순 키셋 페이지네이션 공통 유틸
+- 커서 형식: '<생성 시각 ISO>_<PK>' (같은 시각의 행은 PK로 구분)
+"""
+from datetime import datetime
+
+from django.db.models import Q
+
+
+def encode_cursor(created_at, pk):
+    return f"{created_at.isoformat()}_{pk}"
+
+
+def decode_cursor(cursor):
+    """커서 → (datetime, pk), 형식 오류 시 ValueError"""
+    created_at, _, pk = (cursor or "").rpartition("_")
+    return datetime.fromisoformat(created_at), int(pk)
+
+
+def keyset_page(queryset, time_field, pk_field, before=None, limit=30):
+    """
+    최신순 한 페이지 조회
+
+    Returns:
+        (rows, next_cursor)
+    """
+    if before:
+        created_at, pk = decode_cursor(before)
+        queryset = queryset.filter(
+            Q(**{f"{time_field}__lt": created_at}) |
+            Q(**{time_field: created_at, f"{pk_field}__lt": pk})
+        )
+    rows = list(queryset.order_by(f"-{time_field}", f"-{pk_field}")[:limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(getattr(last, time_field), getattr(last, pk_field))
+    return rows[:limit], next_cursor
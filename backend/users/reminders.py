@@ -0,0 +1,119 @@
+"""
+업무 마감 임박(D-3) 알림 스케줄러
+- 서버 시작 시(config/asgi.py) 앞으로 D-3에 진입할 업무를 타이밍 휠에 등록
+- 업무 일정/상태가 바뀌면 해당 업무 타이머만 교체 (users/signals.py)
+- D-3 진입 시각(마감 3일 전 0시)에 해당 업무만 notify_urgent_tasks로 적재
+  → 요청마다 '마감 임박' 범위를 다시 조회하지 않음
+- 이미 D-3 이내인 업무는 저장 시점에 바로 알림 (users/signals.py)
+- 여러 프로세스(ASGI 워커마다 스케줄러 1개)가 같은 업무를 동시에 적재해도
+  Notification (user, kind, task, dedup_key) 유니크 제약으로 같은 마감일 알림은 1건만 저장
+"""
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from django.db import close_old_connections
+
+from db_model.models import Task
+from .inbox import notify_urgent_tasks, URGENT_DAYS, URGENT_STATUS_LIST
+from .timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+TICK_SECONDS = 1
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def reminder_time(end_date):
+    """D-3 진입 시각: 마감일 3일 전 0시 (대시보드 '긴급' 기준과 동일한 날짜 단위)"""
+    day = end_date.date() - timedelta(days=URGENT_DAYS)
+    return datetime(day.year, day.month, day.day)
+
+
+class DeadlineReminderScheduler(threading.Thread):
+    def __init__(self):
+        super().__init__(name="deadline-reminders", daemon=True)
+        self.lock = threading.Lock()
+        self.wheel = TimingWheel(int(time.time()))
+        self.stopped = threading.Event()
+
+    # ── 타이머 관리 ─────────────────────────────────────
+    def schedule(self, task_id, end_date, status):
+        """업무 타이머 등록/교체 (진행·피드백 상태이고 D-3 진입 전인 업무만)"""
+        with self.lock:
+            self.wheel.cancel(task_id)
+            if int(status) not in URGENT_STATUS_LIST or not end_date:
+                return
+            fire_at = reminder_time(end_date)
+            if fire_at > datetime.now():
+                self.wheel.add(task_id, int(fire_at.timestamp()))
+
+    def cancel(self, task_id):
+        with self.lock:
+            self.wheel.cancel(task_id)
+
+    def load(self):
+        """D-3 진입 전인 진행/피드백 업무 전체 등록 + 이미 D-3 이내인 업무 알림 보충"""
+        today = date.today()
+        rows = (
+            Task.objects
+            .filter(status__in=URGENT_STATUS_LIST, end_date__date__gt=today + timedelta(days=URGENT_DAYS))
+            .values_list('task_id', 'end_date', 'status')
+        )
+        for task_id, end_date, status in rows.iterator(chunk_size=2000):
+            self.schedule(task_id, end_date, status)
+        created = notify_urgent_tasks(today)
+        logger.info(f"⏰ 마감 알림 타이머 {len(self.wheel)}개 등록, 누락 알림 {created}건 적재")
+
+    # ── 실행 루프 ───────────────────────────────────────
+    def run(self):
+        try:
+            self.load()
+        except Exception:
+            logger.exception("마감 알림 타이머 초기화 실패")
+        finally:
+            close_old_connections()
+
+        while not self.stopped.wait(TICK_SECONDS):
+            with self.lock:
+                fired = self.wheel.advance_to(int(time.time()))
+            if not fired:
+                continue
+            try:
+                notify_urgent_tasks(date.today(), task_ids=fired)
+            except Exception:
+                logger.exception(f"마감 알림 적재 실패 (task_ids={fired})")
+            finally:
+                close_old_connections()
+
+    def stop(self):
+        self.stopped.set()
+
+
+def start_deadline_reminders():
+    """스케줄러 시작 (프로세스당 1회, DEADLINE_REMINDERS=0이면 비활성화)"""
+    global _scheduler
+    if os.getenv("DEADLINE_REMINDERS", "1") == "0":
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = DeadlineReminderScheduler()
+            _scheduler.start()
+    return _scheduler
+
+
+def schedule_task_reminders(tasks):
+    """업무 (task_id, end_date, status) 목록의 타이머 갱신 (스케줄러 미실행 시 무시)"""
+    if _scheduler is None:
+        return
+    for task_id, end_date, status in tasks:
+        _scheduler.schedule(task_id, end_date, status)
+
+
+def cancel_task_reminder(task_id):
+    if _scheduler is not None:
+        _scheduler.cancel(task_id)
@@ -0,0 +1,124 @@
+"""
+users 앱 시그널 수신기
+- 대시보드 캐시 무효화
+  - 프로젝트명 / 업무 / 담당자 / 프로젝트 집계 / 업무 로그(버퍼 일괄 저장 포함) / 멤버 변경 → 프로젝트 멤버 전원
+  - 개인 일정 / 즐겨찾기 변경 → 해당 사용자
+- 알림함 적재: 댓글 / DM / 그룹 메시지 생성 → 수신자별 알림
+- 마감 알림: 업무 저장·일괄 저장 시 D-3 이내면 즉시 알림, 아니면 타이밍 휠 타이머 교체
+"""
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from db_model.models import (
+    Project, Task, TaskManager, ProjectStats, ProjectMember, Log, Schedule, FavoriteProject,
+    Comment, DirectMessage, Message
+)
+from log.sink import logs_flushed
+from tasks.signals import tasks_bulk_saved
+from .cache import invalidate_user_dashboards, invalidate_project_dashboards
+from .inbox import (
+    notify_comment, notify_direct_message, notify_group_message, notify_urgent_tasks,
+    URGENT_DAYS, URGENT_STATUS_LIST,
+)
+from .reminders import schedule_task_reminders, cancel_task_reminder
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=TaskManager)
+@receiver(post_delete, sender=TaskManager)
+@receiver(post_save, sender=ProjectStats)
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def on_project_data_changed(sender, instance, **kwargs):
+    invalidate_project_dashboards(instance.project_id)
+    if sender is ProjectMember:
+        # 프로젝트를 떠난 멤버는 커밋 시점의 멤버 목록에 없으므로 직접 무효화
+        invalidate_user_dashboards(instance.user_id)
+
+
+@receiver(post_save, sender=Log)
+def on_log_created(sender, instance, created, **kwargs):
+    # 대시보드 최근 로그는 업무에 연결된 로그만 표시
+    if created and instance.task_id:
+        task = instance.task if Log.task.is_cached(instance) else None
+        project_id = task.project_id if task else (
+            Task.objects.filter(pk=instance.task_id).values_list('project_id', flat=True).first()
+        )
+        invalidate_project_dashboards(project_id)
+
+
+@receiver(logs_flushed)
+def on_logs_flushed(sender, logs, **kwargs):
+    # 로그 버퍼 일괄 저장(bulk_create)은 post_save를 보내지 않음
+    task_ids = {log.task_id for log in logs if log.task_id}
+    if not task_ids:
+        return
+    project_ids = set(Task.objects.filter(pk__in=task_ids).values_list('project_id', flat=True).distinct())
+    for project_id in project_ids:
+        invalidate_project_dashboards(project_id)
+
+
+@receiver(post_save, sender=Schedule)
+@receiver(post_delete, sender=Schedule)
+@receiver(post_save, sender=FavoriteProject)
+@receiver(post_delete, sender=FavoriteProject)
+def on_user_data_changed(sender, instance, **kwargs):
+    invalidate_user_dashboards(instance.user_id)
+
+
+@receiver(post_save, sender=Comment)
+def on_comment_created(sender, instance, created, **kwargs):
+    if created:
+        notify_comment(instance)
+
+
+@receiver(post_save, sender=DirectMessage)
+def on_direct_message_created(sender, instance, created, **kwargs):
+    if created:
+        notify_direct_message(instance)
+
+
+@receiver(post_save, sender=Message)
+def on_group_message_created(sender, instance, created, **kwargs):
+    if created:
+        notify_group_message(instance)
+
+
+def _refresh_task_reminders(rows):
+    """
+    업무 (task_id, end_date, status) 목록의 마감 알림 갱신
+    - 이미 D-3 이내: 커밋 후 바로 적재 (담당자 등록이 끝난 뒤, 같은 마감일은 중복 적재 없음)
+    - 그 외: D-3 진입 시각에 맞춰 타이밍 휠 타이머 교체
+    """
+    today = date.today()
+    urgent_ids = [
+        task_id for task_id, end_date, status in rows
+        if int(status) in URGENT_STATUS_LIST and end_date
+        and today <= end_date.date() <= today + timedelta(days=URGENT_DAYS)
+    ]
+    if urgent_ids:
+        transaction.on_commit(lambda: notify_urgent_tasks(today, task_ids=urgent_ids))
+    schedule_task_reminders(rows)
+
+
+@receiver(post_save, sender=Task)
+def on_task_deadline_changed(sender, instance, **kwargs):
+    _refresh_task_reminders([(instance.task_id, instance.end_date, instance.status)])
+
+
+@receiver(post_delete, sender=Task)
+def on_task_deleted(sender, instance, **kwargs):
+    cancel_task_reminder(instance.task_id)
+
+
+@receiver(tasks_bulk_saved)
+def on_tasks_bulk_saved(sender, task_ids, **kwargs):
+    if task_ids:
+        _refresh_task_reminders(list(
+            Task.objects.filter(task_id__in=task_ids).values_list('task_id', 'end_date', 'status')
+        ))
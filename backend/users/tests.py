@@ -1,3 +1,155 @@
-from django.test import TestCase
+from datetime import date, datetime
 
-# Create your tests here.
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+
+from db_model.models import (
+    Comment, Log, Mention, Message, Notification, NotificationKind, Project, ProjectMember, Task, TaskManager,
+    TaskStatus, User,
+)
+from .inbox import _save_unique_and_push, notify_urgent_tasks
+from .mentions import backfill_mentions, mentioned_user_ids
+from .views.dashboard import dashboard_recent_logs
+from .timing_wheel import TimingWheel
+
+
+class TimingWheelTests(SimpleTestCase):
+    def test_fires_at_expire_tick(self):
+        wheel = TimingWheel(0)
+        wheel.add('a', 5)
+        self.assertEqual(wheel.advance_to(4), [])
+        self.assertEqual(wheel.advance_to(5), ['a'])
+        self.assertNotIn('a', wheel)
+
+    def test_cascades_from_upper_levels(self):
+        wheel = TimingWheel(0)
+        wheel.add('hour', 3725)       # 시 단위 휠
+        wheel.add('minute', 125)      # 분 단위 휠
+        self.assertEqual(wheel.location['hour'][0], 2)
+        self.assertEqual(wheel.location['minute'][0], 1)
+
+        self.assertEqual(wheel.advance_to(124), [])
+        self.assertEqual(wheel.advance_to(125), ['minute'])
+        self.assertEqual(wheel.advance_to(3600), [])
+        self.assertLess(wheel.location['hour'][0], 2)  # 시 경계에서 하위 휠로 재배치
+        self.assertEqual(wheel.advance_to(3724), [])
+        self.assertEqual(wheel.advance_to(3725), ['hour'])
+
+    def test_overflow_is_replaced_on_top_level_boundary(self):
+        wheel = TimingWheel(0, sizes=(4, 4, 2))  # 범위 32틱
+        wheel.add('far', 40)
+        self.assertIsNone(wheel.location['far'])
+        self.assertEqual(wheel.advance_to(39), [])
+        self.assertEqual(wheel.advance_to(40), ['far'])
+
+    def test_cancel_and_replace(self):
+        wheel = TimingWheel(0)
+        wheel.add('a', 10)
+        wheel.add('b', 10)
+        self.assertTrue(wheel.cancel('a'))
+        self.assertFalse(wheel.cancel('a'))
+        wheel.add('b', 20)  # 같은 key는 교체
+        self.assertEqual(wheel.advance_to(10), [])
+        self.assertEqual(wheel.advance_to(20), ['b'])
+        self.assertEqual(len(wheel), 0)
+
+    def test_past_expiry_fires_on_next_advance(self):
+        wheel = TimingWheel(100)
+        wheel.add('late', 50)
+        self.assertEqual(wheel.advance_to(100), ['late'])
+
+
+class MentionedUserIdsTests(SimpleTestCase):
+    members = {1: '김철', 2: '김철수', 3: 'lee', 4: 'a.b'}
+
+    def test_name_and_id(self):
+        self.assertEqual(mentioned_user_ids("@lee 확인 부탁, @4", self.members), {3, 4})
+
+    def test_longest_name_wins(self):
+        self.assertEqual(mentioned_user_ids("@김철수 안녕하세요", self.members), {2})
+        self.assertEqual(mentioned_user_ids("@김철 안녕하세요", self.members), {1})
+        self.assertEqual(mentioned_user_ids("@김철, @김철수", self.members), {1, 2})
+
+    def test_trailing_particle_or_honorific(self):
+        self.assertEqual(mentioned_user_ids("@김철수님 확인 부탁드립니다", self.members), {2})
+        self.assertEqual(mentioned_user_ids("@김철수에게 전달", self.members), {2})
+        self.assertEqual(mentioned_user_ids("@김철에게 전달", self.members), {1})
+        self.assertEqual(mentioned_user_ids("@12", self.members), set())
+        self.assertEqual(mentioned_user_ids("메일 lee@example.com", self.members), set())
+
+    def test_special_characters_in_name(self):
+        self.assertEqual(mentioned_user_ids("@a.b!", self.members), {4})
+        self.assertEqual(mentioned_user_ids("@ab", self.members), set())
+
+    def test_no_at_sign(self):
+        self.assertEqual(mentioned_user_ids("김철수 lee", self.members), set())
+        self.assertEqual(mentioned_user_ids(None, self.members), set())
+
+
+class BackfillMentionsTests(TestCase):
+    def test_backfills_existing_messages_and_comments_once(self):
+        kim = User.objects.create(name='김철수', email='kim@example.com', password='pw')
+        lee = User.objects.create(name='lee', email='lee@example.com', password='pw')
+        project = Project.objects.create(project_name='P')
+        for user in (kim, lee):
+            ProjectMember.objects.create(user=user, project=project, role=1)
+        task = Task.objects.create(project=project, task_name='T', start_date=datetime(2025, 5, 1),
+                                   end_date=datetime(2025, 5, 2))
+        # 시그널 없이 저장된 기존 데이터처럼 Mention 행을 비움
+        message = Message.objects.create(user=lee, project=project, content="@김철수님 확인 부탁")
+        comment = Comment.objects.create(user=kim, task=task, content="@lee 검토 완료")
+        Message.objects.create(user=lee, project=project, content="멘션 없음")
+        Mention.objects.all().delete()
+
+        self.assertEqual(backfill_mentions(), (1, 1))
+        self.assertEqual(backfill_mentions(), (0, 0))
+        self.assertTrue(Mention.objects.filter(mentioned_user=kim, message=message, author=lee).exists())
+        self.assertTrue(Mention.objects.filter(mentioned_user=lee, comment=comment, task=task,
+                                               project=project).exists())
+
+
+class UrgentNotificationDedupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(name='kim', email='kim@example.com', password='pw')
+        project = Project.objects.create(project_name='P')
+        self.task = Task.objects.create(project=project, task_name='T', status=TaskStatus.IN_PROGRESS,
+                                        start_date=datetime(2025, 5, 1), end_date=datetime(2025, 5, 3))
+        TaskManager.objects.create(task=self.task, user=self.user, project=project)
+
+    def urgent(self):
+        return Notification(user=self.user, kind=NotificationKind.URGENT_TASK, task=self.task,
+                            source_id=self.task.task_id, content='2025-05-03T00:00:00',
+                            dedup_key='2025-05-03T00:00:00')
+
+    def test_notified_once_per_due_date(self):
+        self.assertEqual(notify_urgent_tasks(date(2025, 5, 1)), 1)
+        self.assertEqual(notify_urgent_tasks(date(2025, 5, 1)), 0)
+        self.task.end_date = datetime(2025, 5, 4)
+        self.task.save()
+        self.assertEqual(notify_urgent_tasks(date(2025, 5, 1)), 1)
+
+    def test_concurrent_insert_is_skipped(self):
+        # 다른 프로세스가 사전 조회 이후 먼저 적재한 경우
+        self.urgent().save()
+        self.assertEqual(_save_unique_and_push([self.urgent()]), 0)
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_unique_constraint(self):
+        self.urgent().save()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.urgent().save()
+
+
+class DashboardRecentLogsTests(TestCase):
+    def test_includes_compacted_summary_rows(self):
+        user = User.objects.create(name='kim', email='kim@example.com', password='pw')
+        project = Project.objects.create(project_name='P')
+        other = Project.objects.create(project_name='Q')
+        ProjectMember.objects.create(user=user, project=project, role=1)
+        Log.objects.create(action='상태 변경', content='업무 3개 상태 변경', user=user, project=project,
+                           payload={'count': 3, 'entries': []})
+        Log.objects.create(action='업무 생성', content='다른 프로젝트', user=user, project=other)
+
+        logs = dashboard_recent_logs(user.user_id)
+
+        self.assertEqual([(log['content'], log['count']) for log in logs], [('업무 3개 상태 변경', 3)])
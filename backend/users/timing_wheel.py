@@ -0,0 +1,110 @@
+"""
+계층형 타이밍 휠 (Hierarchical Timing Wheel)
+- 하위 휠부터 초(60칸) / 분(60칸) / 시(24칸) / 일(512칸) 단위 슬롯
+- 등록·취소 O(1), 한 틱 진행 시 현재 슬롯만 확인 (전체 타이머를 훑지 않음)
+- 상위 휠의 슬롯 경계에 도달하면 해당 슬롯 항목을 하위 휠로 다시 배치(cascade)
+- 최상위 휠 범위를 넘는 항목은 overflow에 두었다가 일 단위 경계마다 재배치
+- 스레드 안전하지 않음 (호출 측에서 잠금)
+"""
+
+LEVEL_SIZES = (60, 60, 24, 512)
+
+
+class TimingWheel:
+    def __init__(self, current_tick, sizes=LEVEL_SIZES):
+        self.sizes = sizes
+        self.widths = []  # 레벨별 슬롯 1칸의 틱 수
+        width = 1
+        for size in sizes:
+            self.widths.append(width)
+            width *= size
+        self.wheels = [[set() for _ in range(size)] for size in sizes]
+        self.current = current_tick
+        self.expires = {}    # key → 만료 틱
+        self.location = {}   # key → (level, slot) 또는 None(overflow)
+        self.overflow = set()
+        self.due = set()     # 이미 만료되어 다음 advance에서 반환할 항목
+
+    def __len__(self):
+        return len(self.expires)
+
+    def __contains__(self, key):
+        return key in self.expires
+
+    def _place(self, key):
+        expire = self.expires[key]
+        if expire <= self.current:
+            self.due.add(key)
+            self.location[key] = 'due'
+            return
+        for level, (size, width) in enumerate(zip(self.sizes, self.widths)):
+            if expire // width - self.current // width < size:
+                slot = (expire // width) % size
+                self.wheels[level][slot].add(key)
+                self.location[key] = (level, slot)
+                return
+        self.overflow.add(key)
+        self.location[key] = None
+
+    def add(self, key, expire_tick):
+        """타이머 등록 (같은 key가 있으면 교체)"""
+        self.cancel(key)
+        self.expires[key] = expire_tick
+        self._place(key)
+
+    def cancel(self, key):
+        """타이머 취소 (없으면 무시)"""
+        if key not in self.expires:
+            return False
+        location = self.location.pop(key)
+        if location == 'due':
+            self.due.discard(key)
+        elif location is None:
+            self.overflow.discard(key)
+        else:
+            level, slot = location
+            self.wheels[level][slot].discard(key)
+        del self.expires[key]
+        return True
+
+    def _tick(self):
+        self.current += 1
+        c = self.current
+
+        # 상위 레벨부터 경계에 도달한 슬롯을 하위로 재배치
+        for level in range(len(self.sizes) - 1, 0, -1):
+            width = self.widths[level]
+            if c % width:
+                continue
+            slot = (c // width) % self.sizes[level]
+            bucket, self.wheels[level][slot] = self.wheels[level][slot], set()
+            for key in bucket:
+                self._place(key)
+
+        # 일 단위 경계마다 overflow 항목 재배치
+        if self.overflow and c % self.widths[-1] == 0:
+            pending, self.overflow = self.overflow, set()
+            for key in pending:
+                self._place(key)
+
+        bucket, self.wheels[0][c % self.sizes[0]] = self.wheels[0][c % self.sizes[0]], set()
+        for key in bucket:
+            self.location[key] = 'due'
+        self.due |= bucket
+
+    def advance_to(self, tick):
+        """
+        tick까지 진행하고 만료된 key 목록 반환 (만료된 항목은 휠에서 제거)
+        """
+        while self.current < tick:
+            if not self.expires:
+                self.current = tick  # 등록된 타이머가 없으면 바로 이동
+                break
+            self._tick()
+
+        fired = list(self.due)
+        self.due = set()
+        for key in fired:
+            del self.expires[key]
+            del self.location[key]
+        return fired
@@ -28,12 +28,16 @@ urlpatterns = [
     # 3. 대시보드 및 통계
     # ==========================================================
     path('<int:user_id>/dashboard/', views.DashboardView.as_view(), name='dashboard'),
+    path('<int:user_id>/dashboard/async/', views.dashboard_async, name='dashboard_async'),
     path('task-details/', views.TaskDetailsView.as_view(), name='task_details'),
 
     # ==========================================================
     # 4. 알림
     # ==========================================================
     path('notifications/', views.NotificationsView.as_view(), name='notifications'),
+    path('notifications/async/', views.notifications_async, name='notifications_async'),
+    path('notifications/read/', views.NotificationReadView.as_view(), name='notifications_read'),
+    path('mentions/', views.MentionsView.as_view(), name='mentions'),
 
     # ==========================================================
     # 5. 프로젝트 관리 (세션 등)
@@ -13,8 +13,8 @@ from .minutes import (
 from .reports import (
     save_report, update_report, delete_report, get_reports_by_project, export_report_docx
 )
-from .dashboard import DashboardView, TaskDetailsView
-from .notifications import NotificationsView
+from .dashboard import DashboardView, TaskDetailsView, dashboard_async
+from .notifications import NotificationsView, NotificationReadView, MentionsView, notifications_async
 from .project import (
     ProjectLogsView, FavoriteToggleView, CurrentProjectGetView, CurrentProjectSetView,
     receive_project_data, get_latest_project_id
@@ -1,9 +1,8 @@
 import json
 import os
-import boto3
+from io import BytesIO
 from botocore.exceptions import NoCredentialsError
 
-from django.conf import settings
 from django.http import JsonResponse
 from django.views import View
 from django.shortcuts import get_object_or_404
@@ -14,6 +13,8 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 
 from db_model.models import User
+from file.derivatives import generate_derivatives, variant_keys
+from file.storage import get_storage
 from users.serializers import UserSubjectSerializer
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -78,7 +79,7 @@ def get_user_name(request):
 @csrf_exempt
 def get_users_list(request):
     """전체 사용자 목록 조회"""
-    users = User.objects.all().values('user_id', 'name', 'profile_image')
+    users = User.objects.all().values('user_id', 'name', 'profile_image', 'profile_image_variants')
     return JsonResponse(list(users), safe=False, json_dumps_params={'ensure_ascii': False})
 
 @csrf_exempt
@@ -95,7 +96,8 @@ def get_user_profile(request):
             "name": user.name,
             "email": user.email,
             "skill": user.skill if user.skill else "기술스택을 입력해주세요.",
-            "profile_image": user.profile_image
+            "profile_image": user.profile_image,
+            "profile_image_variants": user.profile_image_variants or {},
         }
         return JsonResponse(data, json_dumps_params={'ensure_ascii': False})
     except User.DoesNotExist:
@@ -119,27 +121,33 @@ def upload_profile_image(request):
         file_extension = os.path.splitext(profile_image.name)[1]
         file_name = f"profile_images/user_{user_id}{file_extension}"
 
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME
-        )
-        
-        s3_client.upload_fileobj(
-            profile_image,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            file_name,
-            ExtraArgs={'ContentType': profile_image.content_type}
-        )
-
-        image_url = f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{file_name}"
+        data = profile_image.read()
+        storage = get_storage()
+        storage.save(file_name, BytesIO(data), profile_image.content_type)
+        image_url = request.build_absolute_uri(storage.public_url(file_name))
 
         user = User.objects.get(pk=user_id)
         user.profile_image = image_url
+        user.profile_image_variants = None  # 새 파생본 생성 전까지는 원본 사용
         user.save()
 
-        return JsonResponse({"message": "업로드 성공", "profile_image": image_url}, status=200)
+        # 썸네일/리사이즈본은 요청과 분리하여 생성 (URL은 규칙으로 정해지므로 미리 응답)
+        variants = {
+            variant: request.build_absolute_uri(storage.public_url(key))
+            for variant, key in variant_keys(file_name).items()
+        }
+        scheduled = generate_derivatives(
+            file_name, data,
+            on_done=lambda keys: User.objects.filter(pk=user_id, profile_image=image_url).update(
+                profile_image_variants={v: variants[v] for v in keys}
+            ),
+        )
+
+        return JsonResponse({
+            "message": "업로드 성공",
+            "profile_image": image_url,
+            "variants": variants if scheduled else {},
+        }, status=200)
 
     except Exception as e:
         return JsonResponse({"message": str(e)}, status=500)
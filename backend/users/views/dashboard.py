@@ -1,18 +1,22 @@
+import asyncio
 from datetime import date, timedelta
 from calendar import monthrange
-from django.db.models import Count, Exists, OuterRef, Max, Q
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+from django.http import JsonResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from db_model.models import (
     User, Project, ProjectMember, FavoriteProject,
-    Task, TaskManager, Schedule, Log
+    Task, TaskStatus, TaskManager, Schedule, Log
 )
+from tasks.stats import get_project_stats
+from users.cache import dashboard_cache_key, DASHBOARD_CACHE_ENABLED, DASHBOARD_TIMEOUT
+from users.db_pool import run_in_db_pool
 
-# ✅ 상태 코드 안전 처리
-DONE_STATUS_LIST = ['3', 3]
-ACTIVE_STATUS_LIST = ['0', '1', '2', 0, 1, 2]
-INCOMPLETE_STATUS_LIST = ['0', '1', 0, 1]
-FEEDBACK_STATUS_LIST = ['2', 2]
+# 상태 코드 그룹
+ACTIVE_STATUS_LIST = [TaskStatus.REQUESTED, TaskStatus.IN_PROGRESS, TaskStatus.FEEDBACK]
+INCOMPLETE_STATUS_LIST = [TaskStatus.REQUESTED, TaskStatus.IN_PROGRESS]
 URGENT_DAYS = 3
 
 def month_bounds(yyyy_mm: str | None):
@@ -30,6 +34,195 @@ def month_bounds(yyyy_mm: str | None):
     last = monthrange(first.year, first.month)[1]
     return first, date(first.year, first.month, last)
 
+# ──────────────────────────────────────────
+# 대시보드 섹션별 조회 (서로 독립적이라 비동기 뷰에서 동시에 실행 가능)
+# ──────────────────────────────────────────
+def _my_project_ids(user_id):
+    return ProjectMember.objects.filter(user_id=user_id).values('project_id')
+
+
+def _my_task_ids(user_id):
+    return TaskManager.objects.filter(user_id=user_id).values('task_id')
+
+
+def _project_task_ids(user_id):
+    """내가 참여한 프로젝트의 모든 업무 ID (서브쿼리)"""
+    return TaskManager.objects.filter(project_id__in=_my_project_ids(user_id)).values('task_id')
+
+
+def dashboard_user(user_id):
+    return User.objects.filter(pk=user_id).values('user_id', 'name').first()
+
+
+def dashboard_projects(user_id, today):
+    """프로젝트 카드 (진행률 / 진행 중 업무 / 남은 일수)"""
+    # 즐겨찾기 서브쿼리
+    fav_exists = FavoriteProject.objects.filter(
+        user_id=user_id,
+        project_id=OuterRef('project_id')
+    )
+
+    # 프로젝트 기본 정보
+    projects = list(
+        Project.objects
+        .filter(project_id__in=_my_project_ids(user_id))
+        .annotate(is_fav=Exists(fav_exists))
+        .values('project_id', 'project_name', 'is_fav')
+    )
+
+    # 프로젝트별 통계: 업무 변경 시 갱신되는 집계 테이블에서 프로젝트당 1행 조회
+    stats_by_project = get_project_stats([p['project_id'] for p in projects])
+
+    projects_payload = []
+    for p in projects:
+        pid = p['project_id']
+        stats = stats_by_project[pid]
+
+        dl = stats.last_deadline
+        if dl:
+            dldate = dl.date() if hasattr(dl, "date") else dl
+            remaining_days = (dldate - today).days
+        else:
+            remaining_days = None
+
+        projects_payload.append({
+            "project_id": pid,
+            "project_name": p['project_name'],
+            "is_favorite": bool(p['is_fav']),
+            "progress": int((stats.done_count * 100) / stats.total_count) if stats.total_count else 0,
+            "ongoing_tasks": stats.active_count,
+            "remaining_days": remaining_days,
+        })
+    return projects_payload
+
+
+def dashboard_my_task_stats(user_id, today):
+    """내 업무 통계 (전체 / 완료 / 미완료 / 긴급) - 조건부 집계 1회"""
+    urgent_end = today + timedelta(days=URGENT_DAYS)
+    return Task.objects.filter(task_id__in=_my_task_ids(user_id)).aggregate(
+        my_tasks=Count('task_id'),
+        completed_tasks=Count('task_id', filter=Q(status=TaskStatus.DONE)),
+        incomplete_tasks=Count('task_id', filter=Q(status__in=INCOMPLETE_STATUS_LIST)),
+        # 긴급 업무: 마감 D-3 이내
+        urgent_tasks=Count('task_id', filter=Q(
+            status__in=ACTIVE_STATUS_LIST,
+            end_date__date__range=(today, urgent_end),
+        )),
+    )
+
+
+def dashboard_feedback_count(user_id):
+    """피드백: 프로젝트 내 모든 업무 중 피드백 상태이면서 내가 담당자가 아닌 것"""
+    return Task.objects.filter(
+        task_id__in=_project_task_ids(user_id),
+        status=TaskStatus.FEEDBACK
+    ).exclude(task_id__in=_my_task_ids(user_id)).count()
+
+
+def dashboard_recent_logs(user_id):
+    """
+    최근 로그 (내가 참여한 프로젝트)
+    - Log.project_id로 필터링 → 업무가 없는 자동 로그 묶음 요약 행(log/compaction.py)·삭제된 업무의 로그도 포함
+    """
+    recent_logs_qs = (
+        Log.objects
+        .filter(project_id__in=_my_project_ids(user_id))
+        .select_related('user')
+        .order_by('-created_date')[:20]
+    )
+
+    return [{
+        "user_name": (log.user.name if log.user else "알 수 없음"),
+        "action": log.action,
+        "created_date": log.created_date,
+        "task_name": log.task_name,
+        "content": (log.content or ""),
+        "count": log.payload["count"] if log.payload else 1,  # 요약 행은 묶인 건수
+    } for log in recent_logs_qs]
+
+
+def dashboard_my_calendar(user_id, start_d, end_d):
+    my_calendar_qs = Schedule.objects.filter(
+        user_id=user_id,
+        start_time__range=(start_d, end_d)
+    ).values('schedule_id', 'start_time', 'title')
+
+    return [
+        {
+            "date": r['start_time'],
+            "schedule_id": r['schedule_id'],
+            "title": r['title']
+        }
+        for r in my_calendar_qs
+    ]
+
+
+def dashboard_team_calendar(user_id, start_d, end_d):
+    team_calendar_qs = Task.objects.filter(
+        task_id__in=_project_task_ids(user_id),
+        end_date__date__range=(start_d, end_d)
+    ).values('task_id', 'task_name', 'end_date')
+
+    return [
+        {
+            "date": r['end_date'],
+            "task_id": r['task_id'],
+            "task_name": r['task_name']
+        }
+        for r in team_calendar_qs
+    ]
+
+
+def assemble_dashboard(user_info, projects, my_task_stats, feedback_count,
+                       recent_logs, my_calendar, team_calendar):
+    """섹션 결과 → 대시보드 응답 (사용자가 없으면 None)"""
+    if not user_info:
+        return None
+
+    if not projects:
+        # 프로젝트가 없는 경우 빈 데이터 반환
+        return {
+            "user": user_info,
+            "projects": [],
+            "task_stats": {
+                "my_tasks": 0,
+                "completed_tasks": 0,
+                "incomplete_tasks": 0,
+                "feedback_tasks": 0,
+                "urgent_tasks": 0,
+            },
+            "recent_logs": [],
+            "calendar": {"my": [], "team": []}
+        }
+
+    return {
+        "user": user_info,
+        "projects": projects,
+        "task_stats": {
+            "my_tasks": my_task_stats['my_tasks'],
+            "completed_tasks": my_task_stats['completed_tasks'],
+            "incomplete_tasks": my_task_stats['incomplete_tasks'],
+            "feedback_tasks": feedback_count,
+            "urgent_tasks": my_task_stats['urgent_tasks'],
+        },
+        "recent_logs": recent_logs,
+        "calendar": {"my": my_calendar, "team": team_calendar}
+    }
+
+
+def build_dashboard(user_id, start_d, end_d, today):
+    """대시보드 응답 데이터 조립 - 순차 실행 (사용자가 없으면 None)"""
+    return assemble_dashboard(
+        dashboard_user(user_id),
+        dashboard_projects(user_id, today),
+        dashboard_my_task_stats(user_id, today),
+        dashboard_feedback_count(user_id),
+        dashboard_recent_logs(user_id),
+        dashboard_my_calendar(user_id, start_d, end_d),
+        dashboard_team_calendar(user_id, start_d, end_d),
+    )
+
+
 class DashboardView(APIView):
     """
     사용자 대시보드 데이터 제공
@@ -47,206 +240,50 @@ class DashboardView(APIView):
         start_d, end_d = month_bounds(month)
         today = date.today()
 
-        # User 확인
-        user_info = User.objects.filter(pk=user_id).values('user_id', 'name').first()
-        if not user_info:
-            return Response({"detail": "User not found"}, status=404)
-
-        # 1. 프로젝트 데이터 조회
-        project_ids = list(
-            ProjectMember.objects
-            .filter(user_id=user_id)
-            .values_list('project_id', flat=True)
-        )
-        
-        if not project_ids:
-            # 프로젝트가 없는 경우 빈 데이터 반환
-            return Response({
-                "user": user_info,
-                "projects": [],
-                "task_stats": {
-                    "my_tasks": 0,
-                    "completed_tasks": 0,
-                    "incomplete_tasks": 0,
-                    "feedback_tasks": 0,
-                    "urgent_tasks": 0,
-                },
-                "recent_logs": [],
-                "calendar": {"my": [], "team": []}
-            })
-
-        # 즐겨찾기 서브쿼리
-        fav_exists = FavoriteProject.objects.filter(
-            user_id=user_id, 
-            project_id=OuterRef('project_id')
-        )
-        
-        # 프로젝트 기본 정보
-        projects_qs = (
-            Project.objects
-            .filter(project_id__in=project_ids)
-            .annotate(is_fav=Exists(fav_exists))
-            .values('project_id', 'project_name', 'is_fav')
-        )
-
-        # ✅ [개선됨] 프로젝트별 통계를 한 번에 조회
-        total_by_project = dict(
-            TaskManager.objects
-            .filter(project_id__in=project_ids)
-            .values('project_id')
-            .annotate(cnt=Count('task', distinct=True))
-            .values_list('project_id', 'cnt')
-        )
-        
-        done_by_project = dict(
-            TaskManager.objects
-            .filter(project_id__in=project_ids, task__status__in=DONE_STATUS_LIST)
-            .values('project_id')
-            .annotate(cnt=Count('task', distinct=True))
-            .values_list('project_id', 'cnt')
-        )
-
-        active_by_project = dict(
-            TaskManager.objects
-            .filter(project_id__in=project_ids, task__status__in=ACTIVE_STATUS_LIST)
-            .values('project_id')
-            .annotate(cnt=Count('task', distinct=True))
-            .values_list('project_id', 'cnt')
-        )
+        # (사용자, 월) 캐시: 관련 데이터 변경 시 시그널로 버전이 바뀌어 자동 무효화 (공유 캐시일 때만)
+        cache_key = dashboard_cache_key(user_id, start_d, today) if DASHBOARD_CACHE_ENABLED else None
+        payload = cache.get(cache_key) if cache_key else None
+        if payload is None:
+            payload = build_dashboard(user_id, start_d, end_d, today)
+            if payload is None:
+                return Response({"detail": "User not found"}, status=404)
+            if cache_key:
+                cache.set(cache_key, payload, DASHBOARD_TIMEOUT)
 
-        deadline_by_project = dict(
-            TaskManager.objects
-            .filter(project_id__in=project_ids)
-            .values('project_id')
-            .annotate(deadline=Max('task__end_date'))
-            .values_list('project_id', 'deadline')
-        )
+        return Response(payload)
 
-        # 프로젝트 데이터 조립
-        projects_payload = []
-        for p in projects_qs:
-            pid = p['project_id']
-            total = total_by_project.get(pid, 0)
-            done = done_by_project.get(pid, 0)
-            progress = int((done * 100) / total) if total else 0
-            ongoing = active_by_project.get(pid, 0)
-
-            dl = deadline_by_project.get(pid)
-            if dl:
-                dldate = dl.date() if hasattr(dl, "date") else dl
-                remaining_days = (dldate - today).days
-            else:
-                remaining_days = None
-
-            projects_payload.append({
-                "project_id": pid,
-                "project_name": p['project_name'],
-                "is_favorite": bool(p['is_fav']),
-                "progress": progress,
-                "ongoing_tasks": ongoing,
-                "remaining_days": remaining_days,
-            })
 
-        # 2. 내 업무 통계
-        my_task_ids = list(
-            TaskManager.objects
-            .filter(user_id=user_id)
-            .values_list('task_id', flat=True)
-        )
+async def dashboard_async(request, user_id: int):
+    """
+    DashboardView의 비동기 버전
+    - 섹션별 쿼리를 DB 전용 스레드 풀에서 동시에 실행 (응답 시간 ≈ 가장 느린 쿼리)
+    """
+    session_uid = await request.session.aget("user_id")
+    if not session_uid:
+        return JsonResponse({"detail": "로그인이 필요합니다."}, status=401)
 
-        if my_task_ids:
-            my_tasks_count = Task.objects.filter(task_id__in=my_task_ids).count()
-            completed_count = Task.objects.filter(
-                task_id__in=my_task_ids, 
-                status__in=DONE_STATUS_LIST
-            ).count()
-            incomplete_count = Task.objects.filter(
-                task_id__in=my_task_ids, 
-                status__in=INCOMPLETE_STATUS_LIST
-            ).count()
-        else:
-            my_tasks_count = completed_count = incomplete_count = 0
+    start_d, end_d = month_bounds(request.GET.get('month'))
+    today = date.today()
 
-        # 피드백: 프로젝트 내 모든 업무 중 피드백 상태이면서 내가 담당자가 아닌 것
-        all_project_task_ids = list(
-            TaskManager.objects
-            .filter(project_id__in=project_ids)
-            .values_list('task_id', flat=True)
+    cache_key = await run_in_db_pool(dashboard_cache_key, user_id, start_d, today) if DASHBOARD_CACHE_ENABLED else None
+    payload = await cache.aget(cache_key) if cache_key else None
+    if payload is None:
+        sections = await asyncio.gather(
+            run_in_db_pool(dashboard_user, user_id),
+            run_in_db_pool(dashboard_projects, user_id, today),
+            run_in_db_pool(dashboard_my_task_stats, user_id, today),
+            run_in_db_pool(dashboard_feedback_count, user_id),
+            run_in_db_pool(dashboard_recent_logs, user_id),
+            run_in_db_pool(dashboard_my_calendar, user_id, start_d, end_d),
+            run_in_db_pool(dashboard_team_calendar, user_id, start_d, end_d),
         )
-        
-        feedback_count = Task.objects.filter(
-            task_id__in=all_project_task_ids,
-            status__in=FEEDBACK_STATUS_LIST
-        ).exclude(task_id__in=my_task_ids).count()
+        payload = assemble_dashboard(*sections)
+        if payload is None:
+            return JsonResponse({"detail": "User not found"}, status=404)
+        if cache_key:
+            await cache.aset(cache_key, payload, DASHBOARD_TIMEOUT)
 
-        # 긴급 업무: 마감 D-3 이내
-        urgent_end = today + timedelta(days=URGENT_DAYS)
-        urgent_count = Task.objects.filter(
-            task_id__in=my_task_ids,
-            status__in=ACTIVE_STATUS_LIST,
-            end_date__date__range=(today, urgent_end)
-        ).count()
-
-        task_stats = {
-            "my_tasks": my_tasks_count,
-            "completed_tasks": completed_count,
-            "incomplete_tasks": incomplete_count,
-            "feedback_tasks": feedback_count,
-            "urgent_tasks": urgent_count,
-        }
-
-        # 3. 최근 로그 (프로젝트별로 필터링)
-        recent_logs_qs = (
-            Log.objects
-            .filter(task_id__in=all_project_task_ids)
-            .select_related('user', 'task')
-            .order_by('-created_date')[:20]
-        )
-        
-        recent_logs = [{
-            "user_name": (log.user.name if log.user else "알 수 없음"),
-            "action": log.action,
-            "created_date": log.created_date,
-            "task_name": (log.task.task_name if log.task else None),
-            "content": (log.content or "")
-        } for log in recent_logs_qs]
-
-        # 4. 캘린더 데이터
-        my_calendar_qs = Schedule.objects.filter(
-            user_id=user_id, 
-            start_time__range=(start_d, end_d)
-        ).values('schedule_id', 'start_time', 'title')
-        
-        my_calendar = [
-            {
-                "date": r['start_time'], 
-                "schedule_id": r['schedule_id'], 
-                "title": r['title']
-            } 
-            for r in my_calendar_qs
-        ]
-
-        team_calendar_qs = Task.objects.filter(
-            task_id__in=all_project_task_ids, 
-            end_date__date__range=(start_d, end_d)
-        ).values('task_id', 'task_name', 'end_date')
-        
-        team_calendar = [
-            {
-                "date": r['end_date'], 
-                "task_id": r['task_id'], 
-                "task_name": r['task_name']
-            } 
-            for r in team_calendar_qs
-        ]
-
-        return Response({
-            "user": user_info,
-            "projects": projects_payload,
-            "task_stats": task_stats,
-            "recent_logs": recent_logs,
-            "calendar": {"my": my_calendar, "team": team_calendar}
-        })
+    return JsonResponse(payload)
 
 
 class TaskDetailsView(APIView):
@@ -283,9 +320,9 @@ class TaskDetailsView(APIView):
         elif t == 'incomplete':
             qs = qs.filter(status__in=INCOMPLETE_STATUS_LIST)
         elif t == 'feedback':
-            qs = qs.filter(status__in=FEEDBACK_STATUS_LIST)
+            qs = qs.filter(status=TaskStatus.FEEDBACK)
         elif t == 'completed':
-            qs = qs.filter(status__in=DONE_STATUS_LIST)
+            qs = qs.filter(status=TaskStatus.DONE)
         elif t == 'urgent':
             today = date.today()
             urgent_end = today + timedelta(days=URGENT_DAYS)
@@ -1,149 +1,143 @@
-from datetime import date, timedelta
-from django.db.models import Q
+import asyncio
+from datetime import timedelta
+from django.http import JsonResponse
 from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
-from db_model.models import (
-    User, Project, ProjectMember,
-    Task, TaskManager,
-    Comment, DirectMessage, DirectMessageRoom, Message
-)
+from db_model.models import User, Project, ProjectMember, NotificationKind
+from users.db_pool import run_in_db_pool
+from users.inbox import inbox_page, unread_count, mark_read, PAGE_SIZE
+from users.mentions import mention_feed, mention_count
+from users.pagination import decode_cursor
+
+
+def header_info(uid, cur_pid):
+    """full=1 요청용 헤더 정보 (내 정보 / 현재 프로젝트 / 내 프로젝트 목록)"""
+    me = User.objects.filter(user_id=uid).values("user_id", "name", "profile_image").first()
+
+    current_project = None
+    if cur_pid:
+        current_project = Project.objects.filter(project_id=cur_pid).values("project_id", "project_name").first()
+
+    my_projects = list(
+        Project.objects
+        .filter(project_id__in=ProjectMember.objects.filter(user_id=uid).values("project_id"))
+        .values("project_id", "project_name")
+    )
+    return {"user": me, "current_project": current_project, "my_projects": my_projects}
+
+
+def _inbox_options(params):
+    """쿼리 파라미터 → inbox_page 옵션 (형식 오류 시 ValueError)"""
+    return {
+        "before": params.get("before") or None,
+        "limit": int(params.get("limit") or PAGE_SIZE),
+        # 멘션 모드: 멘션 알림만
+        "kinds": [NotificationKind.MENTION] if params.get("mode") == "mentions" else None,
+        "unread_only": params.get("unread") == "1",
+    }
 
-# 문자열/숫자 모두 대응
-ACTIVE_STATUS_LIST = ['1', '2', 1, 2]
-URGENT_DAYS = 3
 
 class NotificationsView(APIView):
+    """
+    알림함 조회 (최신순, before 커서로 다음 페이지)
+    - mode=mentions: 멘션만 / unread=1: 안 읽은 것만 / full=1: 헤더 정보 포함
+    """
     def get(self, request):
         uid = request.session.get("user_id")
         if not uid:
             return Response({"detail": "로그인이 필요합니다."}, status=401)
         uid = int(uid)
 
-        today = date.today()
-        urgent_end = today + timedelta(days=URGENT_DAYS)
-        recent_since_dt = timezone.now() - timedelta(days=7)
-
-        # 1. 내가 맡은 task id
-        my_task_ids = list(TaskManager.objects.filter(user_id=uid).values_list("task_id", flat=True))
-
-        # 매핑 정보 미리 조회 (최적화)
-        tm_rows = TaskManager.objects.filter(task_id__in=my_task_ids).values("task_id", "project_id", "project__project_name")
-        task_info_map = {
-            r["task_id"]: {"pid": r["project_id"], "pname": r["project__project_name"]} 
-            for r in tm_rows
-        }
-
-        # (1) 긴급 업무
-        urgent_qs = Task.objects.filter(
-            task_id__in=my_task_ids,
-            status__in=ACTIVE_STATUS_LIST,
-            end_date__date__range=(today, urgent_end),
-        ).values("task_id", "task_name", "end_date", "status")
-
-        urgent_items = []
-        for r in urgent_qs:
-            tid = r["task_id"]
-            info = task_info_map.get(tid, {})
-            urgent_items.append({
-                "type": "urgent_task",
-                "id": tid,
-                "title": r["task_name"],
-                "due": r["end_date"],
-                "status_code": r["status"],
-                "created_at": r["end_date"],
-                "project_id": info.get("pid"),
-                "project_name": info.get("pname"),
-            })
-
-        # (2) 내 업무의 최근 댓글
-        comment_qs = (Comment.objects
-            .filter(task_id__in=my_task_ids, created_date__gte=recent_since_dt)
-            .exclude(user_id=uid)
-            .select_related("user", "task")
-            .order_by("-created_date")[:30])
-
-        comment_items = []
-        for c in comment_qs:
-            tid = c.task.task_id if c.task else None
-            info = task_info_map.get(tid, {})
-            comment_items.append({
-                "type": "comment",
-                "id": c.comment_id,
-                "task_id": tid,
-                "task_name": c.task.task_name if c.task else None,
-                "author_name": c.user.name if c.user else "알 수 없음",
-                "content": c.content,
-                "created_at": c.created_date,
-                "project_id": info.get("pid"),
-                "project_name": info.get("pname"),
-            })
-
-        # (3) DM (최근 7일)
-        room_ids = DirectMessageRoom.objects.filter(Q(user1_id=uid) | Q(user2_id=uid)).values_list("room_id", flat=True)
-        dm_qs = (DirectMessage.objects
-                .filter(room_id__in=room_ids, created_date__gte=recent_since_dt)
-                .exclude(user_id=uid)
-                .select_related("user", "room")
-                .order_by("-created_date")[:30])
-
-        dm_items = [{
-            "type": "dm",
-            "id": dm.message_id,
-            "room_id": dm.room.room_id,
-            "from_name": dm.user.name if dm.user else "알 수 없음",
-            "content": dm.content,
-            "created_at": dm.created_date,
-        } for dm in dm_qs]
-
-        # (4) 그룹 메시지
-        my_project_ids = list(ProjectMember.objects.filter(user_id=uid).values_list("project_id", flat=True))
-        
-        msg_filter = Q(project_id__in=my_project_ids, created_date__gte=recent_since_dt) & ~Q(user_id=uid)
-        
-        # 멘션 모드 확인
-        mode = request.query_params.get("mode")
-        if mode == "mentions":
-            me_name = User.objects.filter(pk=uid).values_list('name', flat=True).first() or ""
-            msg_filter &= (Q(content__icontains=f"@{me_name}") | Q(content__icontains=f"@{uid}"))
-
-        group_msg_qs = (Message.objects
-            .filter(msg_filter)
-            .select_related("user", "project")
-            .order_by("-created_date")[:50])
-
-        group_msg_items = [{
-            "type": "group_message",
-            "id": m.message_id,
-            "project_id": m.project.project_id if m.project else None,
-            "project_name": m.project.project_name if m.project else None,
-            "from_name": m.user.name if m.user else "알 수 없음",
-            "content": m.content,
-            "created_at": m.created_date,
-        } for m in group_msg_qs]
-
-        # 통합 + 정렬
-        items = urgent_items + comment_items + dm_items + group_msg_items
-        items.sort(key=lambda x: x["created_at"] or timezone.now(), reverse=True)
-        items = items[:30]
+        try:
+            items, next_cursor = inbox_page(uid, **_inbox_options(request.query_params))
+        except ValueError:
+            return Response({"detail": "잘못된 커서 또는 limit 값입니다."}, status=400)
+        unread = unread_count(uid)
 
         # full=1 요청 처리 (헤더용)
         if request.query_params.get("full") == "1":
-            me = User.objects.filter(user_id=uid).values("user_id", "name", "profile_image").first()
-            
-            current_project = None
-            cur_pid = request.session.get("current_project_id")
-            if cur_pid:
-                current_project = Project.objects.filter(project_id=cur_pid).values("project_id", "project_name").first()
-            
-            my_projects = list(Project.objects.filter(project_id__in=my_project_ids).values("project_id", "project_name"))
-            
-            return Response({
-                "user": me,
-                "current_project": current_project,
-                "my_projects": my_projects,
-                "notifications": items,
-            })
-
-        return Response({"items": items})
\ No newline at end of file
+            header = header_info(uid, request.session.get("current_project_id"))
+            return Response({**header, "notifications": items, "unread_count": unread, "next_cursor": next_cursor})
+
+        return Response({"items": items, "unread_count": unread, "next_cursor": next_cursor})
+
+
+class NotificationReadView(APIView):
+    """알림 읽음 처리 (ids 미지정 시 전체)"""
+    def post(self, request):
+        uid = request.session.get("user_id")
+        if not uid:
+            return Response({"detail": "로그인이 필요합니다."}, status=401)
+        uid = int(uid)
+
+        ids = request.data.get("ids")
+        if ids is not None:
+            try:
+                ids = [int(i) for i in ids]
+            except (TypeError, ValueError):
+                return Response({"detail": "ids는 정수 목록이어야 합니다."}, status=400)
+
+        updated = mark_read(uid, ids)
+        return Response({"updated": updated, "unread_count": unread_count(uid)})
+
+
+class MentionsView(APIView):
+    """
+    나를 멘션한 메시지·댓글 목록 (최신순, before 커서로 다음 페이지)
+    - days=N: 최근 N일만 (목록·개수 모두 적용)
+    """
+    def get(self, request):
+        uid = request.session.get("user_id")
+        if not uid:
+            return Response({"detail": "로그인이 필요합니다."}, status=401)
+        uid = int(uid)
+
+        try:
+            days = request.query_params.get("days")
+            since = timezone.now() - timedelta(days=int(days)) if days else None
+            items, next_cursor = mention_feed(
+                uid,
+                before=request.query_params.get("before") or None,
+                limit=int(request.query_params.get("limit") or PAGE_SIZE),
+                since=since,
+            )
+        except ValueError:
+            return Response({"detail": "잘못된 커서, limit 또는 days 값입니다."}, status=400)
+
+        return Response({"items": items, "count": mention_count(uid, since), "next_cursor": next_cursor})
+
+
+async def notifications_async(request):
+    """
+    NotificationsView의 비동기 버전
+    - 알림 목록 / 안 읽은 수 / 헤더 정보를 DB 전용 스레드 풀에서 동시에 조회
+    """
+    uid = await request.session.aget("user_id")
+    if not uid:
+        return JsonResponse({"detail": "로그인이 필요합니다."}, status=401)
+    uid = int(uid)
+
+    try:
+        options = _inbox_options(request.GET)
+        if options["before"]:
+            decode_cursor(options["before"])
+    except ValueError:
+        return JsonResponse({"detail": "잘못된 커서 또는 limit 값입니다."}, status=400)
+
+    full = request.GET.get("full") == "1"
+    jobs = [
+        run_in_db_pool(inbox_page, uid, **options),
+        run_in_db_pool(unread_count, uid),
+    ]
+    if full:
+        cur_pid = await request.session.aget("current_project_id")
+        jobs.append(run_in_db_pool(header_info, uid, cur_pid))
+
+    results = await asyncio.gather(*jobs)
+    (items, next_cursor), unread = results[0], results[1]
+
+    if full:
+        return JsonResponse({**results[2], "notifications": items, "unread_count": unread, "next_cursor": next_cursor})
+    return JsonResponse({"items": items, "unread_count": unread, "next_cursor": next_cursor})
@@ -4,8 +4,8 @@ from django.http import JsonResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
-from db_model.models import Log, TaskManager, Project, FavoriteProject, ProjectMember
+from db_model.models import Project, FavoriteProject, ProjectMember
+from log.views import project_log_page
 
 MAX_FAVORITES = 3
 
@@ -46,22 +46,25 @@ class ProjectLogsView(APIView):
         if not is_member:
             return Response({"detail": "권한이 없습니다."}, status=403)
 
-        task_ids = TaskManager.objects.filter(project_id=project_id).values_list('task_id', flat=True)
-        logs_qs = (
-            Log.objects
-              .filter(Q(task_id__in=task_ids))
-              .select_related('user', 'task')
-              .order_by('-created_date')[:50]
-        )
+        try:
+            rows, next_cursor = project_log_page(
+                project_id,
+                before=request.query_params.get("before"),
+                limit=request.query_params.get("limit", 50),
+            )
+        except ValueError:
+            return Response({"detail": "잘못된 커서 또는 limit 값입니다."}, status=400)
 
         data = [{
+            "log_id":       log.log_id,
             "user_name":    (log.user.name if log.user else "알 수 없음"),
             "action":       log.action,
             "created_date": log.created_date,
-            "task_name":    (log.task.task_name if log.task else None),
-            "content":      (log.content or "")
-        } for log in logs_qs]
-        return Response(data)
+            "task_name":    log.task_name,
+            "content":      (log.content or ""),
+            "count":        (log.payload["count"] if log.payload else 1),
+        } for log in rows]
+        return Response({"items": data, "next_cursor": next_cursor})
 
 class FavoriteToggleView(APIView):
     def post(self, request, user_id: int, project_id: int):
@@ -0,0 +1,85 @@
+import axios from "axios";
+import api from "./axios";
+
+// 이 크기 이상이면 분할 업로드 사용
+export const MULTIPART_THRESHOLD = 32 * 1024 * 1024;
+const CONCURRENCY = 4;   // 동시에 올리는 조각 수
+const MAX_RETRIES = 3;   // 조각별 재시도 횟수
+
+// 같은 파일을 다시 올리면 이어서 업로드하도록 upload_id 보관
+const storageKey = (file, taskId) =>
+  `multipart:${taskId}:${file.name}:${file.size}:${file.lastModified}`;
+
+const putPart = async (url, blob) => {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      // 조각은 저장소(S3 / 로컬)로 직접 PUT, 세션 쿠키 불필요
+      const res = await axios.put(url, blob, { withCredentials: false });
+      return res.headers.etag;
+    } catch (err) {
+      if (attempt >= MAX_RETRIES) throw err;
+      await new Promise((r) => setTimeout(r, 1000 * attempt));
+    }
+  }
+};
+
+/**
+ * 대용량 파일 분할 업로드 (시작 → 조각 병렬 업로드 → 완료)
+ * 중간에 실패해도 다시 호출하면 완료된 조각은 건너뜀
+ * @returns save-meta와 같은 File 응답
+ */
+export async function uploadMultipart(file, taskId, onProgress) {
+  const key = storageKey(file, taskId);
+  let status = null;
+
+  const savedId = localStorage.getItem(key);
+  if (savedId) {
+    try {
+      status = (await api.get(`/api/files/multipart/${savedId}/`)).data;
+    } catch {
+      localStorage.removeItem(key); // 만료/취소된 업로드 → 새로 시작
+    }
+  }
+  if (!status) {
+    status = (
+      await api.post("/api/files/multipart/", {
+        file_name: file.name,
+        file_type: file.type,
+        task: taskId,
+        size: file.size,
+      })
+    ).data;
+    localStorage.setItem(key, status.upload_id);
+  }
+
+  const { upload_id, part_size, part_count } = status;
+  const done = new Set(status.completed_parts.map((p) => p.part_number));
+  const pending = [];
+  for (let n = 1; n <= part_count; n++) if (!done.has(n)) pending.push(n);
+
+  let uploaded = done.size;
+  onProgress?.(uploaded / part_count);
+
+  const { data } = await api.post(`/api/files/multipart/${upload_id}/parts/`, {
+    part_numbers: pending,
+  });
+
+  const worker = async () => {
+    while (pending.length) {
+      const n = pending.shift();
+      const blob = file.slice((n - 1) * part_size, n * part_size);
+      const etag = await putPart(data.urls[n], blob);
+      await api.post(`/api/files/multipart/${upload_id}/parts/${n}/`, {
+        etag,
+        size: blob.size,
+      });
+      uploaded += 1;
+      onProgress?.(uploaded / part_count);
+    }
+  };
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+
+  const res = await api.post(`/api/files/multipart/${upload_id}/complete/`);
+  localStorage.removeItem(key);
+  return res.data;
+}
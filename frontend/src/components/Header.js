@@ -113,13 +113,29 @@ function Header({ nameInitials, currentDateTime }) {
 
         // notifications
         setNotifications(Array.isArray(data.notifications) ? data.notifications : []);
-        setHasNotifications((data.notifications?.length || 0) > 0);
+        setHasNotifications((data.unread_count || 0) > 0);
       } catch (e) {
         console.error("🚨 초기 데이터 로드 실패:", e);
       }
     })();
   }, []);
 
+  // ✅ 새 알림 실시간 수신 (WebSocket)
+  useEffect(() => {
+    const ws = new WebSocket("ws://127.0.0.1:8000/chat/ws/notifications/");
+    ws.onerror = (error) => console.error("🚨 알림 WebSocket 오류:", error);
+    ws.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      if (data.type === "unread_count") {
+        setHasNotifications(data.unread_count > 0);
+      } else if (data.type === "notifications" && Array.isArray(data.items)) {
+        setNotifications((prev) => [...data.items, ...prev].slice(0, 30));
+        setHasNotifications(true);
+      }
+    };
+    return () => ws.close();
+  }, []);
+
 
   // 한글 정렬(숫자 시작은 뒤로)
   const sortKorean = (a, b) => {
@@ -223,11 +239,24 @@ function Header({ nameInitials, currentDateTime }) {
       .catch(err => console.error("🚨 알림을 불러오지 못했습니다.", err));
   };
 
+  // 알림 전체 읽음 처리
+  const markNotificationsRead = () => {
+    fetch("http://127.0.0.1:8000/api/users/notifications/read/", {
+      method: "POST",
+      credentials: "include",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({}),
+    }).catch(err => console.error("🚨 알림 읽음 처리 실패", err));
+  };
+
   // 벨 클릭
   const onClickBell = () => {
     const next = !showNotifPanel;
     setShowNotifPanel(next);
-    if (next) setHasNotifications(false);
+    if (next && hasNotifications) {
+      setHasNotifications(false);
+      markNotificationsRead();
+    }
   };
 
   // 패널 바깥 클릭 시 닫기
@@ -470,17 +499,19 @@ function Header({ nameInitials, currentDateTime }) {
                       </div>
                     </li>
                   );
-                } else if (n.type === "group_message") {
+                } else if (n.type === "group_message" || n.type === "mention") {
                   return (
                     <li
-                      key={`g-${n.id}`}
+                      key={`g-${n.notification_id ?? n.id}`}
                       className="notif-item group"
                       onMouseDown={(e) => {
                         e.preventDefault();
-                        openProjectChat(n.project_id, n.project_name);
+                        // 댓글 멘션은 업무 화면, 채팅 멘션은 프로젝트 채팅으로 이동
+                        if (n.task_id) openProject(n.project_id);
+                        else openProjectChat(n.project_id, n.project_name);
                       }}
                     >
-                      <span className="notif-badge">그룹</span>
+                      <span className="notif-badge">{n.type === "mention" ? "멘션" : "그룹"}</span>
                       <div className="notif-text">
                         <div className="notif-title">#{n.project_name}</div>
                         <div className="notif-sub">{n.from_name}: {n.content}</div>
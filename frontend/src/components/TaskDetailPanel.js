@@ -1,6 +1,7 @@
 /* eslint-disable */
 import React, { useEffect, useState } from "react";
 import axios from "axios";
+import { uploadMultipart, MULTIPART_THRESHOLD } from "../api/multipartUpload";
 import "./TaskDetailPanel.css";
 
 // axios 전역 기본 설정: 모든 요청에 쿠키(세션 정보)를 전송
@@ -178,13 +179,52 @@ function TaskDetailPanel({ task, projectId, onClose, onUpdate,  fetchTasks  }) {
     const file = selectedFile;
   
     try {
-      // 1. presigned URL 요청
+      // 0. 대용량 파일은 분할 업로드 (조각 병렬 전송, 실패 시 이어 올리기)
+      if (file.size >= MULTIPART_THRESHOLD) {
+        const meta = await uploadMultipart(file, currentTaskId);
+        setComments(prev => [...prev, {
+          type:      "file",
+          id:        meta.file_id,
+          file_name: meta.file_name,
+          author:    meta.author || "알 수 없음",
+          created_date: new Date(meta.created_date),
+        }]);
+        setSelectedFile(null);
+        return;
+      }
+
+      // 1. presigned URL 요청 (내용 해시를 함께 보내 같은 파일이 이미 있으면 업로드 생략)
+      const digest = await crypto.subtle.digest("SHA-256", await file.arrayBuffer());
+      const sha256 = Array.from(new Uint8Array(digest))
+        .map((b) => b.toString(16).padStart(2, "0"))
+        .join("");
       const presignedRes = await axios.get("http://127.0.0.1:8000/api/files/", {
         params: {
           file_name: file.name,
           file_type: file.type,
+          sha256,
+          size: file.size,
         },
       });
+
+      if (presignedRes.data.exists) {
+        const metaRes = await axios.post("http://127.0.0.1:8000/api/save-file-meta/", {
+          task: currentTaskId,
+          file_name: file.name,
+          user: userId,
+          content_hash: sha256,
+          size: file.size,
+        });
+        setComments(prev => [...prev, {
+          type:      "file",
+          id:        metaRes.data.file_id,
+          file_name: metaRes.data.file_name,
+          author:    metaRes.data.author || "알 수 없음",
+          created_date: new Date(metaRes.data.created_date),
+        }]);
+        setSelectedFile(null);
+        return;
+      }
   
       const { url, fields } = presignedRes.data.data;
   
@@ -215,7 +255,10 @@ function TaskDetailPanel({ task, projectId, onClose, onUpdate,  fetchTasks  }) {
         const fileMeta = {
           task : currentTaskId,   // 🔹 숫자 PK만 전달, key 이름은 "task"
           file_name: file.name,
-          user: userId            // 세션 인증이면 생략 가능
+          user: userId,           // 세션 인증이면 생략 가능
+          content_hash: sha256,
+          size: file.size,
+          upload_token: presignedRes.data.upload_token, // 서버가 업로드된 내용을 해시로 검증
         };
 
         const metaRes = await axios.post(
@@ -151,7 +151,7 @@ function MainPage({ userId, userName }) {
     try {
       // ✅ api 모듈 사용
       const response = await api.get(`/api/projects/${projectId}/logs/`);
-      setProjectLogs(response.data);
+      setProjectLogs(response.data?.items ?? []);
     } catch (error) {
       console.error('Error fetching project logs:', error);
     }
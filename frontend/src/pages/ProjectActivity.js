@@ -10,6 +10,7 @@ function ProjectActivity() {
   const { projectId } = useParams();
   const [search, setSearch] = useState("");
   const [logs, setLogs] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
 
   // ✅ 유저 캐시: byId, byName 두 가지 키로 조회 가능
   const [userCache, setUserCache] = useState({
@@ -47,11 +48,20 @@ function ProjectActivity() {
   /* ────────────────────────────────
      1) 프로젝트 로그 가져오기
   ────────────────────────────────*/
-  useEffect(() => {
+  const fetchLogs = (before = null) =>
     axios
-      .get(`http://127.0.0.1:8000/api/projects/${projectId}/logs/`)
-      .then((res) => setLogs(res.data))
+      .get(`http://127.0.0.1:8000/api/projects/${projectId}/logs/`, {
+        params: before ? { before } : {},
+      })
+      .then((res) => {
+        const items = res.data?.items ?? [];
+        setLogs((prev) => (before ? [...prev, ...items] : items));
+        setNextCursor(res.data?.next_cursor ?? null);
+      })
       .catch((err) => console.error("로그 불러오기 실패:", err));
+
+  useEffect(() => {
+    fetchLogs();
   }, [projectId]);
 
   /* ────────────────────────────────
@@ -65,7 +75,8 @@ function ProjectActivity() {
         const byName = {};
         (res.data || []).forEach((u) => {
           const uid = String(u.user_id);
-          const img = toAbs(u.profile_image);
+          // 48px 아바타이므로 썸네일 파생본 우선 (생성 전이면 원본)
+          const img = toAbs(u.profile_image_variants?.["thumb.webp"] || u.profile_image);
           byId[uid] = { name: u.name, profile_image: img };
           if (u.name) byName[u.name.trim()] = { user_id: uid, profile_image: img };
         });
@@ -202,6 +213,13 @@ function ProjectActivity() {
               );
             })}
           </div>
+
+          {/* 이전 로그 더 보기 (커서 기반) */}
+          {nextCursor && (
+            <button className="ActivityMore" onClick={() => fetchLogs(nextCursor)}>
+              이전 활동 더 보기
+            </button>
+          )}
         </div>
       </div>
     </div>